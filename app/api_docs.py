@@ -1,8 +1,12 @@
 """
 API documentation and OpenAPI schema configuration
 """
+from fastapi import Request, Response
 from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
 from typing import Dict
+import gzip
+import orjson
 
 def custom_openapi(app) -> Dict:
     """Generate custom OpenAPI schema for the application"""
@@ -88,4 +92,45 @@ def custom_openapi(app) -> Dict:
     ]
 
     app.openapi_schema = openapi_schema
-    return app.openapi_schema
\ No newline at end of file
+    # Serialize (and compress) once so /openapi.json can serve the cached bytes as-is
+    app.state.openapi_bytes = orjson.dumps(openapi_schema)
+    app.state.openapi_gz = gzip.compress(app.state.openapi_bytes, compresslevel=6)
+    return app.openapi_schema
+
+
+def get_openapi_bytes(app) -> bytes:
+    """Return the serialized OpenAPI schema, building it on first use"""
+    if getattr(app.state, "openapi_bytes", None) is None:
+        app.openapi_schema = None
+        custom_openapi(app)
+    return app.state.openapi_bytes
+
+
+def setup_openapi(app) -> None:
+    """
+    Install the custom OpenAPI schema and serve it from a cached byte buffer
+    instead of re-encoding the schema dict on every request
+    """
+    app.openapi = lambda: custom_openapi(app)
+
+    async def openapi_json(request: Request) -> Response:
+        body = get_openapi_bytes(app)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(
+                app.state.openapi_gz,
+                media_type="application/json",
+                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+            )
+        return Response(body, media_type="application/json")
+
+    if not app.openapi_url:
+        return
+
+    # Swap FastAPI's built-in handler in place so docs/redoc keep pointing at it
+    route = APIRoute(app.openapi_url, openapi_json, include_in_schema=False)
+    for i, existing in enumerate(app.router.routes):
+        if getattr(existing, "path", None) == app.openapi_url:
+            app.router.routes[i] = route
+            break
+    else:
+        app.router.routes.append(route)
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""
+Process bootstrap: load the .env file exactly once per process
+"""
+import os
+
+
+def init_env():
+    """
+    Load .env into os.environ. Safe to call from every entrypoint; only the
+    first call (per process tree) touches the disk.
+    """
+    if os.environ.get("_ENV_LOADED"):
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    os.environ["_ENV_LOADED"] = "1"
@@ -0,0 +1,26 @@
+"""
+SQLAlchemy session module
+
+Re-exports the engines and session dependencies from `db.database`.
+"""
+from db.database import (
+    Base,
+    engine,
+    SessionLocal,
+    get_db,
+    get_async_engine,
+    get_async_sessionmaker,
+    get_async_db,
+    warm_async_engine
+)
+
+__all__ = [
+    'Base',
+    'engine',
+    'SessionLocal',
+    'get_db',
+    'get_async_engine',
+    'get_async_sessionmaker',
+    'get_async_db',
+    'warm_async_engine'
+]
@@ -1,22 +1,61 @@
 """
 Error handling middleware
 """
+import asyncio
+import logging
 from fastapi import Request
 from fastapi.responses import JSONResponse
 import traceback
 
+logger = logging.getLogger("app.errors")
+
+# Bounded so an error storm can't grow memory without limit
+ERROR_QUEUE_SIZE = 1000
+
+async def _drain(queue: asyncio.Queue):
+    """Write queued tracebacks to the error logger outside the request path"""
+    while True:
+        formatted, path = await queue.get()
+        try:
+            logger.error("Unhandled error on %s\n%s", path, formatted)
+        finally:
+            queue.task_done()
+
+def start_error_logger(app):
+    """Create the error queue and its consumer task (call at app startup)"""
+    app.state.err_queue = asyncio.Queue(maxsize=ERROR_QUEUE_SIZE)
+    app.state.err_task = asyncio.create_task(_drain(app.state.err_queue))
+
+async def stop_error_logger(app):
+    """Cancel the consumer task (call at app shutdown)"""
+    task = getattr(app.state, "err_task", None)
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
 async def error_handler(request: Request, call_next):
     try:
         return await call_next(request)
     except Exception as e:
-        # Log the full traceback for debugging
-        traceback.print_exc()
+        # Hand the traceback to the background logger; drop it if the queue is full
+        queue = getattr(request.app.state, "err_queue", None)
+        if queue is not None:
+            try:
+                queue.put_nowait((
+                    "".join(traceback.format_exception(type(e), e, e.__traceback__)),
+                    request.url.path
+                ))
+            except asyncio.QueueFull:
+                pass
         
         # Return a user-friendly error response
         return JSONResponse(
             status_code=500,
             content={
                 "error": "Internal Server Error",
-                "detail": str(e)
+                "detail": "An unexpected error occurred"
             }
-        )
\ No newline at end of file
+        )
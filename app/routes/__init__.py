@@ -4,10 +4,14 @@ Import and collect all route handlers
 """
 from fastapi import APIRouter
 
-# Initialize an empty list to store all routers
-ALL_ROUTERS = []
+from .resume_routes import router as resume_router
 
-# Import and add route handlers
-# Example:
-# from .auth import router as auth_router
-# ALL_ROUTERS.append(auth_router)
\ No newline at end of file
+# Route handlers, aggregated once at import time
+ALL_ROUTERS = [
+    resume_router,
+]
+
+# Parent router that main.py includes in one call
+api_router = APIRouter()
+for _router in ALL_ROUTERS:
+    api_router.include_router(_router)
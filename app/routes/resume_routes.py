@@ -1,12 +1,59 @@
 """
 Resume-related API endpoints with comprehensive documentation
 """
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, timezone
+import functools
+import hashlib
+import tempfile
+import threading
+import orjson
+from cachetools import TTLCache, cached
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import BaseTarget
+from app.utils.orjson_response import ORJSONResponse
+from app.utils.cpu_pool import run_cpu_bound
+from app.db.config import aexecute_query
+from services.job_index import JobSkillIndex, parse_skills
 
-router = APIRouter(prefix="/api/resumes", tags=["resumes"])
+router = APIRouter(
+    prefix="/api/resumes",
+    tags=["resumes"],
+    default_response_class=ORJSONResponse
+)
+
+# Schema examples, frozen as orjson bytes at import and decoded once on first
+# schema build instead of living as dict literals on each model
+_RESUME_EXAMPLE_BYTES = orjson.dumps({
+    "id": 1,
+    "user_id": 123,
+    "resume_text": "Experienced software engineer...",
+    "skills": [
+        {"name": "Python", "level": 0.9, "category": "Programming"},
+        {"name": "Machine Learning", "level": 0.8, "category": "AI/ML"}
+    ],
+    "created_at": "2025-10-24T10:00:00Z"
+})
+
+_JOB_MATCH_EXAMPLE_BYTES = orjson.dumps({
+    "job_id": 1,
+    "title": "Senior Software Engineer",
+    "match_score": 0.85,
+    "matching_skills": ["Python", "React", "AWS"],
+    "missing_skills": ["Kubernetes"]
+})
+
+@functools.cache
+def _load_example(raw: bytes) -> Dict[str, Any]:
+    return orjson.loads(raw)
+
+def _with_example(raw: bytes):
+    """json_schema_extra hook that attaches a cached example to the schema"""
+    def extra(schema: Dict[str, Any], model) -> None:
+        schema["example"] = _load_example(raw)
+    return extra
 
 # Request/Response Models
 class Skill(BaseModel):
@@ -22,18 +69,14 @@ class Resume(BaseModel):
     created_at: datetime
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "user_id": 123,
-                "resume_text": "Experienced software engineer...",
-                "skills": [
-                    {"name": "Python", "level": 0.9, "category": "Programming"},
-                    {"name": "Machine Learning", "level": 0.8, "category": "AI/ML"}
-                ],
-                "created_at": "2025-10-24T10:00:00Z"
-            }
-        }
+        json_schema_extra = staticmethod(_with_example(_RESUME_EXAMPLE_BYTES))
+
+class ParsedResume(BaseModel):
+    resume_text: str
+    skills: List[Skill]
+    description: Optional[str] = None
+    sha256: str
+    created_at: datetime
 
 class JobMatch(BaseModel):
     job_id: int
@@ -43,44 +86,143 @@ class JobMatch(BaseModel):
     missing_skills: List[str]
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "job_id": 1,
-                "title": "Senior Software Engineer",
-                "match_score": 0.85,
-                "matching_skills": ["Python", "React", "AWS"],
-                "missing_skills": ["Kubernetes"]
+        json_schema_extra = staticmethod(_with_example(_JOB_MATCH_EXAMPLE_BYTES))
+
+# Upload handling
+# Leading bytes of the accepted resume formats
+RESUME_MAGIC_NUMBERS = {
+    b"%PDF": ".pdf",
+    b"\xd0\xcf\x11\xe0": ".doc",   # OLE2 compound document
+    b"PK\x03\x04": ".docx",        # ZIP container
+}
+MAX_RESUME_SIZE = 10 * 1024 * 1024  # 10MB in bytes
+SPOOL_MAX_SIZE = 1 << 20  # Keep up to 1MB in memory before spilling to disk
+
+UPLOAD_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "properties": {"file": {"type": "string", "format": "binary"}},
+                "required": ["file"]
             }
         }
+    }
+}
+
+class _SpooledFileTarget(BaseTarget):
+    """Multipart target that spools chunks to a temp file while hashing them"""
+    def __init__(self):
+        super().__init__()
+        self.file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        self.sha256 = hashlib.sha256()
+        self.header = b""
+        self.size = 0
+
+    def on_data_received(self, chunk: bytes):
+        if len(self.header) < 8:
+            self.header += chunk[:8 - len(self.header)]
+        self.size += len(chunk)
+        if self.size > MAX_RESUME_SIZE:
+            raise HTTPException(status_code=413, detail="File too large")
+        self.sha256.update(chunk)
+        self.file.write(chunk)
+
+def _detect_resume_type(header: bytes) -> Optional[str]:
+    """Identify the resume format from its magic number"""
+    for magic, ext in RESUME_MAGIC_NUMBERS.items():
+        if header.startswith(magic):
+            return ext
+    return None
+
+def parse_resume(data: bytes, ext: str) -> Dict[str, Any]:
+    """
+    Extract text and skills from raw resume bytes.
+    CPU-bound; runs in the app process pool, so it must stay a picklable
+    module-level function.
+    """
+    from services.pdf_utils import extract_pdf_text
+    from services.skill_extractor import extract_skills
+
+    if ext == ".pdf":
+        resume_text = extract_pdf_text(data)
+    else:
+        # For doc/docx files you would need to implement text extraction
+        resume_text = ""
+    return {"resume_text": resume_text, "skills": extract_skills(resume_text)}
 
 # Endpoints
-@router.post("/upload", response_model=Resume, status_code=201)
+# Handlers return a prebuilt ORJSONResponse instead of declaring response_model,
+# so FastAPI skips re-validation and the jsonable_encoder walk. The schemas are
+# still published in OpenAPI through `responses`.
+@router.post(
+    "/upload",
+    status_code=201,
+    responses={201: {"model": ParsedResume}},
+    openapi_extra={"requestBody": UPLOAD_REQUEST_BODY}
+)
 async def upload_resume(
-    file: UploadFile = File(...),
+    request: Request,
     description: str = None
-) -> Resume:
+) -> Response:
     """
     Upload and analyze a new resume
     
+    The multipart body is parsed as it streams in and spooled to a temporary
+    file, so large uploads are never held in memory as a whole. The file type
+    is validated from its first bytes (magic number).
+    
     Parameters:
     - file: Resume file (PDF, DOC, DOCX)
     - description: Optional description or notes
     
     Returns:
-    - Processed resume with extracted skills and metadata
+    - Extracted text and skills with the upload's metadata
     
     Raises:
     - 400: Invalid file format
+    - 413: File too large
     - 422: Unable to process resume
     """
-    pass
+    target = _SpooledFileTarget()
+    try:
+        parser = StreamingFormDataParser(headers=request.headers)
+        parser.register("file", target)
+        async for chunk in request.stream():
+            parser.data_received(chunk)
 
-@router.get("/{resume_id}/match-jobs", response_model=List[JobMatch])
+        if target.size == 0:
+            raise HTTPException(status_code=400, detail="No file uploaded")
+        ext = _detect_resume_type(target.header)
+        if ext is None:
+            raise HTTPException(status_code=400, detail="Invalid file type")
+        target.file.seek(0)
+
+        # Text/skill extraction is CPU-bound: keep it off the event loop
+        try:
+            parsed = await run_cpu_bound(request.app, parse_resume, target.file.read(), ext)
+        except Exception:
+            raise HTTPException(status_code=422, detail="Unable to process resume")
+
+        payload = {
+            "resume_text": parsed["resume_text"],
+            "skills": [{"name": skill} for skill in parsed["skills"]],
+            "description": description,
+            "sha256": target.sha256.hexdigest(),
+            "created_at": datetime.now(timezone.utc)
+        }
+        return ORJSONResponse(payload, status_code=201)
+    finally:
+        target.file.close()
+
+@router.get("/{resume_id}/match-jobs", responses={200: {"model": List[JobMatch]}})
 async def match_jobs(
+    request: Request,
     resume_id: int,
     min_score: float = 0.6,
     limit: int = 10
-) -> List[JobMatch]:
+) -> Response:
     """
     Find matching jobs for a resume
     
@@ -95,13 +237,20 @@ async def match_jobs(
     Raises:
     - 404: Resume not found
     """
-    pass
+    rows = await aexecute_query("SELECT skills FROM resumes WHERE id = %s", (resume_id,))
+    if not rows:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    # One matrix-vector product over the in-memory job skill matrix
+    job_index = getattr(request.app.state, "job_index", None) or JobSkillIndex([])
+    payload = job_index.top_k(parse_skills(rows[0][0]), limit, min_score)
+    return ORJSONResponse(payload)
 
-@router.get("/skills/trending", response_model=List[Skill])
+@router.get("/skills/trending", responses={200: {"model": List[Skill]}})
 async def get_trending_skills(
     category: Optional[str] = None,
     timeframe: str = "30d"
-) -> List[Skill]:
+) -> Response:
     """
     Get trending skills based on job postings
     
@@ -112,4 +261,13 @@ async def get_trending_skills(
     Returns:
     - List of trending skills with demand levels
     """
-    pass
\ No newline at end of file
+    return ORJSONResponse(_compute_trending_skills(category, timeframe))
+
+@cached(TTLCache(maxsize=64, ttl=300), lock=threading.Lock())
+def _compute_trending_skills(category: Optional[str], timeframe: str) -> List[dict]:
+    """Trending skills payload, cached per (category, timeframe) for 5 minutes"""
+    skills: List[Skill] = []
+    return [
+        {"name": s.name, "level": s.level, "category": s.category}
+        for s in skills
+    ]
\ No newline at end of file
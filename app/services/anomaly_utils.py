@@ -0,0 +1,70 @@
+"""
+Time-series anomaly detection used by the attendance routes.
+
+- Scores each point against an exponentially weighted running mean/variance
+- The scoring loop is sequential, so it is JIT-compiled with Numba when
+  available (falls back to plain Python otherwise)
+"""
+
+import math
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+# -------------------------------
+# Config
+# -------------------------------
+EWMA_ALPHA = 0.1
+Z_THRESHOLD = 3.0
+
+
+# -------------------------------
+# Kernel
+# -------------------------------
+def _ewma_zscores(x):
+    """|z| of every point against the EWMA mean/std of the points before it."""
+    n = x.shape[0]
+    out = np.zeros(n)
+    if n == 0:
+        return out
+    mean = x[0]
+    var = 0.0
+    for i in range(1, n):
+        diff = x[i] - mean
+        std = math.sqrt(var)
+        if std > 0.0:
+            out[i] = abs(diff) / std
+        incr = EWMA_ALPHA * diff
+        mean += incr
+        var = (1.0 - EWMA_ALPHA) * (var + diff * incr)
+    return out
+
+
+try:
+    from numba import njit
+
+    # Explicit signature: compiled eagerly at import (and cached on disk),
+    # never on the first request
+    _detect_nb = njit("float64[:](float64[:])", cache=True, fastmath=True)(_ewma_zscores)
+except ImportError:
+    _detect_nb = _ewma_zscores
+
+
+def warmup():
+    """Run the kernel once so any lazy compilation happens at startup."""
+    _detect_nb(np.zeros(1))
+
+
+# -------------------------------
+# Public API
+# -------------------------------
+def detect(series: Sequence[float], threshold: float = Z_THRESHOLD) -> List[Dict[str, Any]]:
+    """Return the points of `series` whose EWMA z-score exceeds `threshold`."""
+    arr = np.ascontiguousarray(series, dtype=np.float64)
+    if arr.ndim != 1:
+        raise ValueError("series must be one-dimensional")
+    scores = _detect_nb(arr)
+    return [
+        {"index": int(i), "value": float(arr[i]), "score": float(scores[i])}
+        for i in np.flatnonzero(scores > threshold)
+    ]
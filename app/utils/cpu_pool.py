@@ -0,0 +1,42 @@
+"""
+Process pool for CPU-bound request work (parsing, embedding, ranking)
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+from starlette.concurrency import run_in_threadpool
+
+CPU_POOL_WORKERS = int(os.getenv("CPU_POOL_WORKERS", str(os.cpu_count() or 1)))
+
+
+def start_cpu_pool(app) -> None:
+    """Create app.state.cpu_pool (call at app startup)"""
+    # forkserver avoids forking a process that already holds the event loop,
+    # DB sockets and model weights
+    app.state.cpu_pool = ProcessPoolExecutor(
+        max_workers=CPU_POOL_WORKERS,
+        mp_context=multiprocessing.get_context("forkserver")
+    )
+
+
+def stop_cpu_pool(app) -> None:
+    """Shut down app.state.cpu_pool (call at app shutdown)"""
+    pool = getattr(app.state, "cpu_pool", None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+        app.state.cpu_pool = None
+
+
+async def run_cpu_bound(app, func: Callable, *args) -> Any:
+    """
+    Run func(*args) in the app's process pool without blocking the event loop.
+    func and args must be picklable. Falls back to a worker thread when the
+    pool hasn't been started (e.g. TestClient without lifespan).
+    """
+    pool = getattr(app.state, "cpu_pool", None)
+    if pool is None:
+        return await run_in_threadpool(func, *args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, func, *args)
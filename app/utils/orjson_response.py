@@ -0,0 +1,19 @@
+"""
+orjson-backed JSON response class
+"""
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes with orjson instead of the stdlib json module"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        # datetime/UUID/numpy are handled natively; Decimal and friends fall back to str
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
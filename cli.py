@@ -3,11 +3,74 @@ Command line interface for HR AI Platform
 """
 import os
 import sys
+import csv
+import json
+import argparse
 from getpass import getpass
+try:
+    import readline  # noqa: F401  (line editing/history for input())
+except ImportError:
+    pass
+from app.bootstrap import init_env
+
+# Env must be loaded before the services import db.config
+init_env()
+
 from services.resume_service import resume_service
 from services.user_service import user_service
 from services.job_service import job_service
 
+# Rows per bulk_create call when importing files
+BULK_BATCH_SIZE = 1000
+
+def _job_row(job):
+    """Normalize an imported job record for insertion"""
+    skills = job.get('required_skills') or []
+    if isinstance(skills, str):
+        # Exported rows carry the column's JSON text; CSV cells are comma lists
+        if skills.lstrip().startswith('['):
+            skills = json.loads(skills)
+        else:
+            skills = [s.strip() for s in skills.split(",") if s.strip()]
+    return {
+        'title': job['title'],
+        'description': job.get('description', ''),
+        'required_skills': json.dumps(skills),
+        'department': job.get('department')
+    }
+
+def _user_row(user):
+    """Normalize an imported user record for insertion"""
+    return {
+        'username': user['username'],
+        'email': user['email'],
+        'password': user['password'],
+        'role': user.get('role') or 'employee'
+    }
+
+def _import_batches(rows, to_row, insert):
+    """Feed rows to insert() in batches of BULK_BATCH_SIZE; returns the total"""
+    total = 0
+    batch = []
+    for row in rows:
+        batch.append(to_row(row))
+        if len(batch) >= BULK_BATCH_SIZE:
+            total += insert(batch)
+            batch = []
+    if batch:
+        total += insert(batch)
+    return total
+
+def bulk_import_jobs(file_path):
+    """Import jobs from a CSV file"""
+    with open(file_path, 'r', newline='') as f:
+        return _import_batches(csv.DictReader(f), _job_row, job_service.bulk_create)
+
+def bulk_import_users(file_path):
+    """Import users from a CSV file (columns: username, email, password, role)"""
+    with open(file_path, 'r', newline='') as f:
+        return _import_batches(csv.DictReader(f), _user_row, user_service.bulk_create_users)
+
 def print_menu():
     """Print main menu"""
     print("\nHR AI Platform CLI")
@@ -66,6 +129,8 @@ def job_menu():
         print("\nJob Operations")
         print("1. Create Job")
         print("2. List Jobs")
+        print("3. Import Jobs from JSON file")
+        print("4. Bulk import Jobs from CSV")
         print("0. Back")
         choice = input("Select an option: ")
 
@@ -92,6 +157,23 @@ def job_menu():
                 print(f"Department: {job['department']}")
                 print(f"Required skills: {job['required_skills']}")
 
+        elif choice == "3":
+            file_path = input("Enter jobs JSON file path: ")
+            try:
+                with open(file_path, 'r') as f:
+                    jobs = json.load(f)
+                count = _import_batches(jobs, _job_row, job_service.bulk_create)
+                print(f"Imported {count} jobs")
+            except Exception as e:
+                print(f"Error: {e}")
+
+        elif choice == "4":
+            file_path = input("Enter jobs CSV file path: ")
+            try:
+                print(f"Imported {bulk_import_jobs(file_path)} jobs")
+            except Exception as e:
+                print(f"Error: {e}")
+
         elif choice == "0":
             break
 
@@ -101,6 +183,7 @@ def user_menu():
         print("\nUser Operations")
         print("1. Create User")
         print("2. List Users")
+        print("3. Bulk import Users from CSV")
         print("0. Back")
         choice = input("Select an option: ")
 
@@ -127,11 +210,31 @@ def user_menu():
                 print(f"Email: {user['email']}")
                 print(f"Role: {user['role']}")
 
+        elif choice == "3":
+            file_path = input("Enter users CSV file path: ")
+            try:
+                print(f"Imported {bulk_import_users(file_path)} users")
+            except Exception as e:
+                print(f"Error: {e}")
+
         elif choice == "0":
             break
 
-def main():
+def main(argv=None):
     """Main CLI loop"""
+    init_env()
+    parser = argparse.ArgumentParser(description="HR AI Platform CLI")
+    parser.add_argument("--bulk-users", metavar="CSV", help="Import users from a CSV file and exit")
+    parser.add_argument("--bulk-jobs", metavar="CSV", help="Import jobs from a CSV file and exit")
+    args = parser.parse_args(argv)
+
+    if args.bulk_users or args.bulk_jobs:
+        if args.bulk_users:
+            print(f"Imported {bulk_import_users(args.bulk_users)} users")
+        if args.bulk_jobs:
+            print(f"Imported {bulk_import_jobs(args.bulk_jobs)} jobs")
+        return
+
     while True:
         choice = print_menu()
         
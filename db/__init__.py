@@ -6,7 +6,11 @@ Makes db a package and re-exports essential database functions.
 from .config import (
     init_db_pool,
     get_db_connection,
-    close_db_connection
+    close_db_connection,
+    init_async_pool,
+    close_async_pool,
+    get_async_connection,
+    aexecute_query
 )
 from .database import DatabaseOperations
 
@@ -14,5 +18,9 @@ __all__ = [
     'init_db_pool',
     'get_db_connection',
     'close_db_connection',
+    'init_async_pool',
+    'close_async_pool',
+    'get_async_connection',
+    'aexecute_query',
     'DatabaseOperations'
 ]
@@ -1,22 +1,23 @@
 """
 Database configuration settings and connection management
+
+This is the single MySQL connection pool for the process; `app.db.config`
+and the top-level `db.py` re-export from here. The .env file is loaded by the
+entrypoint (app.bootstrap.init_env) before this module is imported.
 """
 import os
+import atexit
 from mysql.connector import pooling
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
-# Database configuration
+# Database configuration (DB_* takes precedence over the legacy MYSQL_* names)
 DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'user': os.getenv('DB_USER', 'root'),
-    'password': os.getenv('DB_PASSWORD', ''),
-    'database': os.getenv('DB_NAME', 'hr_app'),
-    'port': int(os.getenv('DB_PORT', '3306')),
+    'host': os.getenv('DB_HOST', os.getenv('MYSQL_HOST', 'localhost')),
+    'user': os.getenv('DB_USER', os.getenv('MYSQL_USER', 'root')),
+    'password': os.getenv('DB_PASSWORD', os.getenv('MYSQL_PASSWORD', '')),
+    'database': os.getenv('DB_NAME', os.getenv('MYSQL_DB', 'hr_app')),
+    'port': int(os.getenv('DB_PORT', os.getenv('MYSQL_PORT', '3306'))),
     'pool_name': 'hr_pool',
-    'pool_size': int(os.getenv('DB_POOL_SIZE', '5')),
+    'pool_size': int(os.getenv('DB_POOL_SIZE', '25')),
 }
 
 # Global connection pool
@@ -25,6 +26,8 @@ connection_pool = None
 def init_db_pool():
     """Initialize the database connection pool"""
     global connection_pool
+    if connection_pool is not None:
+        return True
     try:
         connection_pool = pooling.MySQLConnectionPool(**DB_CONFIG)
         return True
@@ -33,13 +36,90 @@ def init_db_pool():
         return False
 
 def get_db_connection():
-    """Get a connection from .the pool"""
+    """Get a connection from the pool"""
     global connection_pool
     if connection_pool is None:
         init_db_pool()
+    if connection_pool is None:
+        raise Exception("Database connection pool not initialized")
     return connection_pool.get_connection()
 
 def close_db_connection(connection):
-    """Close a database connection"""
+    """Return a connection to the pool"""
     if connection:
         connection.close()
+
+# -------------------------------
+# Async pool (request path)
+# -------------------------------
+# FastAPI handlers use this pool so queries don't block the event loop;
+# the sync pool above stays for the CLI and offline scripts.
+_async_pool = None
+# Connections the async pool opens at startup; it grows to pool_size on demand
+ASYNC_POOL_MIN = int(os.getenv('DB_ASYNC_POOL_MIN', '2'))
+
+async def init_async_pool(minsize: int = None, maxsize: int = None):
+    """
+    Create the asyncmy connection pool (call once at app startup).
+    Only `minsize` connections (default DB_ASYNC_POOL_MIN) are opened up front;
+    the pool grows to `maxsize` (default DB_POOL_SIZE) under load, so each
+    web worker holds a few idle connections rather than a full pool.
+    """
+    global _async_pool
+    if _async_pool is not None:
+        return True
+    import asyncmy
+    try:
+        _async_pool = await asyncmy.create_pool(
+            minsize=minsize or ASYNC_POOL_MIN,
+            maxsize=maxsize or DB_CONFIG['pool_size'],
+            host=DB_CONFIG['host'],
+            port=DB_CONFIG['port'],
+            user=DB_CONFIG['user'],
+            password=DB_CONFIG['password'],
+            db=DB_CONFIG['database'],
+            # Request-path statements are single writes (see aexecute_query)
+            autocommit=True,
+        )
+        return True
+    except Exception as e:
+        print(f"Error initializing async database pool: {str(e)}")
+        return False
+
+async def close_async_pool():
+    """Close the asyncmy pool (call at app shutdown)"""
+    global _async_pool
+    if _async_pool is not None:
+        _async_pool.close()
+        await _async_pool.wait_closed()
+        _async_pool = None
+
+def get_async_connection():
+    """
+    Acquire a connection from the async pool.
+    Use as `async with get_async_connection() as conn:`
+    """
+    if _async_pool is None:
+        raise Exception("Async database connection pool not initialized")
+    return _async_pool.acquire()
+
+async def aexecute_query(query: str, params: tuple = None):
+    """
+    Execute a single statement on the async pool (autocommit).
+    Returns row tuples for queries that produce rows, else lastrowid.
+    """
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query, params)
+            if cursor.description is not None:
+                return await cursor.fetchall()
+            return cursor.lastrowid
+
+@atexit.register
+def _close_db_pool():
+    """Close pooled sockets on interpreter shutdown"""
+    if connection_pool is not None:
+        try:
+            connection_pool._remove_connections()
+        except Exception:
+            pass
@@ -1,24 +1,54 @@
 """
 Base database operations class
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from collections import namedtuple
+from contextlib import AsyncExitStack, contextmanager
+from itertools import islice
+import asyncio
+import threading
+from cachetools import TTLCache
 import mysql.connector
 from .config import get_db_connection, close_db_connection
 import os
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 # SQLAlchemy (optional) - provides Base for ORM models
 # Use DATABASE_URL if provided, otherwise fallback to a local sqlite file for development
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./dev.db")
+# Per-worker budget: these engines only serve the ORM (auth) routes, so keep
+# them small next to the DB_POOL_SIZE raw pools; every WEB_WORKERS process
+# holds its own copy, and MySQL's max_connections must cover the sum
+SA_POOL_SIZE = int(os.getenv("SA_POOL", "5"))
+SA_OVERFLOW = int(os.getenv("SA_OVERFLOW", "10"))
+SA_POOL_TIMEOUT = int(os.getenv("SA_POOL_TIMEOUT", "30"))
+# Connections warm_async_engine opens at startup
+SA_WARM = int(os.getenv("SA_WARM", "2"))
 
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    # Single shared connection for the dev sqlite file
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
 else:
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=SA_POOL_SIZE,
+        max_overflow=SA_OVERFLOW,
+        pool_timeout=SA_POOL_TIMEOUT,
+        pool_pre_ping=True,  # Drop connections killed by MySQL wait_timeout
+        pool_recycle=1800,
+        future=True
+    )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False so objects handed back to FastAPI aren't re-SELECTed
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 
@@ -30,41 +60,218 @@ def get_db():
     finally:
         db.close()
 
+
+# Async engine for `async def` routes, sharing DATABASE_URL with an async driver
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+asyncmy",
+    "mysql+pymysql": "mysql+asyncmy",
+    "mysql+mysqlconnector": "mysql+asyncmy",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+def _async_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return _ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+_async_engine = None
+_async_sessionmaker = None
+
+def get_async_engine():
+    """Create the async engine on first use."""
+    global _async_engine
+    if _async_engine is None:
+        if DATABASE_URL.startswith("sqlite"):
+            _async_engine = create_async_engine(_async_url(DATABASE_URL), poolclass=StaticPool)
+        else:
+            _async_engine = create_async_engine(
+                _async_url(DATABASE_URL),
+                pool_size=SA_POOL_SIZE,
+                max_overflow=SA_OVERFLOW,
+                pool_timeout=SA_POOL_TIMEOUT,
+                pool_pre_ping=True,
+                pool_recycle=1800
+            )
+    return _async_engine
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    """Session factory bound to the async engine."""
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        _async_sessionmaker = async_sessionmaker(
+            get_async_engine(), class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+    return _async_sessionmaker
+
+
+async def warm_async_engine(n: int = None):
+    """
+    Open `n` pooled connections (default SA_WARM) concurrently and hand them
+    back, so the first requests after startup don't pay the TCP/auth handshake.
+    """
+    if DATABASE_URL.startswith("sqlite"):
+        return
+    engine_ = get_async_engine()
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(*(
+            stack.enter_async_context(engine_.connect())
+            for _ in range(min(n or SA_WARM, SA_POOL_SIZE))
+        ))
+
+
+async def get_async_db():
+    """Yield an AsyncSession (FastAPI dependency style)."""
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+# Seconds a cached get_by_id row may be served after a write it didn't see
+BY_ID_CACHE_TTL = int(os.getenv("DB_ID_CACHE_TTL", "60"))
+
 class DatabaseOperations:
-    def __init__(self, table_name: str):
+    # Short-lived cache of get_by_id rows keyed by (table, id), shared by all
+    # instances. Tables opt in with cache_by_id=True; only do that for
+    # read-mostly tables whose updates and deletes go through update()/delete(),
+    # which invalidate the entry in this process. Writes from other workers
+    # or through raw SQL, transaction(), the async pool or SQLAlchemy are seen
+    # only once the entry expires (up to BY_ID_CACHE_TTL seconds).
+    _by_id_cache = TTLCache(maxsize=10_000, ttl=BY_ID_CACHE_TTL)
+    _by_id_lock = threading.Lock()
+    _by_id_stats = {'hits': 0, 'misses': 0}
+
+    # Column lists are introspected once per table and shared by every instance,
+    # since services construct DatabaseOperations('jobs') etc. on the fly
+    _columns_cache: Dict[str, Tuple[str, ...]] = {}
+    _row_cache: Dict[str, Any] = {}
+
+    def __init__(self, table_name: str, cache_by_id: bool = False):
         self.table_name = table_name
+        self.cache_by_id = cache_by_id
 
-    def execute_query(self, query: str, params: tuple = None) -> Any:
-        """Execute a database query"""
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Column names of the table, resolved lazily via DESCRIBE"""
+        cols = self._columns_cache.get(self.table_name)
+        if cols is None:
+            rows = self.execute_rows(f"DESCRIBE {self.table_name}")
+            cols = tuple(r[0] for r in rows)
+            self._columns_cache[self.table_name] = cols
+        return cols
+
+    @property
+    def _Row(self):
+        """namedtuple class matching the table's columns"""
+        row_cls = self._row_cache.get(self.table_name)
+        if row_cls is None:
+            row_cls = namedtuple(self.table_name, self.columns, rename=True)
+            self._row_cache[self.table_name] = row_cls
+        return row_cls
+
+    @property
+    def _cols_csv(self) -> str:
+        return ', '.join(self.columns)
+
+    def _execute(self, query: str, params: tuple = None):
+        """Run a query and return (column_names, rows) or (None, lastrowid)"""
         connection = get_db_connection()
-        cursor = connection.cursor(dictionary=True)
+        # Client-side parameter interpolation: one round trip per query. A
+        # prepared cursor closed after each call would cost PREPARE + EXECUTE
+        # + CLOSE every time instead.
+        cursor = connection.cursor(buffered=True)
         try:
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
-            if query.strip().upper().startswith('SELECT'):
-                result = cursor.fetchall()
-            else:
-                connection.commit()
-                result = cursor.lastrowid
-            return result
-        except mysql.connector.Error as e:
+            if cursor.with_rows:
+                return cursor.column_names, cursor.fetchall()
+            connection.commit()
+            return None, cursor.lastrowid
+        except mysql.connector.Error:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+            close_db_connection(connection)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Yield a cursor bound to one pooled connection inside an explicit
+        transaction; commits on success, rolls back on error.
+        """
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        try:
+            connection.start_transaction()
+            yield cursor
+            connection.commit()
+        except Exception:
             connection.rollback()
-            raise e
+            raise
         finally:
             cursor.close()
             close_db_connection(connection)
 
+    def execute_rows(self, query: str, params: tuple = None) -> Any:
+        """Execute a query and return raw row tuples (or lastrowid for writes)"""
+        _, result = self._execute(query, params)
+        return result
+
+    def execute_query(self, query: str, params: tuple = None) -> Any:
+        """Execute a database query"""
+        columns, result = self._execute(query, params)
+        if columns is None:
+            return result
+        return [dict(zip(columns, row)) for row in result]
+
     def get_by_id(self, id: int) -> Optional[Dict]:
-        """Get a record by ID"""
-        query = f"SELECT * FROM {self.table_name} WHERE id = %s"
+        """Get a record by ID (served from the TTL cache when the table opted in)"""
+        query = f"SELECT {self._cols_csv} FROM {self.table_name} WHERE id = %s"
+        if not self.cache_by_id:
+            result = self.execute_query(query, (id,))
+            return result[0] if result else None
+
+        key = (self.table_name, id)
+        with self._by_id_lock:
+            row = self._by_id_cache.get(key)
+            if row is not None:
+                self._by_id_stats['hits'] += 1
+                # Copy so callers can mutate the result without touching the cache
+                return dict(row)
+            self._by_id_stats['misses'] += 1
+
         result = self.execute_query(query, (id,))
-        return result[0] if result else None
+        if not result:
+            return None
+        with self._by_id_lock:
+            self._by_id_cache[key] = result[0]
+        return dict(result[0])
 
-    def get_all(self) -> List[Dict]:
-        """Get all records"""
-        query = f"SELECT * FROM {self.table_name}"
+    def _invalidate(self, id: int):
+        """Drop a cached get_by_id row"""
+        with self._by_id_lock:
+            self._by_id_cache.pop((self.table_name, id), None)
+
+    @classmethod
+    def cache_stats(cls) -> Dict[str, int]:
+        """Hit/miss counters and size of the get_by_id cache"""
+        with cls._by_id_lock:
+            return {
+                **cls._by_id_stats,
+                'size': len(cls._by_id_cache),
+                'maxsize': int(cls._by_id_cache.maxsize)
+            }
+
+    def get_all(self, as_rows: bool = False) -> List[Any]:
+        """
+        Get all records.
+        Returns dicts by default, or lightweight namedtuples when as_rows=True.
+        """
+        query = f"SELECT {self._cols_csv} FROM {self.table_name}"
+        if as_rows:
+            Row = self._Row
+            return [Row(*r) for r in self.execute_rows(query)]
         return self.execute_query(query)
 
     def create(self, data: Dict) -> int:
@@ -75,16 +282,41 @@ class DatabaseOperations:
         values = tuple(data.values())
         return self.execute_query(query, values)
 
+    def bulk_create(self, rows: List[Dict], chunk_size: int = 1000) -> int:
+        """
+        Insert many records with executemany and a single commit.
+        All rows must share the keys of the first row. Returns the row count.
+        """
+        if not rows:
+            return 0
+        fields = list(rows[0].keys())
+        placeholders = ', '.join(['%s'] * len(fields))
+        query = f"INSERT INTO {self.table_name} ({', '.join(fields)}) VALUES ({placeholders})"
+
+        inserted = 0
+        # Plain cursor: the driver rewrites executemany INSERTs into multi-row VALUES
+        with self.transaction() as cursor:
+            it = iter(rows)
+            while True:
+                chunk = list(islice(it, chunk_size))
+                if not chunk:
+                    break
+                cursor.executemany(query, [tuple(r[f] for f in fields) for r in chunk])
+                inserted += cursor.rowcount
+        return inserted
+
     def update(self, id: int, data: Dict) -> bool:
         """Update a record"""
         set_clause = ', '.join([f"{k} = %s" for k in data.keys()])
         query = f"UPDATE {self.table_name} SET {set_clause} WHERE id = %s"
         values = tuple(data.values()) + (id,)
         self.execute_query(query, values)
+        self._invalidate(id)
         return True
 
     def delete(self, id: int) -> bool:
         """Delete a record"""
         query = f"DELETE FROM {self.table_name} WHERE id = %s"
         self.execute_query(query, (id,))
+        self._invalidate(id)
         return True
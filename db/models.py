@@ -5,7 +5,7 @@ Supports both Postgres (with pgvector) and MySQL.
 
 from sqlalchemy import (
     Column, String, Integer, Float, Text, ForeignKey, DateTime, 
-    JSON, Boolean, DECIMAL, Date, func
+    JSON, Boolean, DECIMAL, Date, LargeBinary, func
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -46,7 +46,7 @@ class Resume(Base):
     user_id = Column(Integer, ForeignKey("users.id"))
     resume_text = Column(Text)
     skills = Column(JSON)
-    vector_embedding = Column(Text)  # Store as base64 encoded string
+    vector_embedding = Column(LargeBinary)  # float32 scale + int8 components (embedding_service.pack_embedding)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
@@ -17,6 +17,7 @@ CREATE TABLE IF NOT EXISTS resumes (
     user_id INT,
     resume_text TEXT,
     skills JSON,
+    vector_embedding BLOB,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id)
 );
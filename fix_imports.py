@@ -1,26 +1,36 @@
 import os
 import re
+from functools import lru_cache
+
+# Patterns are compiled once instead of being resolved through re's cache per file
+_PAT_FROM_APP = re.compile(r'from\s+app\.')
+_PAT_IMPORT_APP = re.compile(r'import\s+app\.')
+_PAT_FROM_WORD = re.compile(r'from\s+(\w+)')
+
+# Directory names never descended into
+_SKIP_DIRS = {'venv', '.venv', '.git', 'node_modules', '__pycache__'}
+
+@lru_cache(maxsize=None)
+def _relative_replacement(rel_dir):
+    """Replacement template adding one leading dot per directory level"""
+    levels = len(rel_dir.split(os.sep))
+    return f"from {'.' * levels}\\1"
 
 def _process_file_content(content, root, root_dir):
     """Process the content of a single file"""
     # Fix imports starting with 'app.'
-    content = re.sub(r'from\s+app\.', 'from ', content)
-    content = re.sub(r'import\s+app\.', 'import ', content)
+    content = _PAT_FROM_APP.sub('from ', content)
+    content = _PAT_IMPORT_APP.sub('import ', content)
     
     # Handle relative imports
     rel_dir = os.path.relpath(root, root_dir)
     if rel_dir != '.':
-        levels = len(rel_dir.split(os.sep))
-        dots = '.' * levels
-        content = re.sub(r'from\s+(\w+)', f'from {dots}\\1', content)
+        content = _PAT_FROM_WORD.sub(_relative_replacement(rel_dir), content)
     return content
 
 def _process_single_file(filepath, root, root_dir):
     """Process a single Python file"""
     try:
-        if 'app\\venv' in filepath:
-            return
-            
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
@@ -32,15 +42,28 @@ def _process_single_file(filepath, root, root_dir):
     except (UnicodeDecodeError, OSError):
         print(f"Skipping {filepath} due to encoding/access issues")
 
+def _iter_python_files(directory):
+    """Yield (dirpath, filepath) for .py files, using a single scandir per directory"""
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                        yield current, entry.path
+        except OSError:
+            print(f"Skipping {current} due to access issues")
+
 def fix_imports(directory):
     """Recursively fix imports in Python files"""
     root_dir = os.path.abspath(directory)
     
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.py'):
-                filepath = os.path.join(root, file)
-                _process_single_file(filepath, root, root_dir)
+    for root, filepath in _iter_python_files(directory):
+        _process_single_file(filepath, root, root_dir)
 
 if __name__ == '__main__':
     app_dir = os.path.dirname(os.path.abspath(__file__))
@@ -5,13 +5,11 @@ import os
 import sys
 from pathlib import Path
 import mysql.connector
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from app.bootstrap import init_env
 
 def init_database():
     """Initialize the database with schema"""
+    init_env()
     try:
         # Connect without database first
         conn = mysql.connector.connect(
@@ -29,10 +27,20 @@ def init_database():
         # Read and execute schema.sql
         schema_path = Path(__file__).parent / 'db' / 'schema.sql'
         with open(schema_path, 'r', encoding='utf-8') as f:
-            sql_commands = f.read().split(';')
-            for command in sql_commands:
+            sql_blob = f.read()
+
+        if 'DELIMITER' in sql_blob.upper():
+            # DELIMITER is a client-side directive the server can't parse;
+            # split statement by statement for schemas with stored routines
+            import sqlparse
+            for command in sqlparse.split(sql_blob):
                 if command.strip():
                     cursor.execute(command)
+        else:
+            # Send the whole schema in one round-trip; the iterator must be
+            # consumed for every statement to run
+            for _ in cursor.execute(sql_blob, multi=True):
+                pass
         
         conn.commit()
         print("Database initialized successfully!")
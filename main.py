@@ -2,21 +2,46 @@
 Main application entry point
 FastAPI web application with MySQL database
 """
+from app.bootstrap import init_env
+
+# Load .env before anything reads DB settings at import time
+init_env()
+
 from fastapi import FastAPI, HTTPException
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from app.db.config import init_db_pool, get_db_connection, close_db_connection
-from app.routes import ALL_ROUTERS
-from app.middleware.error_handling import error_handler
-from app.api_docs import custom_openapi
+import asyncio
+import os
+from anyio import to_thread
+from app.db.config import (
+    config as db_config, init_db_pool, init_async_pool, close_async_pool, aexecute_query
+)
+from app.db.database import get_async_engine, warm_async_engine
+from db.models import User
+from app.routes import api_router
+from app.middleware.error_handling import error_handler, start_error_logger, stop_error_logger
+from app.api_docs import get_openapi_bytes, setup_openapi
+from app.utils.orjson_response import ORJSONResponse
+from app.utils.cpu_pool import start_cpu_pool, stop_cpu_pool
+from app.services import anomaly_utils
+from services.job_index import start_job_index, stop_job_index
+from services.job_embeddings import start_job_embeddings
+from services import vllm_client
 import uvicorn
 
 # Create FastAPI app
 
 @asynccontextmanager
 async def lifespan(app):
-    # Startup logic
+    # Startup logic (.env was already loaded at import, above)
+    # Sync (def) handlers run on AnyIO's threadpool; keep it no wider than the
+    # DB pool so a burst can't queue 40 threads on fewer connections
+    to_thread.current_default_thread_limiter().total_tokens = int(
+        os.getenv("FASTAPI_THREADPOOL", str(db_config['pool_size']))
+    )
+    start_error_logger(app)
+    start_cpu_pool(app)
     # Try to initialize DB pool; allow startup to continue in dev if it fails
     try:
         ok = init_db_pool()
@@ -25,14 +50,52 @@ async def lifespan(app):
             print("Warning: Failed to initialize database connection pool; continuing without DB (dev mode).")
     except Exception as e:
         print(f"Warning: Exception while initializing DB pool: {e}; continuing without DB (dev mode).")
+    # Async pool for request-path queries
+    try:
+        if not await init_async_pool():
+            print("Warning: Failed to initialize async database pool; continuing without DB (dev mode).")
+    except Exception as e:
+        print(f"Warning: Exception while initializing async DB pool: {e}; continuing without DB (dev mode).")
+    # Pre-open a few SQLAlchemy async connections for the auth routes
+    try:
+        await warm_async_engine()
+    except Exception as e:
+        print(f"Warning: Failed to warm SQLAlchemy async pool: {e}")
+    # Users table for the auth routes (once here rather than per registration)
+    try:
+        async with get_async_engine().begin() as conn:
+            await conn.run_sync(User.__table__.create, checkfirst=True)
+    except Exception as e:
+        print(f"Warning: Failed to ensure users table: {e}")
+    # JIT-compile the anomaly detector before the first request
+    anomaly_utils.warmup()
+    # Load the transformer pipelines behind /api/ai before serving
+    try:
+        from routes.ai import warmup as warmup_ai_services
+        await asyncio.to_thread(warmup_ai_services)
+    except Exception as e:
+        print(f"Warning: Failed to warm AI services: {e}")
+    # In-memory job skill matrix used by resume matching
+    await start_job_index(app)
+    # Memory-mapped job description embeddings for the resume_fit scan path
+    await start_job_embeddings()
+    # Routes are all registered by now: build and serialize the OpenAPI schema
+    # once here instead of on the first docs request
+    get_openapi_bytes(app)
     yield
-    # Shutdown logic (if needed)
+    # Shutdown logic
+    await stop_job_index(app)
+    await close_async_pool()
+    await vllm_client.aclose()
+    stop_cpu_pool(app)
+    await stop_error_logger(app)
 
 app = FastAPI(
     title="HR AI Platform",
     description="AI-powered HR management platform",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",  # Customize docs URL
     redoc_url="/api/redoc",  # Customize ReDoc URL
     openapi_url="/api/openapi.json"  # Customize OpenAPI schema URL
@@ -60,26 +123,31 @@ async def root():
 async def health_check():
     """Health check endpoint to verify database connectivity"""
     try:
-        conn = get_db_connection()
-        close_db_connection(conn)
+        await aexecute_query("SELECT 1")
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         # Return an unhealthy status for easier dev debugging instead of raising
         return {"status": "unhealthy", "database": "disconnected", "detail": str(e)}
 
 
-# Include application routers discovered in app/routes
-for r in ALL_ROUTERS:
-    try:
-        app.include_router(r)
-    except Exception:
-        # If a router fails to include, skip to allow the app to start and surface errors later
-        pass
+# Include application routers aggregated in app/routes; a broken router
+# fails startup instead of being skipped silently
+app.include_router(api_router)
 
-# Set up custom OpenAPI schema
-app.openapi = custom_openapi
+# Set up custom OpenAPI schema served from a cached byte buffer
+setup_openapi(app)
 
 
 if __name__ == "__main__":
     # Run the app for local development
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, log_level="info")
+    # uvloop/httptools come with uvicorn[standard]; WEB_WORKERS > 1 forks one
+    # process (own pools and CPU executor) per core
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_WORKERS", "1"))
+    )
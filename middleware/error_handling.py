@@ -5,7 +5,9 @@ from .fastapi import Request, status
 from .fastapi.responses import JSONResponse
 from .fastapi.exceptions import RequestValidationError
 from .sqlalchemy.exc import SQLAlchemyError
-import traceback
+import logging
+
+logger = logging.getLogger("app.errors")
 
 # Try to import JWT exception classes from .common JWT libraries so the
 # middleware can work whether the project uses `python-jose` or `PyJWT`.
@@ -47,52 +49,53 @@ class ValidationError(Exception):
     def __init__(self, message: str):
         self.message = message
 
+# Status codes for the application exceptions, looked up by type
+_STATUS = {
+    AuthError: status.HTTP_401_UNAUTHORIZED,
+    PermissionError: status.HTTP_403_FORBIDDEN,
+    NotFoundError: status.HTTP_404_NOT_FOUND,
+    ValidationError: status.HTTP_400_BAD_REQUEST,
+}
+_APP_ERRORS = tuple(_STATUS)
+# Empty tuple when no JWT library is installed (matches nothing)
+_TOKEN_ERRORS = tuple(e for e in (TokenExpiredError, TokenInvalidError) if e is not None)
+
+def _status_for(exc: Exception) -> int:
+    for cls in type(exc).__mro__:
+        if cls in _STATUS:
+            return _STATUS[cls]
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
 async def error_handler(request: Request, call_next):
     """Global error handling middleware"""
     try:
         return await call_next(request)
-    except AuthError as e:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"detail": str(e.message)}
-        )
-    except PermissionError as e:
-        return JSONResponse(
-            status_code=status.HTTP_403_FORBIDDEN,
-            content={"detail": str(e.message)}
-        )
-    except NotFoundError as e:
+    # Application errors (auth first: the common case on protected routes)
+    except _APP_ERRORS as e:
         return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=_status_for(e),
             content={"detail": str(e.message)}
         )
-    except ValidationError as e:
+    # Token-related exceptions (support both jose and PyJWT)
+    except _TOKEN_ERRORS as e:
+        expired = TokenExpiredError is not None and isinstance(e, TokenExpiredError)
         return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={"detail": str(e.message)}
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": "Token has expired" if expired else "Invalid token"}
         )
     except RequestValidationError as e:
         return JSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={"detail": str(e)}
         )
-    # Token-related exceptions (support both jose and PyJWT)
-    except TokenExpiredError:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"detail": "Token has expired"}
-        )
-    except TokenInvalidError:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"detail": "Invalid token"}
-        )
     except SQLAlchemyError:
+        logger.exception("Database error on %s", request.url.path)
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": "Database error occurred"}
         )
     except Exception:
+        logger.exception("Unhandled error on %s", request.url.path)
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": "An unexpected error occurred"}
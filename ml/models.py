@@ -2,6 +2,8 @@ from .sklearn.base import BaseEstimator, TransformerMixin
 from .typing import List, Dict, Any
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.preprocessing import OneHotEncoder
 from .datetime import datetime
 
 class EmployeeDataPreprocessor(BaseEstimator, TransformerMixin):
@@ -15,61 +17,114 @@ class EmployeeDataPreprocessor(BaseEstimator, TransformerMixin):
     def __init__(self):
         self.categorical_features = ['department', 'role', 'education']
         self.numerical_features = ['years_experience', 'performance_score', 'training_hours']
-        
+        self.encoder = None
+
+    def _fill_missing(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Fill numeric gaps with the median and categorical gaps with the mode, in one pass"""
+        columns = set(X.columns)
+        numerical = [f for f in self.numerical_features if f in columns]
+        categorical = [f for f in self.categorical_features if f in columns]
+        if not numerical and not categorical:
+            return X
+
+        fill_values = {}
+        if numerical:
+            fill_values.update(X[numerical].median().to_dict())
+        if categorical:
+            modes = X[categorical].mode()
+            if len(modes):
+                fill_values.update(modes.iloc[0].dropna().to_dict())
+        return X.fillna(fill_values)
+
+    def _numeric_block(self, X: pd.DataFrame) -> np.ndarray:
+        days_since_last_promotion = (
+            datetime.now() - pd.to_datetime(X['last_promotion_date'])
+        ).dt.days
+        return np.column_stack([
+            X[self.numerical_features].to_numpy(dtype=np.float64),
+            days_since_last_promotion.to_numpy(dtype=np.float64)
+        ])
+
     def fit(self, X: pd.DataFrame, y=None):
+        # Categories are learned once here; transform only looks them up
+        self.encoder = OneHotEncoder(drop='first', handle_unknown='ignore', sparse_output=False)
+        self.encoder.fit(self._fill_missing(X)[self.categorical_features])
         return self
-        
-    def transform(self, X: pd.DataFrame) -> np.ndarray:
-        X_processed = X.copy()
-        
-        # Handle missing values
-        for feature in self.numerical_features:
-            X_processed[feature].fillna(X_processed[feature].median(), inplace=True)
-            
-        for feature in self.categorical_features:
-            X_processed[feature].fillna(X_processed[feature].mode()[0], inplace=True)
-            
-        # Feature engineering
-        X_processed['days_since_last_promotion'] = (
-            datetime.now() - pd.to_datetime(X_processed['last_promotion_date'])
-        ).dt.days
-        
-        # One-hot encoding for categorical features
-        X_processed = pd.get_dummies(
-            X_processed, 
-            columns=self.categorical_features,
-            drop_first=True
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        if self.encoder is None:
+            raise ValueError("EmployeeDataPreprocessor must be fit before transform")
+        # fillna returns a new frame, so the caller's DataFrame is never modified
+        X_processed = self._fill_missing(X)
+
+        # Numeric features + days since last promotion, then one-hot categoricals
+        columns = (
+            self.numerical_features
+            + ['days_since_last_promotion']
+            + list(self.encoder.get_feature_names_out(self.categorical_features))
+        )
+        return pd.DataFrame(
+            np.hstack([
+                self._numeric_block(X_processed),
+                self.encoder.transform(X_processed[self.categorical_features])
+            ]),
+            columns=columns,
+            index=X.index
         )
-        
-        return X_processed.values
+
+def _fit_one(model: BaseEstimator, X, y) -> BaseEstimator:
+    model.fit(X, y)
+    return model
 
 class PerformancePredictor:
     """
     Predicts employee performance based on historical data
     Uses ensemble of models for better accuracy
     """
-    def __init__(self, models: List[BaseEstimator]):
+    def __init__(self, models: List[BaseEstimator], n_jobs: int = -1):
         self.models = models
+        self.n_jobs = n_jobs
         self.preprocessor = EmployeeDataPreprocessor()
-        
+        # (caller's cache key, processed matrix) of the last keyed predict
+        self._cache = None
+
+    def _to_model_input(self, X_processed):
+        # float32 halves the bytes each model reads; tree ensembles are unaffected
+        return X_processed.astype(np.float32)
+
     def train(self, X: pd.DataFrame, y: np.ndarray):
         """Train all models in the ensemble"""
-        X_processed = self.preprocessor.fit_transform(X)
-        
-        for model in self.models:
-            model.fit(X_processed, y)
+        X_processed = self._to_model_input(self.preprocessor.fit_transform(X))
+        self._cache = None
+
+        # Fit the estimators in parallel worker processes (loky); each returns
+        # its fitted copy, so the list is replaced rather than mutated
+        self.models = Parallel(n_jobs=self.n_jobs, backend="loky")(
+            delayed(_fit_one)(model, X_processed, y) for model in self.models
+        )
             
-    def predict(self, X: pd.DataFrame) -> np.ndarray:
-        """Get ensemble predictions"""
-        X_processed = self.preprocessor.transform(X)
-        predictions = []
-        
+    def predict(self, X: pd.DataFrame, cache_key: Any = None) -> np.ndarray:
+        """
+        Get ensemble predictions. Pass a `cache_key` (e.g. a dataset version)
+        to reuse the preprocessing of the previous call with the same key;
+        the frame itself is never hashed.
+        """
+        if cache_key is not None and self._cache is not None and self._cache[0] == cache_key:
+            X_processed = self._cache[1]
+        else:
+            X_processed = self._to_model_input(self.preprocessor.transform(X))
+            if cache_key is not None:
+                self._cache = (cache_key, X_processed)
+        if not self.models:
+            raise ValueError("PerformancePredictor has no models")
+
+        # Running mean in one preallocated buffer instead of stacking an
+        # (n_models, n_samples) array for np.mean
+        out = np.zeros(X_processed.shape[0], dtype=np.float64)
         for model in self.models:
-            pred = model.predict(X_processed)
-            predictions.append(pred)
-            
-        # Average predictions from .all models
-        return np.mean(predictions, axis=0)
+            np.add(out, model.predict(X_processed), out=out)
+        out *= 1.0 / len(self.models)
+        return out
         
     def get_feature_importance(self) -> Dict[str, float]:
         """Get feature importance scores"""
@@ -7,6 +7,7 @@ and makes them available for inclusion in main.py.
 """
 
 from fastapi import APIRouter
+from app.utils.orjson_response import ORJSONResponse
 
 # Import individual routers
 from . import (
@@ -22,8 +23,9 @@ from . import (
     diversity_inclusion,
 )
 
-# Create a parent router to group all sub-routers if desired
-api_router = APIRouter()
+# Create a parent router to group all sub-routers if desired. ORJSONResponse
+# (numpy-aware) matches the app default even if this router is mounted elsewhere.
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include each module router
 api_router.include_router(resume_fit.router)
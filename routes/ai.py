@@ -1,5 +1,7 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Depends
 from typing import List, Dict, Any
+from app.utils.orjson_response import ORJSONResponse
 from app.services.ai_feedback_service import AIFeedbackService
 from app.services.hr_analytics_service import HRAnalyticsService
 from app.services.nlp_service import NLPService
@@ -11,11 +13,19 @@ ai_feedback_service = AIFeedbackService()
 hr_analytics_service = HRAnalyticsService()
 nlp_service = NLPService()
 
+
+def warmup():
+    """Load every service's models so no request pays the first-use cost"""
+    ai_feedback_service.warmup()
+    nlp_service.warmup()
+
 @router.post("/analyze-review")
 async def analyze_review(review_text: str) -> Dict[str, Any]:
     """Analyze performance review text"""
     try:
-        return ai_feedback_service.analyze_performance_review(review_text)
+        result = await asyncio.to_thread(ai_feedback_service.analyze_performance_review, review_text)
+        # Returned as-is: orjson writes the numpy embedding directly
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -23,7 +33,7 @@ async def analyze_review(review_text: str) -> Dict[str, Any]:
 async def recommend_learning(user_profile: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Get personalized learning recommendations"""
     try:
-        return ai_feedback_service.recommend_learning_path(user_profile)
+        return await asyncio.to_thread(ai_feedback_service.recommend_learning_path, user_profile)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -34,7 +44,9 @@ async def analyze_skill_gaps(
 ) -> Dict[str, Any]:
     """Identify skill gaps"""
     try:
-        return ai_feedback_service.identify_skill_gaps(current_skills, target_role)
+        return await asyncio.to_thread(
+            ai_feedback_service.identify_skill_gaps, current_skills, target_role
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -45,7 +57,8 @@ async def generate_development_plan(
 ) -> Dict[str, Any]:
     """Generate personalized development plan"""
     try:
-        return ai_feedback_service.generate_development_plan(
+        return await asyncio.to_thread(
+            ai_feedback_service.generate_development_plan,
             user_profile,
             skill_gaps
         )
@@ -56,9 +69,10 @@ async def generate_development_plan(
 async def predict_turnover_risk(employee_data: Dict[str, Any]) -> Dict[str, Any]:
     """Predict employee turnover risk"""
     try:
-        import pandas as pd
-        df = pd.DataFrame([employee_data])
-        return hr_analytics_service.predict_turnover_risk(df)
+        # sklearn/SHAP inference is synchronous; keep it off the event loop
+        return await asyncio.to_thread(hr_analytics_service.predict_turnover_risk, employee_data)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -66,7 +80,7 @@ async def predict_turnover_risk(employee_data: Dict[str, Any]) -> Dict[str, Any]
 async def analyze_sentiment(text: str) -> Dict[str, Any]:
     """Analyze text sentiment"""
     try:
-        return nlp_service.analyze_sentiment(text)
+        return await asyncio.to_thread(nlp_service.analyze_sentiment, text)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -74,7 +88,7 @@ async def analyze_sentiment(text: str) -> Dict[str, Any]:
 async def extract_entities(text: str) -> List[Dict[str, Any]]:
     """Extract named entities from .text"""
     try:
-        return nlp_service.extract_entities(text)
+        return await asyncio.to_thread(nlp_service.extract_entities, text)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -85,6 +99,6 @@ async def answer_question(
 ) -> Dict[str, Any]:
     """Answer questions based on context"""
     try:
-        return nlp_service.answer_question(context, question)
+        return await asyncio.to_thread(nlp_service.answer_question, context, question)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -8,12 +8,20 @@ Provides endpoints for detecting anomalies in attendance records
 from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import List, Dict, Any
+import asyncio
 import random
-import datetime
+from datetime import datetime, timezone
+import numpy as np
 from app.services import anomaly_utils
 
 router = APIRouter(prefix="/attendance", tags=["Attendance Anomaly Detector"])
 
+_rng = np.random.default_rng()
+
+# Numeric code per attendance status (feature column for the detector)
+STATUS_CODES = {"present": 0.0, "absent": 1.0, "leave": 2.0, "remote": 3.0}
+ANOMALY_RATE = 0.1
+
 
 # -------------------------------
 # Request Models
@@ -25,7 +33,7 @@ class AttendanceRecord(BaseModel):
 
 
 class BatchRequest(BaseModel):
-    records: List[AttendanceRecord]
+    records: List[AttendanceRecord] = []
 
 
 class StreamRequest(BaseModel):
@@ -50,17 +58,29 @@ async def anomaly_batch(req: BatchRequest) -> Dict[str, Any]:
     Stub: Randomly marks a few records as anomalies.
     Later: Replace with IsolationForest, LSTM Autoencoder, or PyOD models.
     """
-    anomalies = []
-    for record in req.records:
-        # Fake anomaly detection: randomly flag ~10%
-        if random.random() < 0.1:
-            anomalies.append({
-                "employee_id": record.employee_id,
-                "date": record.date,
-                "reason": "outlier (stub)"
-            })
-
-    return {"total_records": len(req.records), "anomalies": anomalies}
+    records = req.records
+    # Contiguous float32 feature matrix built in one pass over the records
+    features = np.fromiter(
+        (STATUS_CODES.get(r.status, -1.0) for r in records),
+        dtype=np.float32,
+        count=len(records)
+    ).reshape(-1, 1)
+
+    # Fake anomaly detection: randomly flag ~10%. A real detector
+    # (IsolationForest) replaces only this score generator.
+    scores = _rng.random(features.shape[0])
+    mask = scores < ANOMALY_RATE
+
+    anomalies = [
+        {
+            "employee_id": records[i].employee_id,
+            "date": records[i].date,
+            "reason": "outlier (stub)"
+        }
+        for i in np.flatnonzero(mask)
+    ]
+
+    return {"total_records": int(features.shape[0]), "anomalies": anomalies}
 
 
 @router.post("/anomaly/stream")
@@ -69,7 +89,7 @@ async def anomaly_stream(req: StreamRequest) -> Dict[str, Any]:
     Streaming anomaly detection (stub).
     Later: Hook into Kafka/RabbitMQ + River (online ML).
     """
-    now = datetime.datetime.utcnow().isoformat()
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
     return {
         "employee_id": req.employee_id,
         "status": req.status,
@@ -90,9 +110,9 @@ async def send_alert(req: AlertRequest) -> Dict[str, Any]:
         "employee_id": req.employee_id,
         "anomaly_type": req.anomaly_type,
         "details": req.details,
-        "sent_at": datetime.datetime.utcnow().isoformat()
+        "sent_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
 @router.post("/detect")
-def detect_anomalies(payload: Dict[str, Any]):
-    anomalies = anomaly_utils.detect(payload.get("series", []))
+async def detect_anomalies(payload: Dict[str, Any]):
+    anomalies = await asyncio.to_thread(anomaly_utils.detect, payload.get("series", []))
     return {"anomalies": anomalies} 
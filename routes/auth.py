@@ -1,17 +1,20 @@
 """
 Authentication routes and user management
 """
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import timedelta
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.db.models import User
 from app.services.auth import (
-    verify_password, get_password_hash, create_access_token,
-    get_current_user, allow_admin, ACCESS_TOKEN_EXPIRE_MINUTES
+    verify_password, verify_and_update_password, get_password_hash, create_access_token,
+    get_current_user, allow_admin, invalidate_user, clear_verify_cache,
+    ACCESS_TOKEN_EXPIRE_MINUTES
 )
 from app.schemas.auth import (
     Token, UserCreate, UserUpdate, UserResponse,
@@ -23,16 +26,26 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 @router.post("/token", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Login and get access token"""
-    user = db.query(User).filter(User.username == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+    user = (await db.execute(
+        select(User).where(User.username == form_data.username)
+    )).scalar_one_or_none()
+    # Password hashing is CPU-bound; run it on a worker thread, not the event loop
+    verified, new_hash = (False, None) if not user else await asyncio.to_thread(
+        verify_and_update_password, form_data.password, user.password_hash
+    )
+    if not verified:
         raise HTTPException(
             status_code=401,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if new_hash:
+        # Legacy bcrypt (or outdated cost) hash: store the argon2id rehash
+        user.password_hash = new_hash
+        await db.commit()
     
     access_token = create_access_token(
         data={"sub": str(user.id)},
@@ -50,33 +63,30 @@ async def login(
 @router.post("/register", response_model=UserResponse)
 async def register_user(
     user_data: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Register a new user"""
-    # Ensure tables exist on the bound engine for the provided session
-    try:
-        bind = db.get_bind()
-        User.__table__.create(bind=bind, checkfirst=True)
-    except Exception:
-        # best-effort - ignore if session/engine doesn't support get_bind
-        pass
-
-    # Check if username exists
-    if db.query(User).filter(User.username == user_data.username).first():
+    # One round-trip for both uniqueness checks (the users table is created
+    # at startup, not per request)
+    existing = (await db.execute(
+        select(User.username, User.email).where(or_(
+            User.username == user_data.username,
+            User.email == user_data.email
+        ))
+    )).all()
+    if any(row.username == user_data.username for row in existing):
         raise HTTPException(
             status_code=400,
             detail="Username already registered"
         )
-    
-    # Check if email exists
-    if db.query(User).filter(User.email == user_data.email).first():
+    if existing:
         raise HTTPException(
             status_code=400,
             detail="Email already registered"
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     db_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -85,8 +95,8 @@ async def register_user(
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
@@ -101,12 +111,19 @@ async def get_current_user_info(
 async def update_user_info(
     user_data: UserUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update current user information"""
+    # current_user may be a cached, detached copy up to JWT_CACHE_TTL old;
+    # reload the row in this session rather than merging stale columns over it
+    current_user = await db.get(User, current_user.id)
+    if current_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
     # Check if new username is taken
     if user_data.username and user_data.username != current_user.username:
-        if db.query(User).filter(User.username == user_data.username).first():
+        if (await db.execute(
+            select(User.id).where(User.username == user_data.username)
+        )).first():
             raise HTTPException(
                 status_code=400,
                 detail="Username already taken"
@@ -115,32 +132,45 @@ async def update_user_info(
     
     # Check if new email is taken
     if user_data.email and user_data.email != current_user.email:
-        if db.query(User).filter(User.email == user_data.email).first():
+        if (await db.execute(
+            select(User.id).where(User.email == user_data.email)
+        )).first():
             raise HTTPException(
                 status_code=400,
                 detail="Email already taken"
             )
         current_user.email = user_data.email
     
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
+    invalidate_user(current_user.id)
     return current_user
 
 @router.post("/users/me/change-password")
 async def change_password(
     password_data: ChangePasswordRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Change user password"""
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    # Fresh row, not the cached instance: its password_hash may be stale
+    current_user = await db.get(User, current_user.id)
+    if current_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    if not await asyncio.to_thread(
+        verify_password, password_data.current_password, current_user.password_hash
+    ):
         raise HTTPException(
             status_code=400,
             detail="Incorrect password"
         )
     
-    current_user.password_hash = get_password_hash(password_data.new_password)
-    db.commit()
+    current_user.password_hash = await asyncio.to_thread(
+        get_password_hash, password_data.new_password
+    )
+    await db.commit()
+    invalidate_user(current_user.id)
+    clear_verify_cache()
     
     return {"message": "Password updated successfully"}
 
@@ -149,28 +179,31 @@ async def list_users(
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(allow_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all users (admin only)"""
-    users = db.query(User).offset(skip).limit(limit).all()
+    users = (await db.execute(
+        select(User).offset(skip).limit(limit)
+    )).scalars().all()
     return users
 
 @router.delete("/users/{user_id}")
 async def delete_user(
     user_id: int,
     current_user: User = Depends(allow_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a user (admin only)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=404,
             detail="User not found"
         )
     
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
+    invalidate_user(user_id)
     
     return {"message": "User deleted successfully"}
 @router.post("/login")
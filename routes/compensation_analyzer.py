@@ -6,8 +6,9 @@ across gender, ethnicity, and other attributes.
 """
 
 from .fastapi import APIRouter, Depends
+import asyncio
 import random
-import datetime
+from datetime import datetime, timezone
 from .services.auth import allow_admin, get_current_user
 from .services import fairness_utils
 
@@ -20,7 +21,7 @@ router = APIRouter(prefix="/compensation", tags=["Compensation Fairness Analyzer
 
 
 @router.get('/fairness/metrics')
-def fairness_metrics(current_user = Depends(allow_admin)):
+async def fairness_metrics(current_user = Depends(allow_admin)):
     """
     Return stubbed fairness/bias metrics.
     Later: Replace with real analysis using AIF360 or Fairlearn.
@@ -29,13 +30,13 @@ def fairness_metrics(current_user = Depends(allow_admin)):
     return {
         "gender_pay_gap": round(random.uniform(0.05, 0.15), 3),  # 5-15%
         "ethnicity_pay_gap": round(random.uniform(0.08, 0.20), 3),
-        "metrics_generated_at": datetime.datetime.utcnow().isoformat(),
+        "metrics_generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "recommendation": "Investigate compensation policies for equity."
     }
 
 
 @router.get('/benchmarks')
-def benchmarks(current_user = Depends(allow_admin)):
+async def benchmarks(current_user = Depends(allow_admin)):
     """
     Return stubbed salary benchmarks by role/department.
     Later: Replace with real statistical analysis of your DB.
@@ -51,10 +52,10 @@ def benchmarks(current_user = Depends(allow_admin)):
     return {
         "benchmarks": salary_benchmarks,
         "benchmark_source": "Stub dataset",
-        "generated_at": datetime.datetime.utcnow().isoformat()
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
 
 @router.post('/analyze')
-def analyze_compensation(payload: dict, current_user = Depends(allow_admin)):
-    result = fairness_utils.analyze_pay(payload.get("data", []))
+async def analyze_compensation(payload: dict, current_user = Depends(allow_admin)):
+    result = await asyncio.to_thread(fairness_utils.analyze_pay, payload.get("data", []))
     return result
\ No newline at end of file
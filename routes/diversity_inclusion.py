@@ -7,11 +7,17 @@ detecting bias, and generating reports.
 
 from .fastapi import APIRouter
 from .typing import Dict, Any
-import datetime
+import asyncio
+from datetime import datetime, timezone
 import random
 
 router = APIRouter(prefix="/dei", tags=["Diversity & Inclusion Analytics"])
 
+# Stub ranges (key, low, high) and a private RNG, built once
+_GENDER_RANGES = (("male", 40, 60), ("female", 35, 55), ("non_binary", 0, 5))
+_ETHNICITY_RANGES = (("group_a", 20, 40), ("group_b", 15, 30), ("group_c", 10, 25), ("other", 5, 15))
+_RNG = random.Random()
+
 
 # -------------------------------
 # Endpoints
@@ -23,20 +29,12 @@ async def dei_metrics() -> Dict[str, Any]:
     Return stubbed diversity metrics.
     Later: Replace with real classification/clustering analysis.
     """
+    randint = _RNG.randint
     return {
-        "gender_distribution": {
-            "male": random.randint(40, 60),
-            "female": random.randint(35, 55),
-            "non_binary": random.randint(0, 5),
-        },
-        "ethnicity_distribution": {
-            "group_a": random.randint(20, 40),
-            "group_b": random.randint(15, 30),
-            "group_c": random.randint(10, 25),
-            "other": random.randint(5, 15),
-        },
-        "minority_representation": round(random.uniform(0.1, 0.3), 2),  # 10–30%
-        "generated_at": datetime.datetime.utcnow().isoformat(),
+        "gender_distribution": {key: randint(lo, hi) for key, lo, hi in _GENDER_RANGES},
+        "ethnicity_distribution": {key: randint(lo, hi) for key, lo, hi in _ETHNICITY_RANGES},
+        "minority_representation": round(_RNG.uniform(0.1, 0.3), 2),  # 10–30%
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
     }
 
 
@@ -50,9 +48,9 @@ async def dei_report() -> Dict[str, Any]:
     return {
         "status": "generated",
         "report_url": report_url,
-        "generated_at": datetime.datetime.utcnow().isoformat(),
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
     }
 @router.post("/analyze")
-def analyze_diversity(payload: Dict[str, Any]):
-    result = fairness_utils.analyze_diversity(payload.get("data", []))
+async def analyze_diversity(payload: Dict[str, Any]):
+    result = await asyncio.to_thread(fairness_utils.analyze_diversity, payload.get("data", []))
     return result 
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, UploadFile, File
 from typing import Dict, Any
+import asyncio
 from app.services import vllm_client, stt_utils, sentiment_utils
 
 router = APIRouter(prefix="/interview", tags=["Interview Co-pilot"])
@@ -19,7 +20,7 @@ async def stt_stream(file: UploadFile = File(...)) -> Dict[str, Any]:
 
 
 @router.post("/sentiment")
-def sentiment_analysis(payload: Dict[str, str]):
+async def sentiment_analysis(payload: Dict[str, str]):
     text = payload.get("text", "")
-    result = sentiment_utils.analyze_sentiment(text)
+    result = await asyncio.to_thread(sentiment_utils.analyze_sentiment, text)
     return result
@@ -9,11 +9,23 @@ Provides endpoints for:
 from .fastapi import APIRouter
 from .pydantic import BaseModel
 from .typing import Dict, Any, List
-import datetime
+import asyncio
+from datetime import datetime, timezone
 import random
 
 router = APIRouter(prefix="/learning", tags=["AI Learning-Path Recommender"])
 
+# Stub catalogue and a private RNG, built once instead of per request
+_ALL_COURSES = (
+    "Python for Data Science",
+    "Machine Learning Basics",
+    "Effective Communication",
+    "Leadership 101",
+    "Advanced SQL",
+    "Project Management Essentials",
+)
+_RNG = random.Random()
+
 
 # -------------------------------
 # Request Models
@@ -38,37 +50,29 @@ async def recs_hybrid(req: RecsRequest) -> Dict[str, Any]:
     Later: Replace with LightFM/implicit for CF + embeddings for content.
     """
     # Stub: pick random courses
-    all_courses = [
-        "Python for Data Science",
-        "Machine Learning Basics",
-        "Effective Communication",
-        "Leadership 101",
-        "Advanced SQL",
-        "Project Management Essentials"
-    ]
-    recommended = random.sample(all_courses, k=min(3, len(all_courses)))
+    recommended = _RNG.sample(_ALL_COURSES, k=min(3, len(_ALL_COURSES)))
 
     return {
         "user_id": req.user_id,
         "input_skills": req.skills,
         "recommended_courses": recommended,
-        "generated_at": datetime.datetime.utcnow().isoformat()
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
 
 
 @router.get("/graph/query")
-def query_graph(node: str, depth: int = 1):
+async def query_graph(node: str, depth: int = 1):
     graph = graph_utils.get_graph()
-    return graph.query_related(node, depth)
+    return await asyncio.to_thread(graph.query_related, node, depth)
 
 
 @router.get("/graph/export")
-def export_graph():
+async def export_graph():
     graph = graph_utils.get_graph()
-    return graph.export_graph()
+    return await asyncio.to_thread(graph.export_graph)
 
 
 @router.get("/recs/hybrid")
-def hybrid_recs(user_id: str, top_k: int = 5):
+async def hybrid_recs(user_id: str, top_k: int = 5):
     recommender = recommender_utils.get_recommender()
-    return {"recommendations": recommender.recommend(user_id, top_k)}
\ No newline at end of file
+    return {"recommendations": await asyncio.to_thread(recommender.recommend, user_id, top_k)}
\ No newline at end of file
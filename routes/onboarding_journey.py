@@ -9,7 +9,7 @@ Provides endpoints for:
 from .fastapi import APIRouter
 from .pydantic import BaseModel
 from .typing import Dict, Any, List
-import datetime
+from datetime import datetime, timezone
 import random
 
 # Stub: replace later with vLLM or LangChain integration
@@ -53,5 +53,5 @@ async def trigger_workflow(req: WorkflowRequest) -> Dict[str, Any]:
         "user_id": req.user_id,
         "workflow_step": req.step,
         "status": "triggered",
-        "triggered_at": datetime.datetime.utcnow().isoformat()
+        "triggered_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
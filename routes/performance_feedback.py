@@ -9,7 +9,7 @@ Provides endpoints for:
 from .fastapi import APIRouter
 from .pydantic import BaseModel
 from .typing import Dict, Any
-import datetime
+from datetime import datetime, timezone
 
 # Stub: replace later with real vLLM or fine-tuned LLM calls
 from .services import vllm_client
@@ -55,7 +55,7 @@ async def generate_feedback(req: FeedbackRequest) -> Dict[str, Any]:
         "employee_id": req.employee_id,
         "tone": req.tone,
         "feedback": feedback_text,
-        "generated_at": datetime.datetime.utcnow().isoformat()
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
 
 
@@ -76,5 +76,5 @@ async def adjust_tone(req: AdjustToneRequest) -> Dict[str, Any]:
         "original_text": req.text,
         "adjusted_tone": req.tone,
         "adjusted_text": adjusted_text,
-        "adjusted_at": datetime.datetime.utcnow().isoformat()
+        "adjusted_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
@@ -1,14 +1,19 @@
 """
 Resume endpoints for HR AI Platform
 """
+import asyncio
 import os
 from typing import List
-import PyPDF2
+import numpy as np
 from fastapi import APIRouter, File, UploadFile, HTTPException, Depends, Query
+from app.utils.orjson_response import ORJSONResponse
 from .. import db
 from ..models import User, Resume, Job, JobMatch
-from ..services import embedding_service, skill_extractor, qdrant_utils
+from ..services import embedding_service, job_embeddings, qdrant_utils
 from ..services.auth import get_current_user
+from ..services.job_index import parse_skills, skill_mask, mask_to_skills
+from ..services.file_upload import copy_to_path
+from ..services.pdf_utils import extract_pdf_pages
 
 router = APIRouter(prefix="/resume", tags=["Resume"])
 
@@ -25,43 +30,32 @@ async def upload_resume(
     
     # Save file
     file_path = f"uploads/resumes/{current_user.id}_{file.filename}"
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "wb") as buffer:
-        buffer.write(await file.read())
+    # Copy the spooled upload to disk (sendfile when it was spooled to disk)
+    # on a worker thread instead of reading it into memory on the event loop
+    await asyncio.to_thread(copy_to_path, file.file, file_path)
     
-    # Extract text from .PDF
+    # Extract text page by page (native PDFium call, off the event loop)
     if file.filename.endswith(".pdf"):
-        with open(file_path, "rb") as pdf_file:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            resume_text = ""
-            for page in pdf_reader.pages:
-                resume_text += page.extract_text()
+        pages = await asyncio.to_thread(extract_pdf_pages, file_path)
     else:
         # For doc/docx files you would need to implement text extraction
-        resume_text = "Text extraction not implemented for this file type"
+        pages = ["Text extraction not implemented for this file type"]
+    resume_text = "\n".join(pages)
     
-    # Extract skills and generate embedding
-    skills = skill_extractor.extract_skills(resume_text)
-    vector = embedding_service.embed_text(resume_text)
+    # Extract skills and generate embedding together, off the event loop
+    vector, skills = await asyncio.to_thread(embedding_service.embed_and_extract, pages)
     
     # Store in database
-    conn = db.get_db_connection()
-    cursor = conn.cursor()
     query = """
         INSERT INTO resumes (user_id, resume_text, skills, vector_embedding)
         VALUES (%s, %s, %s, %s)
     """
-    cursor.execute(query, (
+    resume_id = await db.aexecute_query(query, (
         current_user.id,
         resume_text,
         ",".join(skills),
-        vector.tobytes().hex()  # Convert vector to hex string
+        embedding_service.pack_embedding(vector)  # float32 scale + int8 components
     ))
-    resume_id = cursor.lastrowid
-    conn.commit()
-    
-    cursor.close()
-    db.close_db_connection(conn)
     
     return {
         'id': resume_id,
@@ -72,13 +66,8 @@ async def upload_resume(
 @router.get("/my-resumes", response_model=List[dict])
 async def get_my_resumes(current_user: User = Depends(get_current_user)):
     """Get all resumes for current user"""
-    conn = db.get_db_connection()
-    cursor = conn.cursor()
     query = "SELECT * FROM resumes WHERE user_id = %s"
-    cursor.execute(query, (current_user.id,))
-    resumes = cursor.fetchall()
-    cursor.close()
-    db.close_db_connection(conn)
+    resumes = await db.aexecute_query(query, (current_user.id,))
     
     return [{
         'id': resume[0],
@@ -93,94 +82,124 @@ async def match_resume(
     current_user: User = Depends(get_current_user)
 ):
     """Match a resume with available jobs"""
-    conn = db.get_db_connection()
-    cursor = conn.cursor()
-    
+    async with db.get_async_connection() as conn:
+        # One explicit transaction for all job_matches inserts
+        await conn.begin()
+        try:
+            async with conn.cursor() as cursor:
+                matches = await _match_resume_jobs(cursor, resume_id, current_user.id, top_k)
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            raise
+    
+    # Skip FastAPI's jsonable_encoder walk over the match list
+    return ORJSONResponse(matches)
+
+def _resume_vector(raw) -> np.ndarray:
+    """
+    Decode a stored resume embedding. Cosine similarity ignores the int8
+    scale, so the quantized components are compared as-is.
+    """
+    _, q = embedding_service.unpack_embedding(raw)
+    return q.astype(np.float32)
+
+async def _search_jobs(resume_vec: np.ndarray, top_k: int) -> List[tuple]:
+    """top_k (score, (id, title, description, required_skills)) from the Qdrant HNSW index"""
+    hits = await asyncio.to_thread(
+        qdrant_utils.search_vector, qdrant_utils.JOBS_COLLECTION, resume_vec.tolist(), top_k
+    )
+    return [
+        (hit["score"], (
+            hit["payload"]["job_id"],
+            hit["payload"].get("title"),
+            hit["payload"].get("description"),
+            hit["payload"].get("required_skills")
+        ))
+        for hit in hits
+    ]
+
+async def _scan_jobs(cursor, resume_vec: np.ndarray, top_k: int) -> List[tuple]:
+    """Fallback: score the memory-mapped job embedding matrix, then fetch only the winners"""
+    hits = job_embeddings.top_k(resume_vec, top_k)
+    if not hits:
+        return []
+
+    placeholders = ", ".join(["%s"] * len(hits))
+    query = f"SELECT id, title, description, required_skills FROM jobs WHERE id IN ({placeholders})"
+    await cursor.execute(query, tuple(job_id for job_id, _ in hits))
+    jobs = {job[0]: job for job in await cursor.fetchall()}
+    return [(score, jobs[job_id]) for job_id, score in hits if job_id in jobs]
+
+async def _match_resume_jobs(cursor, resume_id: int, user_id: int, top_k: int) -> List[dict]:
+    """Find the top_k jobs for the resume and record the matches"""
     # Get resume
-    query = "SELECT * FROM resumes WHERE id = %s AND user_id = %s"
-    cursor.execute(query, (resume_id, current_user.id))
-    resume = cursor.fetchone()
+    query = "SELECT skills, vector_embedding FROM resumes WHERE id = %s AND user_id = %s"
+    await cursor.execute(query, (resume_id, user_id))
+    resume = await cursor.fetchone()
     
     if not resume:
-        cursor.close()
-        db.close_db_connection(conn)
         raise HTTPException(status_code=404, detail="Resume not found")
-    
-    # Get all jobs
-    query = "SELECT * FROM jobs"
-    cursor.execute(query)
-    jobs = cursor.fetchall()
-    
+
+    # ANN search over the job index; scan the mapped job embedding matrix
+    # only if Qdrant is unreachable or not populated yet
+    resume_vec = _resume_vector(resume[1])
+    try:
+        candidates = await _search_jobs(resume_vec, top_k)
+    except Exception as e:
+        print(f"Warning: Qdrant job search failed: {e}; scanning job embeddings.")
+        candidates = []
+    if not candidates:
+        candidates = await _scan_jobs(cursor, resume_vec, top_k)
+    if not candidates:
+        return []
+
+    resume_mask = skill_mask(parse_skills(resume[0]))
+
+    # Skill overlap and inserts only for the k returned jobs
+    query = """
+        INSERT INTO job_matches (job_id, resume_id, match_score, skills_matched)
+        VALUES (%s, %s, %s, %s)
+    """
     matches = []
-    for job in jobs:
-        # Calculate similarity score
-        similarity = embedding_service.calculate_similarity(
-            resume[4],  # vector_embedding
-            job[3]     # description
-        )
-        
-        # Calculate skill overlap
-        resume_skills = set(resume[3].split(","))
-        job_skills = set(job[5].split(","))  # required_skills
-        skill_overlap = len(resume_skills.intersection(job_skills))
-        skill_overlap_score = skill_overlap / len(job_skills) if job_skills else 0
-        
-        # Store match in database
-        query = """
-            INSERT INTO job_matches (job_id, resume_id, match_score, skills_matched)
-            VALUES (%s, %s, %s, %s)
-        """
-        cursor.execute(query, (
-            job[0],  # job_id
-            resume_id,
-            similarity,
-            ",".join(resume_skills.intersection(job_skills))
-        ))
-        
+    rows = []
+    for similarity, job in candidates:
+        similarity = float(similarity)
+        job_skills = parse_skills(job[3])  # required_skills
+        job_mask = skill_mask(job_skills)
+        matching = mask_to_skills(job_mask & resume_mask)
+        skill_overlap_score = len(matching) / job_mask.bit_count() if job_mask else 0
+
+        rows.append((job[0], resume_id, similarity, ",".join(matching)))
         matches.append({
             "job": {
                 "id": job[0],
                 "title": job[1],
-                "description": job[3],
-                "required_skills": list(job_skills)
+                "description": job[2],
+                "required_skills": job_skills
             },
-            "match_score": float(similarity),
+            "match_score": similarity,
             "skill_overlap_score": float(skill_overlap_score),
-            "matching_skills": list(resume_skills.intersection(job_skills)),
-            "missing_skills": list(job_skills - resume_skills)
+            "matching_skills": matching,
+            "missing_skills": mask_to_skills(job_mask & ~resume_mask)
         })
+    await cursor.executemany(query, rows)
     
-    conn.commit()
-    cursor.close()
-    db.close_db_connection(conn)
-    
-    # Sort matches by score
-    matches.sort(key=lambda x: x["match_score"], reverse=True)
-    
-    return matches[:top_k]
+    return matches
 
 @router.delete("/{resume_id}")
 async def delete_resume(resume_id: int, current_user: User = Depends(get_current_user)):
     """Delete a resume"""
-    conn = db.get_db_connection()
-    cursor = conn.cursor()
-    
     # Get resume
-    query = "SELECT * FROM resumes WHERE id = %s AND user_id = %s"
-    cursor.execute(query, (resume_id, current_user.id))
-    resume = cursor.fetchone()
+    query = "SELECT id FROM resumes WHERE id = %s AND user_id = %s"
+    resume = await db.aexecute_query(query, (resume_id, current_user.id))
     
     if not resume:
-        cursor.close()
-        db.close_db_connection(conn)
         raise HTTPException(status_code=404, detail="Resume not found")
     
     # Delete from .database
     query = "DELETE FROM resumes WHERE id = %s"
-    cursor.execute(query, (resume_id,))
-    conn.commit()
-    cursor.close()
-    db.close_db_connection(conn)
+    await db.aexecute_query(query, (resume_id,))
     
     # Delete associated file
     file_path = f"uploads/resumes/{current_user.id}_{resume_id}"
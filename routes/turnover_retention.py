@@ -9,12 +9,23 @@ Provides endpoints for:
 from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import Dict, Any, List
-import datetime
-import random
+from datetime import datetime, timezone
+import numpy as np
 from app.services import churn_model
+from app.utils.orjson_response import ORJSONResponse
 
 router = APIRouter(prefix="/turnover", tags=["Predictive Turnover & Retention Bot"])
 
+_rng = np.random.default_rng()
+
+RETENTION_STRATEGIES = (
+    "Offer career development opportunities",
+    "Review compensation package",
+    "Assign a mentor",
+    "Improve work-life balance policies",
+    "Conduct regular check-ins"
+)
+
 
 # -------------------------------
 # Request Models
@@ -46,21 +57,27 @@ async def predict_batch(req: BatchPredictRequest) -> Dict[str, Any]:
     """
     Predict turnover risk for a batch of employees (stub).
     """
-    results = []
-    for emp in req.employees:
-        risk_score = round(random.uniform(0.0, 1.0), 3)
-        risk_label = "high" if risk_score > 0.7 else "medium" if risk_score > 0.4 else "low"
-        results.append({
+    employees = req.employees
+    # Fake scores for the whole batch at once. A real model replaces only
+    # this line, scoring the stacked feature matrix in one call.
+    scores = _rng.random(len(employees)).round(3)
+    labels = np.where(scores > 0.7, "high", np.where(scores > 0.4, "medium", "low"))
+
+    results = [
+        {
             "employee_id": emp.employee_id,
-            "risk_score": risk_score,
-            "risk_label": risk_label
-        })
+            "risk_score": score,
+            "risk_label": label
+        }
+        for emp, score, label in zip(employees, scores, labels)
+    ]
 
-    return {
+    # Returned as-is so orjson writes the numpy scalars without .tolist()
+    return ORJSONResponse({
         "total_employees": len(req.employees),
         "predictions": results,
-        "predicted_at": datetime.datetime.utcnow().isoformat()
-    }
+        "predicted_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
+    })
 
 
 @router.get("/recommendations/{employee_id}")
@@ -69,17 +86,11 @@ async def retention_recommendations(employee_id: str) -> Dict[str, Any]:
     Recommend retention strategies for an employee (stub).
     Later: Replace with rules-based + ML-driven strategies.
     """
-    strategies = [
-        "Offer career development opportunities",
-        "Review compensation package",
-        "Assign a mentor",
-        "Improve work-life balance policies",
-        "Conduct regular check-ins"
-    ]
-    selected = random.sample(strategies, k=2)
+    picks = _rng.choice(len(RETENTION_STRATEGIES), size=2, replace=False)
+    selected = [RETENTION_STRATEGIES[i] for i in picks]
 
     return {
         "employee_id": employee_id,
         "recommendations": selected,
-        "generated_at": datetime.datetime.utcnow().isoformat()
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
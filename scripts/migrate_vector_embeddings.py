@@ -0,0 +1,47 @@
+"""
+Migrate resumes.vector_embedding from the old text encodings (base64 / JSON
+list) to the BLOB column used by db.models: a float32 scale followed by the
+int8 components (embedding_service.pack_embedding).
+
+Reads DATABASE_URL from the environment.
+
+Run:
+    python scripts/migrate_vector_embeddings.py
+"""
+import sys
+from pathlib import Path
+from sqlalchemy import text
+
+# Add the project root to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from db.database import engine  # noqa: E402
+from services.embedding_service import (  # noqa: E402
+    pack_embedding, unpack_embedding, dequantize_int8
+)
+
+
+def main():
+    dialect = engine.dialect.name
+    print('Migrating resumes.vector_embedding on', dialect)
+
+    with engine.begin() as conn:
+        rows = conn.execute(text(
+            "SELECT id, vector_embedding FROM resumes WHERE vector_embedding IS NOT NULL"
+        )).fetchall()
+        decoded = [(r[0], unpack_embedding(r[1])) for r in rows]
+
+        if dialect == 'mysql':
+            conn.execute(text("ALTER TABLE resumes MODIFY COLUMN vector_embedding BLOB"))
+        params = [
+            {'id': rid, 'v': pack_embedding(dequantize_int8(scale, q))}
+            for rid, (scale, q) in decoded if q.size
+        ]
+        if params:
+            conn.execute(text("UPDATE resumes SET vector_embedding = :v WHERE id = :id"), params)
+
+    print(f'Migrated {len(params)} embeddings.')
+
+
+if __name__ == '__main__':
+    main()
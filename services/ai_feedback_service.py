@@ -2,7 +2,46 @@ from .typing import List, Dict, Any
 import numpy as np
 from .services.nlp_service import NLPService
 from .services.learning_service import LearningService
-from .sklearn.metrics.pairwise import cosine_similarity
+
+# Role skills whose best match is at or below this are reported as gaps
+SKILL_MATCH_THRESHOLD = 0.8
+
+
+def _unit_rows(mat) -> np.ndarray:
+    """float32 copy of mat with each row scaled to unit length (zero rows stay zero)."""
+    mat = np.asarray(mat, dtype=np.float32)
+    norms = np.linalg.norm(mat, axis=-1, keepdims=True)
+    return mat / np.where(norms > 0, norms, 1.0)
+
+
+def _best_matches(sim):
+    """Per column of sim [n_current, n_role]: row index and value of the best match."""
+    n_current, n_role = sim.shape
+    best_idx = np.zeros(n_role, dtype=np.int64)
+    best_val = np.zeros(n_role, dtype=np.float32)
+    for j in prange(n_role):
+        idx = 0
+        val = sim[0, j]
+        for i in range(1, n_current):
+            if sim[i, j] > val:
+                idx = i
+                val = sim[i, j]
+        best_idx[j] = idx
+        best_val[j] = val
+    return best_idx, best_val
+
+
+try:
+    from numba import njit, prange
+
+    # Columns are independent, so they run in parallel; compiled eagerly at import
+    _best_matches_nb = njit(
+        "Tuple((int64[:], float32[:]))(float32[:, :])", cache=True, parallel=True
+    )(_best_matches)
+except ImportError:
+    prange = range
+    _best_matches_nb = _best_matches
+
 
 class AIFeedbackService:
     """
@@ -15,6 +54,13 @@ class AIFeedbackService:
     def __init__(self):
         self.nlp_service = NLPService()
         self.learning_service = LearningService()
+        # Unit-normalized path embeddings [P, d], rebuilt when the path texts change
+        self._path_texts = None
+        self._path_matrix = None
+
+    def warmup(self):
+        """Load the underlying NLP models up front (call at startup)"""
+        self.nlp_service.warmup()
         
     def analyze_performance_review(self, review_text: str) -> Dict[str, Any]:
         """
@@ -36,7 +82,7 @@ class AIFeedbackService:
         return {
             'sentiment': sentiment,
             'entities': entities,
-            'embedding': embedding.tolist()
+            'embedding': embedding
         }
         
     def recommend_learning_path(self, user_profile: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -56,30 +102,34 @@ class AIFeedbackService:
         # Get all available learning paths
         all_paths = self.learning_service.get_all_paths()
         
-        # Calculate similarity scores
-        scores = []
-        user_embedding = self.nlp_service.get_embedding(
+        if not all_paths:
+            return []
+
+        # Cosine scores for every path in one (P, d) @ (d,) product
+        user_embedding = _unit_rows(self.nlp_service.get_embedding(
             ' '.join(current_skills + career_goals)
-        )
-        
-        for path in all_paths:
-            path_embedding = self.nlp_service.get_embedding(
-                f"{path['title']} {path['description']} {' '.join(path['skills'])}"
-            )
-            similarity = cosine_similarity(
-                user_embedding.reshape(1, -1),
-                path_embedding.reshape(1, -1)
-            )[0][0]
-            scores.append((path, similarity))
-            
-        # Sort by similarity score
-        scores.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top recommendations
+        ))
+        scores = self._get_path_matrix(all_paths) @ user_embedding
+
+        # Top 5 without sorting every path
+        k = min(5, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
         return [
-            {**path, 'relevance_score': score}
-            for path, score in scores[:5]
+            {**all_paths[i], 'relevance_score': float(scores[i])}
+            for i in top
         ]
+
+    def _get_path_matrix(self, all_paths: List[Dict[str, Any]]) -> np.ndarray:
+        """Embed the learning paths, reusing the cached matrix while their texts are unchanged"""
+        texts = tuple(
+            f"{path['title']} {path['description']} {' '.join(path['skills'])}"
+            for path in all_paths
+        )
+        if texts != self._path_texts:
+            self._path_matrix = _unit_rows(self.nlp_service.get_embedding_batch(list(texts)))
+            self._path_texts = texts
+        return self._path_matrix
         
     def identify_skill_gaps(
         self, 
@@ -92,32 +142,32 @@ class AIFeedbackService:
         # Get required skills for target role
         role_skills = self.learning_service.get_role_skills(target_role)
         
-        # Convert to embeddings
-        current_embeddings = np.array([
-            self.nlp_service.get_embedding(skill)
-            for skill in current_skills
-        ])
-        
-        role_embeddings = np.array([
-            self.nlp_service.get_embedding(skill)
-            for skill in role_skills
-        ])
-        
-        # Calculate similarities
-        similarities = cosine_similarity(current_embeddings, role_embeddings)
-        
-        # Identify gaps (skills with no close match)
-        gaps = []
-        for i, skill in enumerate(role_skills):
-            if not any(similarities[:, i] > 0.8):  # Threshold for similarity
-                gaps.append({
-                    'skill': skill,
+        if not role_skills:
+            gaps = []
+        elif not current_skills:
+            gaps = [
+                {'skill': skill, 'importance': 'High', 'closest_match': None, 'similarity_score': 0.0}
+                for skill in role_skills
+            ]
+        else:
+            # One model call for both skill lists
+            embeddings = _unit_rows(
+                self.nlp_service.get_embedding_batch(list(current_skills) + list(role_skills))
+            )
+            n_current = len(current_skills)
+            similarities = np.ascontiguousarray(embeddings[:n_current] @ embeddings[n_current:].T)
+            best_idx, best_val = _best_matches_nb(similarities)
+
+            # Identify gaps (skills with no close match)
+            gaps = [
+                {
+                    'skill': role_skills[j],
                     'importance': 'High',
-                    'closest_match': current_skills[
-                        similarities[:, i].argmax()
-                    ] if len(current_skills) > 0 else None,
-                    'similarity_score': similarities[:, i].max()
-                })
+                    'closest_match': current_skills[best_idx[j]],
+                    'similarity_score': float(best_val[j])
+                }
+                for j in np.flatnonzero(best_val <= SKILL_MATCH_THRESHOLD)
+            ]
                 
         return {
             'gaps': gaps,
@@ -5,8 +5,12 @@ Anomaly detection utilities for Attendance Anomaly Detector.
 - Streaming anomaly detection (stub, later with River)
 """
 
+import os
+import random
+
+import joblib
 import numpy as np
-from .typing import List, Dict, Any
+from .typing import List, Dict, Any, Optional, Union
 
 try:
     from .pyod.models.iforest import IForest
@@ -14,6 +18,9 @@ try:
 except ImportError:
     _pyod_available = False
 
+MODEL_DIR = os.getenv("MODEL_DIR", "models")
+IFOREST_PATH = os.path.join(MODEL_DIR, "iforest.joblib")
+
 
 # -------------------------------
 # Batch Anomaly Detection
@@ -23,25 +30,76 @@ class BatchAnomalyDetector:
     Wrapper for PyOD Isolation Forest anomaly detection.
     """
 
-    def __init__(self, contamination: float = 0.1):
+    def __init__(self, contamination: float = 0.1, model: Optional[Any] = None):
         if not _pyod_available:
             raise ImportError("PyOD not installed. Install with `pip install pyod`.")
-        self.model = IForest(contamination=contamination, random_state=42)
+        if model is not None:
+            # Already fitted (see load); score without refitting
+            self.model = model
+            self.fitted = True
+            return
+        self.fitted = False
+        # 256-sample subtrees as in the original Isolation Forest paper;
+        # trees are built and scored on all cores
+        self.model = IForest(
+            contamination=contamination, max_samples=256, n_jobs=-1, random_state=42
+        )
+
+    @classmethod
+    def load(cls, path: str = IFOREST_PATH) -> "BatchAnomalyDetector":
+        """Detector around a model saved by fit(); arrays are memory-mapped."""
+        return cls(model=joblib.load(path, mmap_mode="r"))
+
+    def _as_matrix(self, features: Union[np.ndarray, List[List[float]]]) -> np.ndarray:
+        """
+        Contiguous float32 view of `features`. A C-contiguous float32 ndarray
+        passes through without a copy, so convert once and pass that array
+        when calling several methods on the same data.
+        """
+        return np.ascontiguousarray(features, dtype=np.float32)
+
+    def fit(self, features: Union[np.ndarray, List[List[float]]], path: str = IFOREST_PATH) -> "BatchAnomalyDetector":
+        """
+        Fit the model and save it to `path` so later detectors score
+        without refitting.
+        """
+        self.model.fit(self._as_matrix(features))
+        self.fitted = True
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        joblib.dump(self.model, path)
+        return self
+
+    def predict(self, features: Union[np.ndarray, List[List[float]]]) -> List[int]:
+        """
+        Score with the fitted model only (no refit).
+        0 = normal, 1 = anomaly
+        """
+        if not self.fitted:
+            raise RuntimeError("Anomaly model not fitted or loaded.")
+        return self.model.predict(self._as_matrix(features)).tolist()
+
+    def score(self, features: Union[np.ndarray, List[List[float]]]) -> List[float]:
+        """Anomaly scores from the fitted model (higher = more anomalous)."""
+        if not self.fitted:
+            raise RuntimeError("Anomaly model not fitted or loaded.")
+        return self.model.decision_function(self._as_matrix(features)).tolist()
 
-    def fit_predict(self, features: List[List[float]]) -> List[int]:
+    def fit_predict(self, features: Union[np.ndarray, List[List[float]]]) -> List[int]:
         """
-        Fit anomaly model and return predictions.
+        Fit anomaly model and return predictions (training only: refits
+        on every call; serve with fit() once, then predict()).
         0 = normal, 1 = anomaly
         """
-        X = np.array(features)
+        X = self._as_matrix(features)
         preds = self.model.fit_predict(X)
+        self.fitted = True
         return preds.tolist()
 
-    def anomaly_scores(self, features: List[List[float]]) -> List[float]:
+    def anomaly_scores(self, features: Union[np.ndarray, List[List[float]]]) -> List[float]:
         """
         Return anomaly scores (higher = more anomalous).
         """
-        X = np.array(features)
+        X = self._as_matrix(features)
         scores = self.model.decision_function(X)
         return scores.tolist()
 
@@ -57,17 +115,25 @@ class StreamAnomalyDetector:
 
     def __init__(self):
         self.count = 0
+        # One 64-bit draw serves the next 64 updates
+        self._bits = 0
+        self._n = 0
 
     def update(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process a new record (stub).
         Returns anomaly flag randomly for now.
         """
-        import random
+        if self._n == 0:
+            self._bits = random.getrandbits(64)
+            self._n = 64
+        flag = self._bits & 1
+        self._bits >>= 1
+        self._n -= 1
         self.count += 1
         return {
             "record": record,
-            "anomaly_detected": bool(random.getrandbits(1)),
+            "anomaly_detected": bool(flag),
             "processed_count": self.count
         }
 
@@ -77,8 +143,11 @@ class StreamAnomalyDetector:
 # -------------------------------
 def get_batch_detector() -> BatchAnomalyDetector:
     """
-    Get a batch anomaly detector (IsolationForest).
+    Get a batch anomaly detector (IsolationForest), already fitted when a
+    saved model exists.
     """
+    if os.path.exists(IFOREST_PATH):
+        return BatchAnomalyDetector.load()
     return BatchAnomalyDetector()
 
 
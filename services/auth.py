@@ -2,13 +2,26 @@
 Security utilities for authentication and authorization
 """
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+import hashlib
+import hmac
 import os
+import threading
+import time
+
+from cachetools import TTLCache
 
 from fastapi import Depends, HTTPException, Header
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_500_INTERNAL_SERVER_ERROR
-from jose import jwt, JWTError
-from jose.exceptions import ExpiredSignatureError
+
+# PyJWT when installed (bytes key); python-jose otherwise
+try:
+    import jwt as pyjwt
+    from jwt.exceptions import ExpiredSignatureError, InvalidTokenError as JWTError
+except ImportError:
+    pyjwt = None
+    from jose import jwt, JWTError
+    from jose.exceptions import ExpiredSignatureError
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 
@@ -19,25 +32,106 @@ from app.db.database import get_db
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret-change-me")
 JWT_ALGO = os.getenv("JWT_ALGO", "HS256")
-
-
-# Use passlib CryptContext with bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Encoded once instead of on every sign/verify
+_SECRET = JWT_SECRET.encode("utf-8")
+
+# sha256(token) -> (user, valid_until). Skips jwt.decode and the user lookup
+# for a token seen within the last JWT_CACHE_TTL seconds; entries never
+# outlive the token's own exp claim.
+JWT_CACHE_TTL = int(os.getenv("JWT_CACHE_TTL", "5"))
+_jwt_cache = TTLCache(maxsize=int(os.getenv("JWT_CACHE_SIZE", "10000")), ttl=JWT_CACHE_TTL)
+_jwt_cache_lock = threading.Lock()
+
+
+# New hashes use argon2id; bcrypt hashes still verify and are upgraded on the
+# next successful login (see verify_and_update_password)
+PASSWORD_SCHEME = os.getenv("PASSWORD_SCHEME", "argon2")
+# bcrypt cost factor: each +1 doubles hash time (12 is ~250ms, 10 ~60ms)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# argon2id cost: passes, KiB of memory, lanes
+ARGON2_TIME = int(os.getenv("ARGON2_TIME", "2"))
+ARGON2_MEM = int(os.getenv("ARGON2_MEM", "65536"))
+ARGON2_PAR = int(os.getenv("ARGON2_PAR", "2"))
+
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    default=PASSWORD_SCHEME,
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    argon2__type="ID",
+    argon2__time_cost=ARGON2_TIME,
+    argon2__memory_cost=ARGON2_MEM,
+    argon2__parallelism=ARGON2_PAR
+)
+
+
+# Recent verification outcomes keyed by HMAC(JWT_SECRET, plain) + hash, so hot
+# credentials skip the argon2/bcrypt work. No raw passwords are stored. Trade-off:
+# a result can be up to VERIFY_CACHE_TTL seconds stale, so password changes
+# call clear_verify_cache().
+VERIFY_CACHE_TTL = int(os.getenv("VERIFY_CACHE_TTL", "60"))
+_verify_cache = TTLCache(maxsize=int(os.getenv("VERIFY_CACHE_SIZE", "5000")), ttl=VERIFY_CACHE_TTL)
+_verify_cache_lock = threading.Lock()
+
+
+def _verify_key(plain_password: str, hashed_password: str) -> bytes:
+    digest = hmac.new(_SECRET, plain_password.encode("utf-8"), "sha256").digest()
+    return digest + hashed_password.encode("utf-8")
+
+
+def clear_verify_cache():
+    """Forget cached verification results (call after a password change)."""
+    with _verify_cache_lock:
+        _verify_cache.clear()
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
+    """Hash a password with the default scheme (argon2id)."""
     return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plaintext password against a bcrypt hash."""
+    """Verify a plaintext password against an argon2 or bcrypt hash."""
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        key = _verify_key(plain_password, hashed_password)
+        with _verify_cache_lock:
+            cached = _verify_cache.get(key)
+        if cached is not None:
+            return cached
+        ok = pwd_context.verify(plain_password, hashed_password)
+        with _verify_cache_lock:
+            _verify_cache[key] = ok
+        return ok
     except Exception:
         return False
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, when its hash uses a deprecated scheme or
+    outdated cost, also return a fresh hash to store (else None).
+    """
+    try:
+        if not pwd_context.needs_update(hashed_password):
+            # Current-scheme hash: nothing to upgrade, so the cached path applies
+            return verify_password(plain_password, hashed_password), None
+        return pwd_context.verify_and_update(plain_password, hashed_password)
+    except Exception:
+        return False, None
+
+
+def _jwt_encode(claims: Dict[str, Any]) -> str:
+    if pyjwt is not None:
+        return pyjwt.encode(claims, _SECRET, algorithm=JWT_ALGO)
+    return jwt.encode(claims, JWT_SECRET, algorithm=JWT_ALGO)
+
+
+def _jwt_decode(token: str) -> Dict[str, Any]:
+    if pyjwt is not None:
+        return pyjwt.decode(token, _SECRET, algorithms=[JWT_ALGO])
+    return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGO])
+
+
 def create_access_token(subject: Optional[str] = None, data: Optional[Dict[str, Any]] = None, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token. Accepts either a subject string or a data dict.
@@ -54,37 +148,80 @@ def create_access_token(subject: Optional[str] = None, data: Optional[Dict[str,
         to_encode = {"sub": str(subject)}
     else:
         to_encode = dict(data)
+        if "sub" in to_encode:
+            # Always a string, as the JWT spec expects
+            to_encode["sub"] = str(to_encode["sub"])
 
     # add expiry claim
     to_encode["exp"] = int(expire.timestamp())
-    token = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGO)
+    token = _jwt_encode(to_encode)
     return token
 
 
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def invalidate_token(token: str):
+    """Drop a token's cached user (e.g. on logout)."""
+    with _jwt_cache_lock:
+        _jwt_cache.pop(_token_key(token), None)
+
+
+def invalidate_user(user_id: int):
+    """Drop every cached token of a user (after profile, password or account changes)."""
+    with _jwt_cache_lock:
+        stale = [k for k, (user, _) in list(_jwt_cache.items()) if user.id == user_id]
+        for k in stale:
+            _jwt_cache.pop(k, None)
+
+
 def get_current_user(authorization: str = Header(None), db: Session = Depends(get_db)) -> Optional[User]:
     if not authorization:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Missing Authorization header")
     if not authorization.startswith("Bearer "):
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid token scheme")
     token = authorization.split(" ", 1)[1]
+
+    key = _token_key(token)
+    now = time.time()
+    with _jwt_cache_lock:
+        hit = _jwt_cache.get(key)
+    if hit is not None:
+        user, valid_until = hit
+        if now < valid_until:
+            # Detached instance; routes that write merge it into their own session
+            return user
+        invalidate_token(token)
+        raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Token has expired")
+
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGO])
+        payload = _jwt_decode(token)
     except ExpiredSignatureError:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Token has expired")
     except JWTError:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user_id = payload.get("sub") or payload.get("user_id")
-    if not user_id:
+    sub = payload.get("sub")
+    if sub is None:
+        # Legacy tokens created from a data dict without "sub"
+        sub = payload.get("user_id")
+    try:
+        user_id = int(sub)
+    except (TypeError, ValueError):
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
     try:
-        user = db.query(User).filter(User.id == int(user_id)).first()
+        # Primary-key lookup: served from the session's identity map when loaded
+        user = db.get(User, user_id)
         if not user:
             # Explicitly raise instead of returning None so routes depending on
             # a User object receive a proper HTTP 401/404 instead of causing
             # a 500 when Pydantic attempts to serialize None to UserResponse.
             raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="User not found")
+        exp = payload.get("exp")
+        with _jwt_cache_lock:
+            _jwt_cache[key] = (user, float(exp) if exp is not None else now + JWT_CACHE_TTL)
         return user
     except Exception as e:
         # For token validation flows we prefer returning 401 so callers
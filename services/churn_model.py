@@ -7,19 +7,39 @@ Churn (Turnover) Prediction Model Service.
 """
 
 import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import joblib
 
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report
 from xgboost import XGBClassifier
 
+try:
+    import treelite
+    import tl2cgen
+except ImportError:  # optional: compiled tree predictor
+    treelite = None
+    tl2cgen = None
+
 # -------------------------------
 # Paths
 # -------------------------------
 MODEL_DIR = os.getenv("MODEL_DIR", "models")
 MODEL_PATH = os.path.join(MODEL_DIR, "churn_model.joblib")
+COMPILED_PATH = os.path.join(MODEL_DIR, "churn.so")
+
+# Churn probability above 0.4 is medium risk, above 0.7 high
+RISK_BINS = np.array([0.4, 0.7], dtype=np.float32)
+RISK_LABELS = np.array(["low", "medium", "high"])
+
+# Micro-batching of concurrent single-row predicts (predict_async)
+MAX_BATCH = int(os.getenv("CHURN_MAX_BATCH", "256"))
+BATCH_WINDOW = float(os.getenv("CHURN_BATCH_WINDOW_MS", "2")) / 1000
 
 # Ensure model directory exists
 os.makedirs(MODEL_DIR, exist_ok=True)
@@ -29,10 +49,84 @@ os.makedirs(MODEL_DIR, exist_ok=True)
 # Churn Model Service
 # -------------------------------
 class ChurnModelService:
-    def __init__(self):
+    def __init__(self, lazy: bool = True):
         self.model = None
-        if os.path.exists(MODEL_PATH):
-            self.model = joblib.load(MODEL_PATH)
+        self._booster = None
+        self._predictor = None
+        # Input width of the loaded model (set with the model)
+        self.n_features: Optional[int] = None
+        # The saved model is read on first predict (see _ensure_loaded)
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        # Reused batch buffer, sized to the model's width by the worker
+        self._buffer: Optional[np.ndarray] = None
+        if not lazy:
+            self._ensure_loaded()
+
+    def _ensure_loaded(self):
+        """Load the saved model once per process."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            if self.model is None and os.path.exists(MODEL_PATH):
+                self._set_model(joblib.load(MODEL_PATH))
+                self._load_predictor()
+            self._loaded = True
+
+    def _set_model(self, model):
+        self.model = model
+        # The raw booster predicts straight from a float32 array, skipping
+        # the sklearn wrapper and DMatrix construction on every call
+        try:
+            self._booster = model.get_booster()
+        except Exception:
+            self._booster = None
+        if self._booster is not None:
+            self.n_features = self._booster.num_features()
+        else:
+            self.n_features = getattr(model, "n_features_in_", None)
+
+    def _compile(self):
+        """Compile the booster to a shared library (no-op without treelite)."""
+        if tl2cgen is None or self._booster is None:
+            return
+        try:
+            tl_model = treelite.frontend.from_xgboost(self._booster)
+            tl2cgen.export_lib(
+                tl_model, toolchain="gcc", libpath=COMPILED_PATH,
+                params={"parallel_comp": 4}
+            )
+        except Exception as e:
+            print(f"Warning: Failed to compile churn model: {e}")
+
+    def _load_predictor(self):
+        """Load the compiled predictor if one matches the saved model."""
+        self._predictor = None
+        if tl2cgen is None or not os.path.exists(COMPILED_PATH):
+            return
+        # A library older than the joblib file belongs to a previous model
+        if os.path.getmtime(COMPILED_PATH) < os.path.getmtime(MODEL_PATH):
+            return
+        try:
+            self._predictor = tl2cgen.Predictor(COMPILED_PATH)
+        except Exception as e:
+            print(f"Warning: Failed to load compiled churn model: {e}")
+
+    def _churn_probs(self, X) -> np.ndarray:
+        """Churn probability (class 1) for every row of X."""
+        X = np.asarray(X, dtype=np.float32)
+        if self._predictor is not None:
+            probs = self._predictor.predict(tl2cgen.DMatrix(X))
+            return np.asarray(probs, dtype=np.float32).reshape(len(X), -1)[:, -1]
+        if self._booster is not None:
+            return np.asarray(self._booster.inplace_predict(X), dtype=np.float32).reshape(len(X), -1)[:, -1]
+        return self.model.predict_proba(X)[:, 1]
 
     def train(self, X: List[List[float]], y: List[int]) -> Dict[str, Any]:
         """
@@ -59,10 +153,13 @@ class ChurnModelService:
         )
 
         clf.fit(X_train, y_train)
-        self.model = clf
+        self._set_model(clf)
 
         # Save trained model
         joblib.dump(self.model, MODEL_PATH)
+        self._compile()
+        self._load_predictor()
+        self._loaded = True
 
         # Report
         y_pred = clf.predict(X_test)
@@ -75,60 +172,96 @@ class ChurnModelService:
         Predict turnover risk for a single employee.
         Returns probability of churn and risk label.
         """
+        self._ensure_loaded()
         if not self.model:
             raise RuntimeError("Churn model not trained or loaded.")
 
-        probs = self.model.predict_proba([features])[0]
-        churn_prob = float(probs[1])
-
-        if churn_prob > 0.7:
-            label = "high"
-        elif churn_prob > 0.4:
-            label = "medium"
-        else:
-            label = "low"
-
-        return {
-            "churn_probability": churn_prob,
-            "risk_label": label
-        }
+        return self.predict_batch([features])[0]
 
     def predict_batch(self, features_batch: List[List[float]]) -> List[Dict[str, Any]]:
         """
         Predict turnover risk for a batch of employees.
         """
+        self._ensure_loaded()
         if not self.model:
             raise RuntimeError("Churn model not trained or loaded.")
 
-        probs = self.model.predict_proba(features_batch)
+        probs = self._churn_probs(features_batch)
+        # right=True keeps the thresholds exclusive: exactly 0.7 is medium
+        labels = RISK_LABELS[np.digitize(probs, RISK_BINS, right=True)].tolist()
 
-        results = []
-        for prob in probs:
-            churn_prob = float(prob[1])
-            if churn_prob > 0.7:
-                label = "high"
-            elif churn_prob > 0.4:
-                label = "medium"
-            else:
-                label = "low"
-            results.append({
-                "churn_probability": churn_prob,
-                "risk_label": label
-            })
+        return [
+            {"churn_probability": prob, "risk_label": label}
+            for prob, label in zip(probs.tolist(), labels)
+        ]
 
-        return results
+    def predict_async(self, features: List[float]) -> Future:
+        """
+        Queue a single-row predict. Requests arriving within BATCH_WINDOW of
+        each other are scored together in one model call; the Future
+        resolves to the same dict as predict().
+        """
+        self._ensure_loaded()
+        if not self.model:
+            raise RuntimeError("Churn model not trained or loaded.")
+
+        future: Future = Future()
+        # A malformed row fails only its own future, not the whole batch
+        if self.n_features is not None and len(features) != self.n_features:
+            future.set_exception(ValueError(
+                f"Expected {self.n_features} features, got {len(features)}"
+            ))
+            return future
+        self._queue.put((features, future))
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._drain, daemon=True)
+                    self._worker.start()
+        return future
+
+    def _drain(self):
+        """Background loop: collect up to MAX_BATCH rows, score, resolve."""
+        while True:
+            pending = [self._queue.get()]
+            deadline = time.monotonic() + BATCH_WINDOW
+            while len(pending) < MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                width = self.n_features or len(pending[0][0])
+                if self._buffer is None or self._buffer.shape[1] != width:
+                    self._buffer = np.empty((MAX_BATCH, width), dtype=np.float32)
+                batch = self._buffer[:len(pending)]
+                for i, (features, _) in enumerate(pending):
+                    batch[i] = features
+                results = self.predict_batch(batch)
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(pending, results):
+                future.set_result(result)
 
 
 # -------------------------------
 # Factory
 # -------------------------------
+_churn_service: Optional[ChurnModelService] = None
+
+
 def get_churn_model() -> ChurnModelService:
     """
-    Return a singleton ChurnModelService.
+    Return a singleton ChurnModelService. Construction is cheap; the model
+    file is only read on the first prediction.
     """
     global _churn_service
-    try:
-        return _churn_service
-    except NameError:
+    if _churn_service is None:
         _churn_service = ChurnModelService()
-        return _churn_service
+    return _churn_service
@@ -2,11 +2,29 @@
 Embedding Service for text (resumes, job descriptions, feedback, etc.)
 
 - Uses sentence-transformers for embedding generation
-- Provides single and batch embedding utilities
+- Provides single and batch embedding utilities; embeddings are unit-norm
+- LRU cache keyed by a content hash so repeated texts skip the model
+  (entries held as float16 arrays)
+- Symmetric int8 quantization for compact embedding storage
 """
 
 import os
-from typing import List
+import base64
+import functools
+import hashlib
+import json
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+from cachetools import LRUCache
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # optional: SIMD tree hash for the fallback embedding
+    _blake3 = None
 
 # We avoid importing sentence-transformers at module import time.
 # Availability and actual model object are resolved lazily in _get_model().
@@ -15,7 +33,23 @@ _SENTENCE_AVAILABLE = None
 # Default to an embedding size used in the project
 VECTOR_SIZE = int(os.getenv("VECTOR_SIZE", "384"))
 
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "10000"))
+# Cached embeddings are held at half precision: 2 bytes per component instead
+# of a boxed Python float, with cosine scores unchanged to ~1e-3
+EMBEDDING_CACHE_DTYPE = os.getenv("EMBEDDING_CACHE_DTYPE", "float16")
+# Cache misses are encoded in chunks of this many texts
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+# Documents longer than this many pages are embedded window by window
+EMBED_WINDOW_PAGES = int(os.getenv("EMBED_WINDOW_PAGES", "50"))
+
 _model = None
+# blake2b(text) -> EMBEDDING_CACHE_DTYPE array; shared across threads
+_embedding_cache = LRUCache(maxsize=EMBEDDING_CACHE_SIZE)
+_embedding_cache_lock = threading.Lock()
+# Runs skill extraction alongside the encoder in embed_and_extract
+_side_pool = ThreadPoolExecutor(max_workers=int(os.getenv("SKILL_EXTRACT_THREADS", "2")))
+# simsimd module, False when not installed, None until first checked
+_SIMSIMD = None
 
 def _get_model():
     """Lazy-load the sentence-transformers model to avoid import-time downloads."""
@@ -39,66 +73,364 @@ def _get_model():
     return _model
 
 
-def _fallback_vector(text: str) -> List[float]:
-    """Deterministic fallback embedding using SHA256 hashed bytes expanded to VECTOR_SIZE."""
-    import hashlib
-    import numpy as _np
+_ZERO_VEC = (0.0,) * VECTOR_SIZE
+
 
+@functools.lru_cache(maxsize=1024)
+def _fallback_vec_tuple(text: str) -> Tuple[float, ...]:
+    """
+    Deterministic fallback embedding: VECTOR_SIZE bytes of extendable-output
+    hash (blake3 when installed, else SHAKE-256) as non-negative floats,
+    L2-normalized.
+    Immutable, so repeated texts share one memoized result.
+    """
     if not text:
-        return [0.0] * VECTOR_SIZE
+        return _ZERO_VEC
 
-    digest = hashlib.sha256(text.encode("utf-8")).digest()
-    # Repeat digest to reach desired size
-    repeats = (VECTOR_SIZE + len(digest) - 1) // len(digest)
-    raw = (digest * repeats)[:VECTOR_SIZE]
-    vec = _np.frombuffer(raw, dtype=_np.uint8).astype(_np.float32)
+    data = text.encode("utf-8")
+    if _blake3 is not None:
+        raw = _blake3(data).digest(length=VECTOR_SIZE)
+    else:
+        raw = hashlib.shake_256(data).digest(VECTOR_SIZE)
+    vec = np.frombuffer(raw, dtype=np.uint8).astype(np.float32)
     # Normalize
-    norm = _np.linalg.norm(vec)
+    norm = np.linalg.norm(vec)
     if norm > 0:
-        vec = vec / norm
-    return vec.tolist()
+        vec /= norm
+    return tuple(vec.tolist())
+
+
+def _fallback_vector(text: str) -> List[float]:
+    """Fallback embedding as a fresh list (see _fallback_vec_tuple)."""
+    return list(_fallback_vec_tuple(text))
+
+
+def _cache_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _encode(texts: List[str]) -> List[Sequence[float]]:
+    """Run the model (or the fallback) over uncached texts."""
+    if _SENTENCE_AVAILABLE:
+        model = _get_model()
+        if model is not None:
+            # Unit-norm output, like the fallback, so similarity can be a plain dot
+            return model.encode(
+                texts, batch_size=EMBED_BATCH_SIZE, convert_to_numpy=True, normalize_embeddings=True
+            )
+    return [_fallback_vec_tuple(t) for t in texts]
 
 
 def embed_text(text: str) -> List[float]:
     """Generate an embedding for a single text string."""
     if not text or not text.strip():
         return []
-    if _SENTENCE_AVAILABLE:
-        model = _get_model()
-        if model is None:
-            return _fallback_vector(text)
-        return model.encode(text, convert_to_numpy=True).tolist()
-    return _fallback_vector(text)
+    return embed_batch([text])[0]
 
 
 def embed_batch(texts: List[str]) -> List[List[float]]:
-    """Generate embeddings for a batch of text strings."""
+    """Generate embeddings for a batch of text strings; cached texts skip the model."""
     if not texts:
         return []
-    if _SENTENCE_AVAILABLE:
-        model = _get_model()
-        if model is None:
-            return [_fallback_vector(t) for t in texts]
-        return model.encode(texts, convert_to_numpy=True).tolist()
-    return [_fallback_vector(t) for t in texts]
+    return embed_batch_np(texts).tolist()
+
+
+def embed_batch_np(texts: List[str]) -> "np.ndarray":
+    """
+    embed_batch as one C-contiguous float32 [n, d] array, for callers that
+    go on to numpy anyway (no per-component Python floats).
+    """
+    if not texts:
+        return np.zeros((0, VECTOR_SIZE), dtype=np.float32)
+
+    keys = [_cache_key(t) for t in texts]
+    with _embedding_cache_lock:
+        cached = [_embedding_cache.get(k) for k in keys]
+
+    # Encode each distinct miss once
+    misses = {}
+    for text, key, vec in zip(texts, keys, cached):
+        if vec is None and key not in misses:
+            misses[key] = text
+    if misses:
+        encoded = _encode(list(misses.values()))
+        fresh = {
+            key: np.asarray(vec, dtype=EMBEDDING_CACHE_DTYPE)
+            for key, vec in zip(misses.keys(), encoded)
+        }
+        with _embedding_cache_lock:
+            _embedding_cache.update(fresh)
+        cached = [vec if vec is not None else fresh[k] for k, vec in zip(keys, cached)]
+
+    # np.stack copies, so callers can't mutate cached entries
+    return np.stack(cached).astype(np.float32, copy=False)
+
+
+def embed_pages(pages: List[str], window: int = EMBED_WINDOW_PAGES) -> List[float]:
+    """
+    Embed a multi-page document. Up to `window` pages are embedded as one text;
+    longer documents are split into `window`-page chunks whose embeddings are
+    mean-pooled and re-normalized, so the model never sees the whole text at once.
+    """
+    if len(pages) <= window:
+        return embed_text("\n".join(pages))
+
+    chunks = ["\n".join(pages[i:i + window]) for i in range(0, len(pages), window)]
+    vectors = embed_batch_np([c for c in chunks if c.strip()])
+    if not len(vectors):
+        return []
+    pooled = vectors.mean(axis=0)
+    norm = np.linalg.norm(pooled)
+    if norm > 0:
+        pooled /= norm
+    return pooled.tolist()
+
+
+def embed_and_extract(pages: List[str]) -> Tuple[List[float], List[str]]:
+    """
+    Embedding and extracted skills for a document in one call.
+    The encoder (sentence-transformers) and the skill extractor (a Hyperscan
+    multi-pattern scan over the skill list, with a substring fallback) share
+    no state, so instead of a fused pass the skills are extracted on a helper
+    thread while the encoder runs on this one (the heavy work in both is
+    native code).
+    """
+    from . import skill_extractor
+
+    skills = _side_pool.submit(skill_extractor.extract_skills, "\n".join(pages))
+    vector = embed_pages(pages)
+    return vector, skills.result()
+
+
+def embedding_cache_stats() -> dict:
+    """Current size and capacity of the embedding cache."""
+    with _embedding_cache_lock:
+        return {"size": len(_embedding_cache), "maxsize": int(_embedding_cache.maxsize)}
+
+
+def _get_simsimd():
+    """Return the simsimd module (SIMD distance kernels) or None if unavailable."""
+    global _SIMSIMD
+    if _SIMSIMD is None:
+        try:
+            import simsimd  # type: ignore
+            _SIMSIMD = simsimd
+        except ImportError:
+            _SIMSIMD = False
+    return _SIMSIMD or None
 
 
 def calculate_similarity(embedding1: List[float], embedding2: List[float]) -> float:
     """Calculate cosine similarity between two embeddings."""
-    if not embedding1 or not embedding2:
+    if embedding1 is None or embedding2 is None or len(embedding1) == 0 or len(embedding2) == 0:
         return 0.0
     
-    # Convert to numpy arrays if they aren't already
-    import numpy as np
-    vec1 = np.array(embedding1)
-    vec2 = np.array(embedding2)
+    # Convert to contiguous float32 arrays if they aren't already
+    vec1 = np.ascontiguousarray(embedding1, dtype=np.float32)
+    vec2 = np.ascontiguousarray(embedding2, dtype=np.float32)
     
+    # Zero vectors have no direction; define their similarity as 0
+    if not vec1.any() or not vec2.any():
+        return 0.0
+
+    simsimd = _get_simsimd()
+    if simsimd is not None:
+        # simsimd returns cosine distance (1 - similarity)
+        return 1.0 - float(simsimd.cosine(vec1, vec2))
+
     # Calculate cosine similarity
     dot_product = np.dot(vec1, vec2)
     norm1 = np.linalg.norm(vec1)
     norm2 = np.linalg.norm(vec2)
-    
-    if norm1 == 0 or norm2 == 0:
-        return 0.0
-    
     return float(dot_product / (norm1 * norm2))
+
+
+def unit_similarity(embedding1: Any, embedding2: Any) -> float:
+    """
+    Cosine similarity of two unit-norm embeddings (embed_text / embed_batch
+    output): a plain dot product with no norms. Use calculate_similarity for
+    vectors of unknown norm.
+    """
+    if embedding1 is None or embedding2 is None or len(embedding1) == 0 or len(embedding2) == 0:
+        return 0.0
+
+    vec1 = np.ascontiguousarray(embedding1, dtype=np.float32)
+    vec2 = np.ascontiguousarray(embedding2, dtype=np.float32)
+    simsimd = _get_simsimd()
+    if simsimd is not None:
+        return float(simsimd.dot(vec1, vec2))
+    return float(np.dot(vec1, vec2))
+
+
+def cosine_scores(query: Any, matrix: Any) -> "np.ndarray":
+    """
+    Cosine similarity of one query vector against every row of `matrix`
+    ([n, d] float32) in a single batched call. Zero rows score 0.
+    """
+    query = np.ascontiguousarray(query, dtype=np.float32)
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if matrix.ndim != 2 or matrix.shape[0] == 0 or matrix.shape[1] != query.shape[0] or not query.any():
+        return np.zeros(matrix.shape[0] if matrix.ndim == 2 else 0, dtype=np.float32)
+
+    nonzero = matrix.any(axis=1)
+    simsimd = _get_simsimd()
+    if simsimd is not None:
+        distances = np.asarray(simsimd.cdist(query[None, :], matrix, metric="cosine"), dtype=np.float32)
+        scores = 1.0 - distances[0]
+    else:
+        scores = matrix @ query
+        scores /= np.where(nonzero, np.linalg.norm(matrix, axis=1), 1.0) * np.linalg.norm(query)
+    scores[~nonzero] = 0.0
+    return scores
+
+
+def normalize_rows(matrix: Any) -> "np.ndarray":
+    """
+    C-contiguous float32 copy of `matrix` ([n, d]) with unit-length rows
+    (zero rows stay zero). Compute once when a corpus is stored, then score
+    it with calculate_similarity_batch.
+    """
+    matrix = np.array(matrix, dtype=np.float32, order="C", ndmin=2)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms > 0, norms, 1.0)
+    return matrix
+
+
+def calculate_similarity_batch(query: Any, corpus_norm: "np.ndarray") -> "np.ndarray":
+    """
+    Cosine similarity of one query against a corpus already passed through
+    normalize_rows: a single float32 GEMV, no per-row norms.
+    """
+    q = np.asarray(query, dtype=np.float32)
+    if corpus_norm.ndim != 2 or corpus_norm.shape[0] == 0 or corpus_norm.shape[1] != q.shape[0]:
+        return np.zeros(corpus_norm.shape[0] if corpus_norm.ndim == 2 else 0, dtype=np.float32)
+    norm = np.linalg.norm(q)
+    if norm == 0:
+        return np.zeros(corpus_norm.shape[0], dtype=np.float32)
+    return corpus_norm @ (q / norm)
+
+
+# -------------------------------
+# int8 quantization
+# -------------------------------
+def quantize_int8(vector: Any) -> Tuple[float, "np.ndarray"]:
+    """
+    Symmetric per-vector int8 quantization.
+    Returns (scale, q) with scale = max(|v|) and q = round(v / scale * 127).
+    """
+    vec = np.asarray(vector, dtype=np.float32)
+    scale = float(np.abs(vec).max()) if vec.size else 0.0
+    if scale == 0.0:
+        return 0.0, np.zeros(vec.shape, dtype=np.int8)
+    q = np.clip(np.round(vec / scale * 127), -128, 127).astype(np.int8)
+    return scale, q
+
+
+def quantize_int8_batch(matrix: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+    """quantize_int8 over every row of an [n, d] matrix at once: (scales [n], q [n, d])."""
+    mat = np.asarray(matrix, dtype=np.float32).reshape(len(matrix), -1)
+    scales = np.abs(mat).max(axis=1) if mat.size else np.zeros(mat.shape[0], dtype=np.float32)
+    safe = np.where(scales > 0, scales, 1.0)[:, None]
+    q = np.clip(np.round(mat / safe * 127), -128, 127).astype(np.int8)
+    return scales.astype(np.float32), q
+
+
+def dequantize_int8(scale: float, q: "np.ndarray") -> "np.ndarray":
+    """Inverse of quantize_int8 (float32 approximation of the original vector)."""
+    return q.astype(np.float32) * np.float32(scale / 127.0)
+
+
+def pack_embedding(vector: Any) -> bytes:
+    """
+    Serialize an embedding for the binary `vector_embedding` column:
+    a little-endian float32 scale followed by the int8 components
+    (4x smaller than FP32, no base64 round-trip).
+    """
+    scale, q = quantize_int8(vector)
+    return struct.pack("<f", scale) + q.tobytes()
+
+
+_HEX_CHARS = frozenset(b"0123456789abcdef")
+
+
+def _is_legacy_hex(value: Any) -> bool:
+    """True for the old hex-encoded float32 format (8 hex chars per component)."""
+    raw = value.encode("ascii", "ignore") if isinstance(value, str) else bytes(value)
+    return len(raw) >= 8 and len(raw) % 8 == 0 and _HEX_CHARS.issuperset(raw)
+
+
+def unpack_embedding(value: Any) -> Tuple[float, "np.ndarray"]:
+    """
+    Parse a stored embedding into (scale, int8 vector).
+    Also accepts float vectors (legacy JSON lists) and the legacy
+    base64 and hex text formats, quantizing on the fly where needed.
+    """
+    if value is None or (not isinstance(value, np.ndarray) and not value):
+        return 0.0, np.zeros(0, dtype=np.int8)
+    if isinstance(value, str):
+        if value.lstrip().startswith("["):
+            return quantize_int8(json.loads(value))
+        if _is_legacy_hex(value):
+            return quantize_int8(np.frombuffer(bytes.fromhex(value), dtype=np.float32))
+        value = base64.b64decode(value)
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        return quantize_int8(value)
+    if _is_legacy_hex(value):
+        return quantize_int8(np.frombuffer(bytes.fromhex(bytes(value).decode("ascii")), dtype=np.float32))
+    (scale,) = struct.unpack_from("<f", value)
+    return scale, np.frombuffer(value, dtype=np.int8, offset=4)
+
+
+def quantized_similarity(q1: "np.ndarray", q2: "np.ndarray") -> float:
+    """
+    Cosine similarity computed directly on int8 vectors.
+    The per-vector scales cancel out, so no dequantization is needed.
+    """
+    if q1.size == 0 or q2.size == 0 or not q1.any() or not q2.any():
+        return 0.0
+    simsimd = _get_simsimd()
+    if simsimd is not None:
+        # int8 kernel (AVX-512 VNNI / NEON dot-product where available)
+        return 1.0 - float(simsimd.cosine(q1, q2))
+    a = q1.astype(np.int32)
+    b = q2.astype(np.int32)
+    norm = np.sqrt(float(np.dot(a, a)) * float(np.dot(b, b)))
+    if norm == 0:
+        return 0.0
+    return float(np.dot(a, b) / norm)
+
+
+def quantized_scores(query_q: "np.ndarray", corpus_q: "np.ndarray") -> "np.ndarray":
+    """
+    Cosine similarity of one int8 vector against every row of an int8
+    [n, d] matrix, without dequantizing. Zero rows score 0.
+    """
+    n = corpus_q.shape[0] if corpus_q.ndim == 2 else 0
+    if n == 0 or query_q.size == 0 or corpus_q.shape[1] != query_q.shape[0] or not query_q.any():
+        return np.zeros(n, dtype=np.float32)
+
+    nonzero = corpus_q.any(axis=1)
+    simsimd = _get_simsimd()
+    if simsimd is not None:
+        distances = np.asarray(simsimd.cdist(query_q[None, :], corpus_q, metric="cosine"), dtype=np.float32)
+        scores = 1.0 - distances[0]
+    else:
+        corpus = corpus_q.astype(np.int32)
+        query = query_q.astype(np.int32)
+        dots = (corpus @ query).astype(np.float32)
+        norms = np.sqrt(np.einsum("ij,ij->i", corpus, corpus).astype(np.float32) * float(query @ query))
+        scores = dots / np.where(nonzero, norms, 1.0)
+    scores[~nonzero] = 0.0
+    return scores
+
+
+def quantized_dot(q1: "np.ndarray", scale1: float, q2: "np.ndarray", scale2: float) -> float:
+    """Approximate float dot product of two quantize_int8 outputs (int32 accumulate, one rescale)."""
+    if q1.size == 0 or q2.size == 0:
+        return 0.0
+    simsimd = _get_simsimd()
+    if simsimd is not None:
+        dot = float(simsimd.dot(q1, q2))
+    else:
+        dot = float(np.dot(q1.astype(np.int32), q2.astype(np.int32)))
+    return dot * (scale1 / 127.0) * (scale2 / 127.0)
@@ -8,18 +8,18 @@ Features:
 - Intersectional fairness analysis
 - Longitudinal trend analysis
 """
-from .__future__ import annotations
+from __future__ import annotations
 
-from .typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, NamedTuple, Tuple, Optional
 import numpy as np
-from .scipy import stats
+from scipy import stats
 import warnings
-from .datetime import datetime, timedelta
+from datetime import datetime, timedelta
 
 # Heavy optional dependencies (lazy-imported)
 try:
-    from .sklearn.linear_model import LinearRegression
-    from .sklearn.metrics import r2_score
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import r2_score
     _sklearn_available = True
 except Exception:
     LinearRegression = None
@@ -34,7 +34,7 @@ except Exception:
     _pandas_available = False
 
 try:
-    from .fairlearn.metrics import (
+    from fairlearn.metrics import (
         MetricFrame,
         selection_rate,
         demographic_parity_difference,
@@ -42,7 +42,7 @@ try:
         true_positive_rate,
         false_positive_rate
     )
-    from .fairlearn.reductions import ExponentiatedGradient, DemographicParity
+    from fairlearn.reductions import ExponentiatedGradient, DemographicParity
     _fairlearn_available = True
 except ImportError:
     _fairlearn_available = False
@@ -64,6 +64,11 @@ COHEN_D_THRESHOLDS = {
     "medium": 0.5,
     "large": 0.8
 }
+# |d| at or above each threshold takes the next label (np.searchsorted)
+_COHEN_THRESHOLDS = np.array([
+    COHEN_D_THRESHOLDS["small"], COHEN_D_THRESHOLDS["medium"], COHEN_D_THRESHOLDS["large"]
+])
+_COHEN_LABELS = ("negligible", "small", "medium", "large")
 
 
 # -------------------------------
@@ -77,80 +82,141 @@ def compute_statistical_significance(
     """
     Compute statistical significance and effect size between two groups.
     """
-    # T-test for statistical significance
-    t_stat, p_value = stats.ttest_ind(group1_data, group2_data)
-    
-    # Cohen's d effect size
-    n1, n2 = len(group1_data), len(group2_data)
-    pooled_sd = np.sqrt(((n1-1)*np.var(group1_data) + (n2-1)*np.var(group2_data)) / (n1+n2-2))
-    cohens_d = (np.mean(group1_data) - np.mean(group2_data)) / pooled_sd
-    
-    # Interpret effect size
-    effect_size = "negligible"
-    for threshold, label in [
-        (COHEN_D_THRESHOLDS["large"], "large"),
-        (COHEN_D_THRESHOLDS["medium"], "medium"),
-        (COHEN_D_THRESHOLDS["small"], "small")
-    ]:
-        if abs(cohens_d) >= threshold:
-            effect_size = label
-            break
+    # Convert once; each group's mean, then its (population) variance from
+    # a centered second pass (no sum-of-squares cancellation at salary scale)
+    a1 = np.asarray(group1_data, dtype=np.float64)
+    a2 = np.asarray(group2_data, dtype=np.float64)
+    n1, n2 = a1.size, a2.size
+    mean1, mean2 = a1.sum() / n1, a2.sum() / n2
+    d1, d2 = a1 - mean1, a2 - mean2
+    var1, var2 = (d1 @ d1) / n1, (d2 @ d2) / n2
+    dof = n1 + n2 - 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Student t-test (as scipy.stats.ttest_ind) from the same moments
+        pooled_var = (n1 * var1 + n2 * var2) / dof
+        t_stat = (mean1 - mean2) / np.sqrt(pooled_var * (1.0 / n1 + 1.0 / n2))
+        p_value = 2.0 * stats.t.sf(abs(t_stat), dof)
+
+        # Cohen's d effect size
+        pooled_sd = np.sqrt(((n1-1)*var1 + (n2-1)*var2) / dof)
+        cohens_d = (mean1 - mean2) / pooled_sd
     
     return {
         "t_statistic": float(t_stat),
         "p_value": float(p_value),
         "cohens_d": float(cohens_d),
-        "effect_size": effect_size,
-        "significant": p_value < ALPHA
+        "effect_size": _effect_size(cohens_d),
+        "significant": bool(p_value < ALPHA)
     }
 
+def _effect_size(cohens_d: float) -> str:
+    """Interpret a Cohen's d value"""
+    if np.isnan(cohens_d):
+        return "negligible"
+    return _COHEN_LABELS[int(np.searchsorted(_COHEN_THRESHOLDS, abs(cohens_d), side="right"))]
+
+def _batch_significance(
+    sorted_sal: np.ndarray,
+    bounds: np.ndarray,
+    ref_code: int
+) -> List[Dict[str, Any]]:
+    """
+    compute_statistical_significance of the reference group against every
+    group at once, from per-group sufficient statistics: a few
+    np.add.reduceat passes over the group-sorted salaries and one vectorized
+    t-distribution call instead of a scipy round-trip per group. Same
+    Student t-test and Cohen's d.
+    """
+    sizes = np.diff(bounds)
+    counts = sizes.astype(np.float64)
+    starts = bounds[:-1]
+
+    means = np.add.reduceat(sorted_sal, starts) / counts
+    # Centered sum of squares (second pass) for numerical stability
+    centered = sorted_sal - np.repeat(means, sizes)
+    ss = np.add.reduceat(centered * centered, starts)
+
+    n1, n2 = counts[ref_code], counts
+    dof = n1 + n2 - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pooled_var = (ss[ref_code] + ss) / dof
+        t_stat = (means[ref_code] - means) / np.sqrt(pooled_var * (1.0 / n1 + 1.0 / n2))
+        p_value = 2.0 * stats.t.sf(np.abs(t_stat), dof)
+        # Cohen's d uses population variances weighted by n - 1
+        var_pop = ss / counts
+        pooled_sd = np.sqrt(((n1 - 1) * var_pop[ref_code] + (n2 - 1) * var_pop) / dof)
+        cohens_d = (means[ref_code] - means) / pooled_sd
+
+    abs_d = np.abs(cohens_d)
+    effect_idx = np.where(
+        np.isnan(abs_d), 0, np.searchsorted(_COHEN_THRESHOLDS, abs_d, side="right")
+    )
+
+    return [
+        {
+            "t_statistic": t,
+            "p_value": p,
+            "cohens_d": d,
+            "effect_size": _COHEN_LABELS[e],
+            "significant": p < ALPHA
+        }
+        for t, p, d, e in zip(t_stat.tolist(), p_value.tolist(), cohens_d.tolist(), effect_idx.tolist())
+    ]
+
+def _quartiles(values: np.ndarray) -> List[float]:
+    """25th/50th/75th percentiles (linear interpolation) via one np.partition"""
+    pos = (values.size - 1) * np.array([0.25, 0.5, 0.75])
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.ceil(pos).astype(np.intp)
+    part = np.partition(values, np.unique(np.concatenate((lo, hi))))
+    return (part[lo] + (part[hi] - part[lo]) * (pos - lo)).tolist()
+
 def _compute_group_statistics(
-    salaries: List[float],
-    indices: List[int],
-    timestamps: Optional[List[datetime]] = None
+    g_salaries: np.ndarray,
+    g_times: Optional[List[datetime]] = None
 ) -> Dict[str, Any]:
-    """Helper function to compute statistics for a group"""
-    g_salaries = [salaries[i] for i in indices]
-    
+    """
+    Helper function to compute statistics for a group's salary array.
+    Quartiles (and the median, their middle value) come from one O(N)
+    np.partition at the ranks either side of each quartile, interpolated
+    linearly, so they equal np.percentile's default without a full sort.
+    """
+    quartiles = _quartiles(g_salaries)
     stats_data = {
         "mean_salary": float(np.mean(g_salaries)),
-        "median_salary": float(np.median(g_salaries)),
+        "median_salary": quartiles[1],
         "std_salary": float(np.std(g_salaries)),
-        "count": len(g_salaries),
-        "quartiles": [
-            float(q) for q in np.percentile(g_salaries, [25, 50, 75])
-        ]
+        "count": int(g_salaries.size),
+        "quartiles": quartiles
     }
     
-    if timestamps:
-        g_times = [timestamps[i] for i in indices]
+    if g_times:
         stats_data["trend"] = compute_temporal_trend(g_salaries, g_times)
     
     return stats_data
 
 def _compute_group_gaps(
     data: Dict[str, Any],
-    salaries: List[float],
-    groups: List[str],
-    reference_stats: str,
-    group_labels: set
+    sorted_sal: np.ndarray,
+    bounds: np.ndarray,
+    labels: List[str],
+    reference_stats: str
 ) -> Dict[str, Any]:
     """Helper function to compute gaps between groups"""
     gaps = {}
-    ref_salaries = [s for s, grp in zip(salaries, groups) if grp == reference_stats]
+    ref_code = labels.index(reference_stats)
+    significance = _batch_significance(sorted_sal, bounds, ref_code)
     
-    for g in group_labels:
+    for code, g in enumerate(labels):
         if g != reference_stats:
-            g_salaries = [s for s, grp in zip(salaries, groups) if grp == g]
             gap_pct = ((data[reference_stats]["median_salary"] - 
                        data[g]["median_salary"]) / 
                       data[reference_stats]["median_salary"] * 100)
             
             gaps[g] = {
                 "gap_percentage": float(gap_pct),
-                "statistical_significance": compute_statistical_significance(
-                    ref_salaries, g_salaries
-                ),
+                "statistical_significance": significance[code],
                 "reference_group": reference_stats
             }
     
@@ -165,25 +231,33 @@ def compute_pay_gap(
     Enhanced pay gap analysis with statistical testing and trends.
     """
     data = {}
-    group_labels = set(groups)
     reference_stats = None
+
+    # Convert once, then sort by group code: group k's rows are
+    # order[bounds[k]:bounds[k + 1]] and its salaries a contiguous slice
+    sal = np.asarray(salaries, dtype=np.float64)
+    labels, inverse = np.unique(np.asarray(groups), return_inverse=True)
+    labels = labels.tolist()
+    order = np.argsort(inverse, kind="stable")
+    sorted_sal = sal[order]
+    bounds = np.searchsorted(inverse[order], np.arange(len(labels) + 1))
     
     # Compute basic statistics for each group
-    for g in group_labels:
-        g_indices = [i for i, grp in enumerate(groups) if grp == g]
-        if g_indices:
-            stats_data = _compute_group_statistics(salaries, g_indices, timestamps)
-            data[g] = stats_data
-            
-            # Use largest group as reference
-            if (reference_stats is None or 
-                stats_data["count"] > data[reference_stats]["count"]):
-                reference_stats = g
+    for code, g in enumerate(labels):
+        lo, hi = bounds[code], bounds[code + 1]
+        g_times = [timestamps[i] for i in order[lo:hi].tolist()] if timestamps else None
+        stats_data = _compute_group_statistics(sorted_sal[lo:hi], g_times)
+        data[g] = stats_data
+        
+        # Use largest group as reference
+        if (reference_stats is None or 
+            stats_data["count"] > data[reference_stats]["count"]):
+            reference_stats = g
     
     # Compute gaps and statistical significance
     gaps = {}
     if reference_stats and len(data) >= 2:
-        gaps = _compute_group_gaps(data, salaries, groups, reference_stats, group_labels)
+        gaps = _compute_group_gaps(data, sorted_sal, bounds, labels, reference_stats)
 
     return {
         "group_stats": data,
@@ -207,30 +281,36 @@ def compute_bias_metrics(
     if not _fairlearn_available:
         raise ImportError("Fairlearn not installed. Install with `pip install fairlearn`.")
 
-    metrics = {
-        "selection_rate": selection_rate,
-        "demographic_parity": demographic_parity_difference,
-        "equalized_odds": equalized_odds_difference,
-        "true_positive_rate": true_positive_rate,
-        "false_positive_rate": false_positive_rate
-    }
+    # One MetricFrame over every sensitive feature at once, holding confusion
+    # counts per finest (all-feature) cell. Counts are additive, so each
+    # single-feature and pairwise view below is a groupby-sum of these cells
+    # rather than another pass over y_true/y_pred.
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+
+    # Factorize each feature once: grouping runs on int32 codes, and labels
+    # are decoded per group only when reporting
+    codes, uniques = {}, {}
+    for name, values in sensitive_features.items():
+        feat_codes, uniques[name] = pd.factorize(np.asarray(values), use_na_sentinel=False)
+        codes[name] = feat_codes.astype(np.int32)
+
+    mf = MetricFrame(
+        metrics=_CONFUSION_COUNTS,
+        y_true=y_true,
+        y_pred=y_pred,
+        sensitive_features=pd.DataFrame(codes)
+    )
+    cells = mf.by_group.astype(np.float64)
+    overall_counts = mf.overall.astype(np.float64)
 
     results = {}
     
     # Single feature analysis
-    for feat_name, feat_values in sensitive_features.items():
-        mf = MetricFrame(
-            metrics=metrics,
-            y_true=y_true,
-            y_pred=y_pred,
-            sensitive_features={feat_name: feat_values}
-        )
-        
-        results[feat_name] = {
-            "overall": {m: float(mf.overall[m]) for m in metrics},
-            "by_group": {m: mf.by_group[m].to_dict() for m in metrics},
-            "metric_significance": compute_metric_significance(mf)
-        }
+    for feat_name in sensitive_features:
+        view = _rate_view(cells, [feat_name], overall_counts)
+        view.by_group.index = uniques[feat_name].take(view.by_group.index)
+        results[feat_name] = _view_results(view)
 
     # Intersectional analysis for pairs of features
     feature_names = list(sensitive_features.keys())
@@ -238,29 +318,84 @@ def compute_bias_metrics(
         for i in range(len(feature_names)-1):
             for j in range(i+1, len(feature_names)):
                 feat1, feat2 = feature_names[i], feature_names[j]
-                
-                # Create intersectional groups
-                intersectional_features = [
-                    f"{f1}_{f2}" 
-                    for f1, f2 in zip(sensitive_features[feat1], 
-                                    sensitive_features[feat2])
-                ]
-                
-                mf = MetricFrame(
-                    metrics=metrics,
-                    y_true=y_true,
-                    y_pred=y_pred,
-                    sensitive_features={"intersection": intersectional_features}
-                )
-                
-                results[f"{feat1}_x_{feat2}"] = {
-                    "overall": {m: float(mf.overall[m]) for m in metrics},
-                    "by_group": {m: mf.by_group[m].to_dict() for m in metrics},
-                    "metric_significance": compute_metric_significance(mf)
-                }
+                view = _rate_view(cells, [feat1, feat2], overall_counts)
+                # Same "<f1>_<f2>" labels as before, built per group, not per row
+                u1, u2 = uniques[feat1], uniques[feat2]
+                view.by_group.index = [f"{u1[c1]}_{u2[c2]}" for c1, c2 in view.by_group.index]
+                results[f"{feat1}_x_{feat2}"] = _view_results(view)
     
     return results
 
+def _count_tp(y_true, y_pred) -> int:
+    return int(np.sum((y_true == 1) & (y_pred == 1)))
+
+def _count_fp(y_true, y_pred) -> int:
+    return int(np.sum((y_true != 1) & (y_pred == 1)))
+
+def _count_fn(y_true, y_pred) -> int:
+    return int(np.sum((y_true == 1) & (y_pred != 1)))
+
+def _count_tn(y_true, y_pred) -> int:
+    return int(np.sum((y_true != 1) & (y_pred != 1)))
+
+_CONFUSION_COUNTS = {"tp": _count_tp, "fp": _count_fp, "fn": _count_fn, "tn": _count_tn}
+_RATE_METRICS = ("selection_rate", "true_positive_rate", "false_positive_rate")
+# fairlearn's demographic_parity_difference / equalized_odds_difference over
+# the sensitive feature (between-groups), reported overall only
+_OVERALL_METRICS = _RATE_METRICS + ("demographic_parity", "equalized_odds")
+# Per-group distance from the overall rates (no fairlearn counterpart)
+_GROUP_METRICS = _RATE_METRICS + ("selection_rate_delta", "equalized_odds_delta")
+
+class _RateView(NamedTuple):
+    """by_group/overall pair shaped like a MetricFrame (see compute_metric_significance)"""
+    by_group: Any
+    overall: Any
+
+def _rates(counts: Any) -> Any:
+    """Selection rate, TPR and FPR from tp/fp/fn/tn count columns"""
+    n = counts["tp"] + counts["fp"] + counts["fn"] + counts["tn"]
+    return pd.DataFrame({
+        "selection_rate": (counts["tp"] + counts["fp"]) / n,
+        "true_positive_rate": counts["tp"] / (counts["tp"] + counts["fn"]),
+        "false_positive_rate": counts["fp"] / (counts["fp"] + counts["tn"])
+    })
+
+def _rate_view(cells: Any, levels: List[str], overall_counts: Any) -> _RateView:
+    """
+    Group rates for the given feature levels. Overall, demographic_parity and
+    equalized_odds are fairlearn's between-groups differences (selection-rate
+    range; larger of the TPR and FPR ranges). Per group, selection_rate_delta
+    and equalized_odds_delta are that group's distance from the overall rates.
+    """
+    counts = cells.groupby(level=levels[0] if len(levels) == 1 else levels).sum()
+    # Coded levels can include combinations that never occur; keep observed groups only
+    counts = counts[counts[list(_CONFUSION_COUNTS)].sum(axis=1) > 0]
+    by_group = _rates(counts)
+    overall = _rates(overall_counts.to_frame().T).iloc[0]
+
+    by_group["selection_rate_delta"] = by_group["selection_rate"] - overall["selection_rate"]
+    by_group["equalized_odds_delta"] = np.maximum(
+        (by_group["true_positive_rate"] - overall["true_positive_rate"]).abs(),
+        (by_group["false_positive_rate"] - overall["false_positive_rate"]).abs()
+    )
+    overall["demographic_parity"] = by_group["selection_rate"].max() - by_group["selection_rate"].min()
+    overall["equalized_odds"] = max(
+        by_group["true_positive_rate"].max() - by_group["true_positive_rate"].min(),
+        by_group["false_positive_rate"].max() - by_group["false_positive_rate"].min()
+    )
+    return _RateView(by_group[list(_GROUP_METRICS)], overall[list(_OVERALL_METRICS)])
+
+def _view_results(view: _RateView) -> Dict[str, Any]:
+    rates = list(_RATE_METRICS)
+    return {
+        "overall": {m: float(view.overall[m]) for m in _OVERALL_METRICS},
+        "by_group": {m: view.by_group[m].to_dict() for m in _GROUP_METRICS},
+        # Group vs overall comparison is defined for the rates only
+        "metric_significance": compute_metric_significance(
+            _RateView(view.by_group[rates], view.overall[rates])
+        )
+    }
+
 # -------------------------------
 # Helper Functions
 # -------------------------------
@@ -272,19 +407,21 @@ def compute_temporal_trend(
     """Compute temporal trend in values"""
     # Convert timestamps to numerical values (days since first date)
     t0 = min(timestamps)
-    days = [(t - t0).days for t in timestamps]
-    
-    # Fit linear regression (lazy import guard)
-    if not _sklearn_available:
-        raise ImportError("scikit-learn is required for temporal trend computation. Install with `pip install scikit-learn`")
+    x = np.fromiter(((t - t0).days for t in timestamps), dtype=np.float64, count=len(timestamps))
+    y = np.asarray(values, dtype=np.float64)
 
-    X = np.array(days).reshape(-1, 1)
-    y = np.array(values)
-    model = LinearRegression()
-    model.fit(X, y)
-
-    r2 = float(r2_score(y, model.predict(X)))
-    slope = float(model.coef_[0])
+    # Closed-form univariate OLS (no model fit + predict + r2_score)
+    slope, _, r2 = _ols(x, y)
+    # Degenerate cases as LinearRegression / r2_score report them: r2 is
+    # undefined (nan) below two points; otherwise constant y fits perfectly
+    # and constant x predicts the mean
+    if not np.isfinite(slope):
+        slope = 0.0
+    if y.size < 2:
+        r2 = np.nan
+    elif not np.isfinite(r2):
+        r2 = 1.0 if np.ptp(y) == 0 else 0.0
+    slope, r2 = float(slope), float(r2)
 
     return {
         "slope": slope,  # Change per day
@@ -332,10 +469,18 @@ def generate_fairness_report(
         analysis_results: Combined results from .various fairness analyses
         report_format: Output format ("json" or "html")
     """
+    # One pass over the gaps serves both the report and the score
+    gap_summary = (
+        _summarize_gaps(analysis_results["pay_gap"]["gaps"])
+        if "pay_gap" in analysis_results else None
+    )
+
     report = {
         "summary": {
             "timestamp": datetime.now().isoformat(),
-            "overall_fairness_score": calculate_overall_fairness_score(analysis_results),
+            "overall_fairness_score": calculate_overall_fairness_score(
+                analysis_results, gap_summary
+            ),
             "critical_issues": [],
             "recommendations": []
         },
@@ -355,16 +500,11 @@ def generate_fairness_report(
     # Process pay equity findings
     if "pay_gap" in analysis_results:
         gaps = analysis_results["pay_gap"]
+        any_significant, largest_gap, _ = gap_summary
         report["detailed_analysis"]["pay_equity"] = {
             "gaps": gaps["gaps"],
-            "statistical_significance": any(
-                g["statistical_significance"]["significant"]
-                for g in gaps["gaps"].values()
-            ),
-            "largest_gap": max(
-                (g["gap_percentage"] for g in gaps["gaps"].values()),
-                default=0
-            )
+            "statistical_significance": any_significant,
+            "largest_gap": largest_gap
         }
         
         if report["detailed_analysis"]["pay_equity"]["largest_gap"] > 5:
@@ -403,9 +543,28 @@ def generate_fairness_report(
     
     return report
 
-def calculate_overall_fairness_score(analysis_results: Dict[str, Any]) -> float:
+def _summarize_gaps(gaps: Dict[str, Any]) -> Tuple[bool, float, float]:
+    """(any gap significant, largest gap %, largest absolute gap %) in one pass"""
+    any_significant = False
+    max_gap = None
+    max_abs_gap = 0
+    for g in gaps.values():
+        gap = g["gap_percentage"]
+        if max_gap is None or gap > max_gap:
+            max_gap = gap
+        if abs(gap) > max_abs_gap:
+            max_abs_gap = abs(gap)
+        if not any_significant and g["statistical_significance"]["significant"]:
+            any_significant = True
+    return any_significant, (0 if max_gap is None else max_gap), max_abs_gap
+
+def calculate_overall_fairness_score(
+    analysis_results: Dict[str, Any],
+    gap_summary: Optional[Tuple[bool, float, float]] = None
+) -> float:
     """
     Calculate an overall fairness score from .0 to 1 based on multiple metrics.
+    `gap_summary` is _summarize_gaps of the pay gaps, when already computed.
     """
     score_components = []
     weights = {
@@ -416,8 +575,9 @@ def calculate_overall_fairness_score(analysis_results: Dict[str, Any]) -> float:
     
     # Evaluate pay gaps
     if "pay_gap" in analysis_results:
-        gaps = analysis_results["pay_gap"]["gaps"]
-        max_gap = max((abs(g["gap_percentage"]) for g in gaps.values()), default=0)
+        if gap_summary is None:
+            gap_summary = _summarize_gaps(analysis_results["pay_gap"]["gaps"])
+        max_gap = gap_summary[2]
         gap_score = max(0, 1 - (max_gap / 20))  # Normalize by 20% threshold
         score_components.append(("pay_gap", gap_score))
     
@@ -453,6 +613,119 @@ def calculate_overall_fairness_score(analysis_results: Dict[str, Any]) -> float:
     
     return 0.0
 
+# -------------------------------
+# Trend Kernels
+# -------------------------------
+# Per-series numeric work for the trend analyses below. With Numba these are
+# compiled single-pass loops (compiled eagerly at import, cached on disk);
+# without it the NumPy versions are used.
+
+def _ols(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float]:
+    """
+    (slope, intercept, r_squared) of the least-squares line through (x, y):
+    closed form on centered data, no polyfit/lstsq. Degenerate input (constant
+    x or y) gives nan, as the division would.
+    """
+    xm = x.mean()
+    ym = y.mean()
+    x_centered = x - xm
+    y_centered = y - ym
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (x_centered @ y_centered) / (x_centered @ x_centered)
+        intercept = ym - slope * xm
+        residuals = y_centered - slope * x_centered
+        r_squared = 1 - (residuals @ residuals) / (y_centered @ y_centered)
+    return slope, intercept, r_squared
+
+def _trend_kernel_np(y: np.ndarray) -> Tuple[float, float, float]:
+    """(slope, intercept, r_squared) of y against 0..n-1"""
+    return _ols(np.arange(y.size, dtype=np.float64), y)
+
+def _seasonal_kernel_np(data: np.ndarray, period: int) -> Tuple[float, float]:
+    """(mean seasonal difference, std / mean |difference|)"""
+    seasonal_diffs = data[period:] - data[:data.size - period]
+    consistency = np.std(seasonal_diffs) / np.mean(np.abs(seasonal_diffs))
+    return np.mean(seasonal_diffs), consistency
+
+def _anomaly_kernel_np(data: np.ndarray) -> np.ndarray:
+    """|z| of every point against the series mean/std"""
+    return np.abs((data - np.mean(data)) / np.std(data))
+
+def _trend_kernel_loop(y):
+    # Two-pass least squares on centered x: no Vandermonde matrix or SVD
+    n = y.shape[0]
+    xm = (n - 1) / 2.0
+    ym = 0.0
+    for i in range(n):
+        ym += y[i]
+    ym /= n
+    sxy = 0.0
+    sxx = 0.0
+    for i in range(n):
+        dx = i - xm
+        sxy += dx * (y[i] - ym)
+        sxx += dx * dx
+    slope = sxy / sxx
+    intercept = ym - slope * xm
+    ss_res = 0.0
+    ss_tot = 0.0
+    for i in range(n):
+        r = y[i] - (slope * i + intercept)
+        ss_res += r * r
+        d = y[i] - ym
+        ss_tot += d * d
+    return slope, intercept, 1.0 - ss_res / ss_tot
+
+def _seasonal_kernel_loop(data, period):
+    # Welford over the seasonal differences; mean |diff| alongside
+    mean = 0.0
+    m2 = 0.0
+    abs_sum = 0.0
+    count = 0
+    for i in range(data.shape[0] - period):
+        diff = data[i + period] - data[i]
+        count += 1
+        delta = diff - mean
+        mean += delta / count
+        m2 += delta * (diff - mean)
+        abs_sum += abs(diff)
+    return mean, np.sqrt(m2 / count) / (abs_sum / count)
+
+def _anomaly_kernel_loop(data):
+    # Welford mean/variance, then one z-score pass
+    n = data.shape[0]
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        delta = data[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (data[i] - mean)
+    std = np.sqrt(m2 / n)
+    out = np.empty(n)
+    for i in range(n):
+        out[i] = abs(data[i] - mean) / std
+    return out
+
+try:
+    from numba import njit
+
+    # error_model="numpy": 0/0 gives nan like the NumPy versions instead of raising
+    _trend_kernel = njit(
+        "Tuple((float64, float64, float64))(float64[::1])", cache=True, error_model="numpy"
+    )(_trend_kernel_loop)
+    _seasonal_kernel = njit(
+        "Tuple((float64, float64))(float64[::1], int64)", cache=True, error_model="numpy"
+    )(_seasonal_kernel_loop)
+    _anomaly_kernel = njit(
+        "float64[:](float64[::1])", cache=True, error_model="numpy"
+    )(_anomaly_kernel_loop)
+    _numba_available = True
+except ImportError:
+    _trend_kernel = _trend_kernel_np
+    _seasonal_kernel = _seasonal_kernel_np
+    _anomaly_kernel = _anomaly_kernel_np
+    _numba_available = False
+
 def identify_long_term_trends(
     trends: Dict[str, Any],
     min_periods: int = 4
@@ -472,12 +745,9 @@ def identify_long_term_trends(
             continue
             
         # Calculate trend direction and strength
-        x = np.arange(len(values))
-        y = np.array(values)
-        slope, intercept = np.polyfit(x, y, 1)
-        
-        r_squared = 1 - (np.sum((y - (slope * x + intercept))**2) / 
-                        np.sum((y - np.mean(y))**2))
+        y = np.ascontiguousarray(values, dtype=np.float64)
+        slope, intercept, r_squared = _trend_kernel(y)
+        slope, r_squared = float(slope), float(r_squared)
         
         results[metric_name] = {
             "direction": "increasing" if slope > 0 else "decreasing",
@@ -505,23 +775,14 @@ def detect_seasonal_patterns(
         if len(values) < period * 2:  # Need at least 2 full cycles
             continue
             
-        # Convert to numpy array
-        data = np.array(values)
-        
-        # Calculate seasonal differences
-        seasonal_diffs = []
-        for i in range(len(data) - period):
-            diff = data[i + period] - data[i]
-            seasonal_diffs.append(diff)
-            
-        # Check for consistent patterns
-        seasonal_diffs = np.array(seasonal_diffs)
-        consistency = np.std(seasonal_diffs) / np.mean(np.abs(seasonal_diffs))
+        # Seasonal differences and their consistency
+        data = np.ascontiguousarray(values, dtype=np.float64)
+        seasonal_effect, consistency = _seasonal_kernel(data, period)
         
         patterns[metric_name] = {
-            "seasonal_effect": float(np.mean(seasonal_diffs)),
+            "seasonal_effect": float(seasonal_effect),
             "consistency": float(1 / (1 + consistency)),
-            "significant": consistency < 0.5
+            "significant": bool(consistency < 0.5)
         }
     
     return patterns
@@ -543,19 +804,18 @@ def detect_trend_anomalies(
         if len(values) < 3:  # Need at least 3 points
             continue
             
-        data = np.array(values)
-        mean = np.mean(data)
-        std = np.std(data)
+        data = np.ascontiguousarray(values, dtype=np.float64)
         
-        # Detect points beyond z-threshold
-        z_scores = np.abs((data - mean) / std)
-        anomaly_points = np.nonzero(z_scores > z_threshold)[0]
+        # Detect points beyond z-threshold (a constant series has nan
+        # z-scores, which never pass)
+        z_scores = _anomaly_kernel(data)
+        idx = np.flatnonzero(z_scores > z_threshold)
         
-        if len(anomaly_points) > 0:
+        if idx.size:
             anomalies[metric_name] = {
-                "indices": [int(i) for i in anomaly_points],
-                "values": [float(data[i]) for i in anomaly_points],
-                "z_scores": [float(z_scores[i]) for i in anomaly_points]
+                "indices": idx.tolist(),
+                "values": data[idx].tolist(),
+                "z_scores": z_scores[idx].tolist()
             }
     
     return anomalies
@@ -646,6 +906,66 @@ def _analyze_model_performance(
             "rmse": float(np.sqrt(mean_squared_error(y_test, y_pred)))
         }
 
+def _subgroup_classification_reports(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    groups: np.ndarray
+) -> Dict[str, Dict[str, Any]]:
+    """
+    classification_report(output_dict=True) for every subgroup at once.
+    One bincount over (group, true, predicted) codes gives a per-group
+    confusion matrix; precision/recall/F1 are array arithmetic on it.
+    Zero denominators give 0.0, as classification_report does.
+    """
+    classes, yc = np.unique(np.concatenate((y_true, y_pred)), return_inverse=True)
+    n, c = len(y_true), len(classes)
+    t_code, p_code = yc[:n], yc[n:]
+    group_labels, g_code = np.unique(groups, return_inverse=True)
+    g = len(group_labels)
+
+    cm = np.bincount((g_code * c + t_code) * c + p_code, minlength=g * c * c).reshape(g, c, c)
+    tp = cm[:, np.arange(c), np.arange(c)].astype(np.float64)
+    support = cm.sum(axis=2)
+    predicted = cm.sum(axis=1)
+
+    def _div(a, b):
+        return np.divide(a, b, out=np.zeros_like(a, dtype=np.float64), where=b > 0)
+
+    precision = _div(tp, predicted)
+    recall = _div(tp, support)
+    f1 = _div(2 * precision * recall, precision + recall)
+    present = (support > 0) | (predicted > 0)
+    totals = support.sum(axis=1)
+
+    reports = {}
+    for k, label in enumerate(group_labels.tolist()):
+        cols = np.flatnonzero(present[k])
+        report = {
+            str(classes[j]): {
+                "precision": float(precision[k, j]),
+                "recall": float(recall[k, j]),
+                "f1-score": float(f1[k, j]),
+                "support": int(support[k, j])
+            }
+            for j in cols.tolist()
+        }
+        report["accuracy"] = float(tp[k].sum() / totals[k]) if totals[k] else 0.0
+        weights = support[k, cols]
+        report["macro avg"] = {
+            "precision": float(precision[k, cols].mean()),
+            "recall": float(recall[k, cols].mean()),
+            "f1-score": float(f1[k, cols].mean()),
+            "support": int(totals[k])
+        }
+        report["weighted avg"] = {
+            "precision": float(_div(precision[k, cols] @ weights, totals[k])),
+            "recall": float(_div(recall[k, cols] @ weights, totals[k])),
+            "f1-score": float(_div(f1[k, cols] @ weights, totals[k])),
+            "support": int(totals[k])
+        }
+        reports[str(label)] = report
+    return reports
+
 def _analyze_feature_importance(
     model: Any,
     features_array: np.ndarray,
@@ -780,13 +1100,13 @@ def analyze_model_fairness(
     
     # 1. Model Performance Analysis
     if model_type == "classification":
-        from .sklearn.metrics import classification_report
+        from sklearn.metrics import classification_report
         y_pred = model.predict(X_test)
         results["model_performance"] = {
             "classification_report": classification_report(y_test, y_pred, output_dict=True)
         }
     else:
-        from .sklearn.metrics import r2_score, mean_squared_error
+        from sklearn.metrics import r2_score, mean_squared_error
         y_pred = model.predict(X_test)
         results["model_performance"] = {
             "r2_score": float(r2_score(y_test, y_pred)),
@@ -836,22 +1156,19 @@ def analyze_model_fairness(
     for attr_name, attr_values in sensitive_features.items():
         # Subgroup performance analysis
         unique_values = np.unique(attr_values)
-        subgroup_performance = {}
-        
-        for value in unique_values:
-            mask = attr_values == value
-            if model_type == "classification":
-                subgroup_perf = classification_report(
-                    y_test[mask],
-                    y_pred[mask],
-                    output_dict=True
-                )
-            else:
-                subgroup_perf = {
+        if model_type == "classification":
+            # All subgroups from one confusion-count pass
+            subgroup_performance = _subgroup_classification_reports(
+                np.asarray(y_test), np.asarray(y_pred), np.asarray(attr_values)
+            )
+        else:
+            subgroup_performance = {}
+            for value in unique_values:
+                mask = attr_values == value
+                subgroup_performance[str(value)] = {
                     "r2": float(r2_score(y_test[mask], y_pred[mask])),
                     "rmse": float(np.sqrt(mean_squared_error(y_test[mask], y_pred[mask])))
                 }
-            subgroup_performance[str(value)] = subgroup_perf
         
         # Calculate disparate impact
         favorable_outcome = 1 if model_type == "classification" else np.median(y_pred)
@@ -1022,7 +1339,7 @@ def analyze_causal_fairness(
     """
     try:
         import dowhy
-        from .dowhy import CausalModel
+        from dowhy import CausalModel
         import econml
         from econml.dml import CausalForestDML
         _causal_tools_available = True
@@ -1138,7 +1455,7 @@ def analyze_model_robustness(
     """
     try:
         from art.estimators.classification import SklearnClassifier
-        from .art.attacks.evasion import FastGradientMethod
+        from art.attacks.evasion import FastGradientMethod
         import captum.attr as captum
         _robustness_tools_available = True
     except ImportError:
@@ -1245,18 +1562,18 @@ def setup_fairness_monitoring(
         except ImportError:
             wandb = None
             _wandb_available = False
-        from .evidently.dashboard import Dashboard
-        from .evidently.dashboard.tabs import (
+        from evidently.dashboard import Dashboard
+        from evidently.dashboard.tabs import (
             DataDriftTab, CatTargetDriftTab, RegressionPerformanceTab,
             ClassificationPerformanceTab, ProbClassificationPerformanceTab
         )
-        from .deepchecks.tabular import Dataset, Suite
-        from .deepchecks.tabular.checks import (
+        from deepchecks.tabular import Dataset, Suite
+        from deepchecks.tabular.checks import (
             WholeDatasetDrift, TrainTestFeatureDrift,
             FeatureAttributionDrift, ConceptDrift
         )
         import great_expectations as ge
-        from .datetime import datetime, timedelta
+        from datetime import datetime, timedelta
         import logging
         _monitoring_tools_available = True
     except ImportError:
@@ -1412,27 +1729,27 @@ def monitor_fairness_metrics(
     try:
         import mlflow
         import wandb
-        from .evidently.dashboard import Dashboard
-        from .evidently.dashboard.tabs import (
+        from evidently.dashboard import Dashboard
+        from evidently.dashboard.tabs import (
             DataDriftTab, CatTargetDriftTab, RegressionPerformanceTab,
             ClassificationPerformanceTab, ProbClassificationPerformanceTab,
             DataQualityTab
         )
-        from .deepchecks.tabular import Dataset, Suite
-        from .deepchecks.tabular.checks import (
+        from deepchecks.tabular import Dataset, Suite
+        from deepchecks.tabular.checks import (
             WholeDatasetDrift, TrainTestFeatureDrift,
             FeatureAttributionDrift, ConceptDrift,
             FeatureDrift, LabelDrift
         )
         import great_expectations as ge
-        from .river import drift
+        from river import drift
         import numpy as np
         import pandas as pd
-        from .datetime import datetime
+        from datetime import datetime
         import json
         import logging
         import requests
-        from .typing import Dict, List, Any, Optional
+        from typing import Dict, List, Any, Optional
         _monitoring_tools_available = True
     except ImportError:
         _monitoring_tools_available = False
@@ -1807,7 +2124,7 @@ def analyze_demographic_fairness(
         protected_attributes: List of protected attributes to analyze
     """
     try:
-        from .folktables import ACSDataSource, ACSEmployment
+        from folktables import ACSDataSource, ACSEmployment
         _folktables_available = True
     except ImportError:
         _folktables_available = False
@@ -2042,7 +2359,7 @@ def create_fairness_visualizations(
     try:
         import plotly.graph_objs as go
         import plotly.express as px
-        from .plotly.subplots import make_subplots
+        from plotly.subplots import make_subplots
         _plotly_available = True
     except ImportError:
         _plotly_available = False
@@ -1,12 +1,13 @@
 """
 File upload utilities
 """
+import asyncio
+import io
 import os
 import shutil
 from .pathlib import Path
 from .fastapi import UploadFile, HTTPException
-from .typing import List
-import magic
+from .typing import BinaryIO, List
 
 # Configure upload paths
 UPLOAD_DIR = Path("uploads")
@@ -33,6 +34,8 @@ ALLOWED_EXTENSIONS = {
 # Maximum file size (10MB)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB in bytes
 
+COPY_CHUNK_SIZE = 1 << 20  # 1MB
+
 def validate_file(file: UploadFile, allowed_types: List[str] = None) -> bool:
     """
     Validate file type and size
@@ -48,6 +51,9 @@ def validate_file(file: UploadFile, allowed_types: List[str] = None) -> bool:
             detail=f"File too large. Maximum size is {MAX_FILE_SIZE/1024/1024}MB"
         )
     
+    # libmagic is only needed here, not on the upload/save path
+    import magic
+
     # Get file mime type
     file_content = file.file.read(2048)  # Read first 2048 bytes
     file.file.seek(0)  # Reset file pointer
@@ -64,17 +70,39 @@ def validate_file(file: UploadFile, allowed_types: List[str] = None) -> bool:
     
     return True
 
+def copy_to_path(src: BinaryIO, destination: str):
+    """
+    Copy a file object to destination from its current position.
+    Sources backed by a real file descriptor are copied kernel-side with
+    os.sendfile; anything else in 1MB chunks. Blocking: run off the loop.
+    (A SpooledTemporaryFile still in memory is rolled to disk by fileno();
+    that is bounded by its max_size.)
+    """
+    os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+    with open(destination, "wb") as out:
+        if hasattr(os, "sendfile"):
+            try:
+                in_fd = src.fileno()
+            except (io.UnsupportedOperation, AttributeError, OSError, ValueError):
+                in_fd = None
+            if in_fd is not None:
+                offset = src.tell()
+                while True:
+                    sent = os.sendfile(out.fileno(), in_fd, offset, COPY_CHUNK_SIZE)
+                    if sent == 0:
+                        break
+                    offset += sent
+                src.seek(offset)
+                return
+        shutil.copyfileobj(src, out, COPY_CHUNK_SIZE)
+
 async def save_upload_file(upload_file: UploadFile, destination: str) -> str:
     """
     Save uploaded file to destination
     """
     try:
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(destination), exist_ok=True)
-        
-        # Save file
-        with open(destination, "wb") as buffer:
-            shutil.copyfileobj(upload_file.file, buffer)
+        # Copy on a worker thread so large uploads don't block the event loop
+        await asyncio.to_thread(copy_to_path, upload_file.file, destination)
         
         return destination
     except Exception as e:
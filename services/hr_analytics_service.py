@@ -1,4 +1,4 @@
-from .typing import List, Dict, Any
+from .typing import List, Dict, Any, Tuple
 import pandas as pd
 import numpy as np
 from .sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
@@ -6,6 +6,15 @@ from .sklearn.preprocessing import StandardScaler
 from .prophet import Prophet
 import shap
 
+# Features the turnover model is trained on, in column order; a model fitted
+# on a DataFrame overrides this with its own feature_names_in_
+TURNOVER_FEATURES = (
+    'engagement_score',
+    'performance_score',
+    'tenure_months',
+    'compensation_ratio',
+)
+
 class HRAnalyticsService:
     """
     Provides AI-powered HR analytics including:
@@ -20,12 +29,54 @@ class HRAnalyticsService:
         self.compensation_model = RandomForestRegressor()
         self.scaler = StandardScaler()
         self.explainer = None
+        self._turnover_fitted = False
+
+    def train_turnover_model(self, employee_data: pd.DataFrame, labels) -> None:
+        """
+        Fit the scaler and turnover classifier on the documented feature
+        columns (see TURNOVER_FEATURES); labels: 0 = stay, 1 = leave
+        """
+        X = self.scaler.fit_transform(employee_data[list(TURNOVER_FEATURES)])
+        self.turnover_model.fit(X, labels)
+        self.explainer = None
+        self._turnover_fitted = True
         
-    def predict_turnover_risk(self, employee_data: pd.DataFrame) -> Dict[str, Any]:
+    def predict_turnover_risk(self, employee_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Predict employee turnover risk using ML model
+        Predict turnover risk for a single employee record (raw dict).
+        Builds the feature row straight into a float32 array instead of a
+        one-row DataFrame. Raises ValueError if a feature is missing.
         """
-        features = self._prepare_features(employee_data)
+        columns = self._turnover_feature_order()
+        missing = [c for c in columns if c not in employee_data]
+        if missing:
+            raise ValueError(f"Missing turnover features: {', '.join(missing)}")
+        row = np.fromiter(
+            (employee_data[c] for c in columns),
+            dtype=np.float32,
+            count=len(columns)
+        ).reshape(1, -1)
+        return self._score_turnover(row, columns)
+
+    def predict_turnover_risk_df(self, employee_data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Predict employee turnover risk using ML model (batch, DataFrame input)
+        """
+        columns = list(self._turnover_feature_order())
+        missing = [c for c in columns if c not in employee_data.columns]
+        if missing:
+            raise ValueError(f"Missing turnover features: {', '.join(missing)}")
+        return self._score_turnover(employee_data[columns], columns)
+
+    def _turnover_feature_order(self) -> Tuple[str, ...]:
+        """Column order the turnover model expects"""
+        names = getattr(self.turnover_model, 'feature_names_in_', None)
+        return tuple(names) if names is not None else TURNOVER_FEATURES
+
+    def _score_turnover(self, data, columns) -> Dict[str, Any]:
+        if not self._turnover_fitted:
+            raise RuntimeError("Turnover model not trained.")
+        features = self._prepare_features(data)
         probabilities = self.turnover_model.predict_proba(features)
         
         # Generate SHAP explanations
@@ -36,7 +87,7 @@ class HRAnalyticsService:
         return {
             'risk_score': probabilities[:, 1].tolist(),
             'feature_importance': dict(zip(
-                employee_data.columns,
+                columns,
                 self.turnover_model.feature_importances_
             )),
             'shap_values': shap_values
@@ -118,10 +169,10 @@ class HRAnalyticsService:
             'recommendations': self._generate_performance_recommendations(metrics)
         }
         
-    def _prepare_features(self, data: pd.DataFrame) -> np.ndarray:
+    def _prepare_features(self, data) -> np.ndarray:
         """Prepare features for ML models"""
-        # Feature engineering and preprocessing logic
-        return self.scaler.fit_transform(data)
+        # Scale with the statistics fitted at training time
+        return self.scaler.transform(data)
         
     def _calculate_equity_metrics(
         self,
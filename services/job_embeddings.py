@@ -0,0 +1,195 @@
+"""
+Job description embeddings as a memory-mapped float32 matrix.
+
+- jobs.f32.bin holds one unit-normalized [VECTOR_SIZE] row per job,
+  job_ids.npy the matching job ids (same order)
+- Loaded at startup and rebuilt only when missing or out of date with the
+  jobs table; requests map the file instead of re-fetching and re-embedding
+  every job
+- Shared by every worker process: writers hold an exclusive lock file and
+  write under per-process temp names, and readers remap when the files change
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, threads still serialize
+    fcntl = None
+
+from . import embedding_service
+
+# -------------------------------
+# Config
+# -------------------------------
+JOB_EMBEDDINGS_DIR = os.getenv("JOB_EMBEDDINGS_DIR", "data/job_embeddings")
+MATRIX_FILE = "jobs.f32.bin"
+IDS_FILE = "job_ids.npy"
+LOCK_FILE = ".lock"
+
+# (job_ids [N] int64, memmap [N, d] float32); swapped as one reference
+_state: Optional[Tuple[np.ndarray, np.ndarray]] = None
+# mtime_ns of the ids file behind _state (ids are replaced last)
+_state_mtime: Optional[int] = None
+_write_lock = threading.Lock()
+
+
+def _path(name: str) -> str:
+    return os.path.join(JOB_EMBEDDINGS_DIR, name)
+
+
+@contextmanager
+def _file_lock(exclusive: bool):
+    """Cross-process lock on the embeddings directory (shared for readers)."""
+    os.makedirs(JOB_EMBEDDINGS_DIR, exist_ok=True)
+    with open(_path(LOCK_FILE), "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _ids_mtime() -> Optional[int]:
+    try:
+        return os.stat(_path(IDS_FILE)).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _map(ids: np.ndarray) -> np.ndarray:
+    if len(ids) == 0:
+        return np.zeros((0, embedding_service.VECTOR_SIZE), dtype=np.float32)
+    size = os.path.getsize(_path(MATRIX_FILE))
+    dim = size // (4 * len(ids))
+    return np.memmap(_path(MATRIX_FILE), dtype=np.float32, mode="r", shape=(len(ids), dim))
+
+
+def _replace_with(data_writer, name: str):
+    """Write a file under a per-process temp name, then move it into place."""
+    fd, tmp = tempfile.mkstemp(dir=JOB_EMBEDDINGS_DIR, prefix=name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            data_writer(f)
+        os.replace(tmp, _path(name))
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _write(ids: np.ndarray, matrix: np.ndarray):
+    """Write both files (caller holds the exclusive file lock) and remap them."""
+    _replace_with(np.ascontiguousarray(matrix, dtype=np.float32).tofile, MATRIX_FILE)
+    # Existing maps keep the old inode, so in-flight readers are unaffected
+    _replace_with(lambda f: np.save(f, ids.astype(np.int64)), IDS_FILE)
+    _load_unlocked()
+
+
+def build(job_ids: Sequence[int], descriptions: Sequence[str]):
+    """Embed every job description and replace the stored matrix."""
+    ids = np.asarray(job_ids, dtype=np.int64)
+    matrix = embedding_service.embed_batch_np([d or "" for d in descriptions])
+    with _write_lock, _file_lock(exclusive=True):
+        _write(ids, embedding_service.normalize_rows(matrix))
+
+
+def add_job(job_id: int, description: str):
+    """Append (or replace) one job's row after an insert."""
+    vec = np.zeros((1, embedding_service.VECTOR_SIZE), dtype=np.float32)
+    embedded = embedding_service.embed_text(description or "")
+    if embedded:
+        vec[0, :len(embedded)] = embedded
+    with _write_lock, _file_lock(exclusive=True):
+        # Start from the files on disk: another worker may have added rows
+        _load_unlocked()
+        ids, matrix = _state if _state is not None else (np.zeros(0, dtype=np.int64), vec[:0])
+        keep = ids != job_id
+        _write(np.append(ids[keep], job_id), np.vstack([matrix[keep], embedding_service.normalize_rows(vec)]))
+
+
+def _load_unlocked() -> bool:
+    global _state, _state_mtime
+    mtime = _ids_mtime()
+    if mtime is None or not os.path.exists(_path(MATRIX_FILE)):
+        return False
+    ids = np.load(_path(IDS_FILE))
+    _state = (ids, _map(ids))
+    _state_mtime = mtime
+    return True
+
+
+def load() -> bool:
+    """Map previously written files; False when there are none."""
+    with _file_lock(exclusive=False):
+        return _load_unlocked()
+
+
+def _refresh_if_changed():
+    """Remap when another process has replaced the files."""
+    mtime = _ids_mtime()
+    if mtime is not None and mtime != _state_mtime:
+        load()
+
+
+def top_k(query: Sequence[float], k: int) -> List[Tuple[int, float]]:
+    """(job_id, cosine score) of the k best jobs, best first."""
+    _refresh_if_changed()
+    if _state is None or k <= 0:
+        return []
+    ids, matrix = _state
+    if len(ids) == 0:
+        return []
+    scores = embedding_service.calculate_similarity_batch(query, matrix)
+    if scores.shape[0] != len(ids):
+        return []
+    if k < len(scores):
+        top = np.argpartition(-scores, k)[:k]
+    else:
+        top = np.arange(len(scores))
+    top = top[np.argsort(-scores[top])]
+    return [(int(ids[i]), float(scores[i])) for i in top]
+
+
+def _is_current(job_ids: np.ndarray) -> bool:
+    return _state is not None and np.array_equal(np.sort(_state[0]), np.sort(job_ids))
+
+
+def _rebuild_if_stale(rows) -> bool:
+    """
+    Rebuild from (id, description) rows unless the stored ids already match.
+    Runs under the exclusive lock, so when several workers start together
+    one embeds and the rest find its files current.
+    """
+    job_ids = np.asarray([r[0] for r in rows], dtype=np.int64)
+    with _write_lock, _file_lock(exclusive=True):
+        if _load_unlocked() and _is_current(job_ids):
+            return False
+        matrix = embedding_service.embed_batch_np([r[1] or "" for r in rows])
+        _write(job_ids, embedding_service.normalize_rows(matrix))
+    return True
+
+
+async def refresh_job_embeddings():
+    """Rebuild from the jobs table when the stored matrix is missing or stale."""
+    from db import aexecute_query
+
+    rows = await aexecute_query("SELECT id, description FROM jobs")
+    await asyncio.to_thread(_rebuild_if_stale, rows)
+
+
+async def start_job_embeddings():
+    """Map the stored matrix at startup, rebuilding it only when out of date."""
+    try:
+        await refresh_job_embeddings()
+    except Exception as e:
+        print(f"Warning: Failed to refresh job embeddings: {e}; using stored matrix.")
+        load()
@@ -0,0 +1,192 @@
+"""
+In-memory job skill index for resume-to-job matching.
+
+- Encodes required skills with a hashing vectorizer into a fixed-size vector
+- Keeps all jobs as one float32 matrix (structure-of-arrays) so a match is a
+  single matrix-vector product instead of a Python loop over jobs
+- Encodes skill sets as integer bitmaps so overlap is an AND + popcount
+- Refreshed from MySQL on a timer
+"""
+
+import asyncio
+import json
+import os
+import threading
+import zlib
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+# -------------------------------
+# Config
+# -------------------------------
+SKILL_VECTOR_SIZE = int(os.getenv("SKILL_VECTOR_SIZE", "1024"))
+JOB_INDEX_REFRESH_SECONDS = int(os.getenv("JOB_INDEX_REFRESH_SECONDS", "300"))
+
+
+# -------------------------------
+# Encoding
+# -------------------------------
+def parse_skills(value: Any) -> List[str]:
+    """Normalize a skills column (JSON list, comma-separated string or list)."""
+    if not value:
+        return []
+    if isinstance(value, (bytes, bytearray)):
+        value = value.decode("utf-8")
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            value = value.split(",")
+    if isinstance(value, str):
+        value = [value]
+    return [s.strip() for s in value if s and str(s).strip()]
+
+
+def encode_skills(skills: Iterable[str], out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Hash skills into a unit-length float32 vector of SKILL_VECTOR_SIZE."""
+    vec = out if out is not None else np.zeros(SKILL_VECTOR_SIZE, dtype=np.float32)
+    for skill in skills:
+        vec[zlib.crc32(skill.lower().encode("utf-8")) % SKILL_VECTOR_SIZE] = 1.0
+    norm = np.linalg.norm(vec)
+    if norm > 0:
+        vec /= norm
+    return vec
+
+
+# -------------------------------
+# Skill bitmaps
+# -------------------------------
+# Process-wide skill -> bit registry (keys are lowercased; _BIT_TO_SKILL
+# keeps the first spelling seen for decoding)
+_SKILL_TO_BIT: Dict[str, int] = {}
+_BIT_TO_SKILL: List[str] = []
+_SKILL_BITS_LOCK = threading.Lock()
+
+
+def skill_bit(skill: str) -> int:
+    """Bit index for a skill, registering it on first sight."""
+    key = skill.lower()
+    bit = _SKILL_TO_BIT.get(key)
+    if bit is None:
+        with _SKILL_BITS_LOCK:
+            bit = _SKILL_TO_BIT.get(key)
+            if bit is None:
+                bit = len(_BIT_TO_SKILL)
+                _BIT_TO_SKILL.append(skill)
+                _SKILL_TO_BIT[key] = bit
+    return bit
+
+
+def skill_mask(skills: Iterable[str]) -> int:
+    """Encode skills as an int bitmap; intersection is `a & b`, size is `.bit_count()`."""
+    mask = 0
+    for skill in skills:
+        mask |= 1 << skill_bit(skill)
+    return mask
+
+
+def mask_to_skills(mask: int) -> List[str]:
+    """Decode a bitmap back to skill names (only needed for returned matches)."""
+    skills = []
+    while mask:
+        low = mask & -mask
+        skills.append(_BIT_TO_SKILL[low.bit_length() - 1])
+        mask ^= low
+    return skills
+
+
+# -------------------------------
+# Index
+# -------------------------------
+class JobSkillIndex:
+    """
+    Parallel arrays over all jobs: ids, titles, skill lists and the
+    [N, SKILL_VECTOR_SIZE] float32 skill matrix, plus per-job skill bitmaps.
+    """
+
+    def __init__(self, jobs: List[Dict[str, Any]]):
+        n = len(jobs)
+        self.job_ids = np.fromiter((j["id"] for j in jobs), dtype=np.int64, count=n)
+        self.titles = [j["title"] for j in jobs]
+        self.skills = [parse_skills(j["required_skills"]) for j in jobs]
+        self.masks = [skill_mask(skills) for skills in self.skills]
+
+        matrix = np.zeros((n, SKILL_VECTOR_SIZE), dtype=np.float32)
+        for i, skills in enumerate(self.skills):
+            encode_skills(skills, out=matrix[i])
+        self.matrix = np.asfortranarray(matrix)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def top_k(self, resume_skills: List[str], limit: int, min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """Score all jobs in one GEMV and return the best `limit` matches."""
+        if len(self) == 0 or limit <= 0:
+            return []
+        scores = self.matrix @ encode_skills(resume_skills)
+
+        if limit < len(scores):
+            top = np.argpartition(-scores, limit)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top])]
+
+        resume_mask = skill_mask(resume_skills)
+        matches = []
+        for i in top:
+            score = float(scores[i])
+            if score < min_score:
+                break
+            matches.append({
+                "job_id": int(self.job_ids[i]),
+                "title": self.titles[i],
+                "match_score": score,
+                "matching_skills": mask_to_skills(self.masks[i] & resume_mask),
+                "missing_skills": mask_to_skills(self.masks[i] & ~resume_mask),
+            })
+        return matches
+
+
+async def load_job_index() -> JobSkillIndex:
+    """Build the index from the jobs table."""
+    from db import aexecute_query
+
+    rows = await aexecute_query("SELECT id, title, required_skills FROM jobs")
+    return JobSkillIndex([
+        {"id": r[0], "title": r[1], "required_skills": r[2]}
+        for r in rows
+    ])
+
+
+# -------------------------------
+# App lifecycle
+# -------------------------------
+async def _refresh_periodically(app, interval: int):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            app.state.job_index = await load_job_index()
+        except Exception as e:
+            print(f"Warning: Failed to refresh job index: {e}")
+
+
+async def start_job_index(app, interval: int = JOB_INDEX_REFRESH_SECONDS):
+    """Load app.state.job_index and start its refresh task (call at startup)."""
+    try:
+        app.state.job_index = await load_job_index()
+    except Exception as e:
+        print(f"Warning: Failed to load job index: {e}; starting with no jobs.")
+        app.state.job_index = JobSkillIndex([])
+    app.state.job_index_task = asyncio.create_task(_refresh_periodically(app, interval))
+
+
+async def stop_job_index(app):
+    """Cancel the refresh task (call at shutdown)."""
+    task = getattr(app.state, "job_index_task", None)
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
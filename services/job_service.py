@@ -3,16 +3,33 @@ Job service for handling job-related operations
 """
 from .typing import Dict, List, Optional
 from .db.database import DatabaseOperations
+from .services import job_embeddings, qdrant_utils
 
 class JobService(DatabaseOperations):
     def __init__(self):
-        super().__init__('jobs')
+        # Jobs are read-mostly and only changed through update()/delete()
+        super().__init__('jobs', cache_by_id=True)
 
     def create_job(self, data: Dict) -> Dict:
         """Create a new job"""
         # Insert into database
         job_id = self.create(data)
-        return self.get_by_id(job_id)
+        job = self.get_by_id(job_id)
+
+        # Index the description for ANN resume matching
+        try:
+            qdrant_utils.index_job(job_id, data.get("description"), {
+                "title": data.get("title"),
+                "description": data.get("description"),
+                "required_skills": data.get("required_skills")
+            })
+        except Exception as e:
+            print(f"Warning: Failed to index job {job_id} in Qdrant: {e}")
+        try:
+            job_embeddings.add_job(job_id, data.get("description"))
+        except Exception as e:
+            print(f"Warning: Failed to update job embedding matrix: {e}")
+        return job
 
     def search_jobs(self, keywords: List[str]) -> List[Dict]:
         """Search jobs by keywords"""
@@ -43,6 +43,13 @@ class NLPService:
         except Exception:
             self.embedding_model = None
         return self.embedding_model
+
+    def warmup(self):
+        """Load the pipelines and embedding model up front (call at startup)"""
+        self.analyze_sentiment("ok")
+        self.extract_entities("ok")
+        self.answer_question("ok", "ok?")
+        self.get_embedding("ok")
         
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment of the text"""
@@ -65,11 +72,20 @@ class NLPService:
         return self.ner_pipeline(text)
         
     def get_embedding(self, text: str) -> np.ndarray:
-        """Get text embeddings"""
+        """Get text embeddings (float32)"""
+        model = self._get_embedding_model()
+        if model is None:
+            return np.zeros(384, dtype=np.float32)
+        return np.asarray(model.encode(text), dtype=np.float32)
+
+    def get_embedding_batch(self, texts: List[str]) -> np.ndarray:
+        """Get embeddings for many texts in one model call, as an [n, d] array"""
         model = self._get_embedding_model()
         if model is None:
-            return np.zeros(384)
-        return model.encode(text)
+            return np.zeros((len(texts), 384), dtype=np.float32)
+        if not texts:
+            return np.zeros((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+        return np.asarray(model.encode(texts), dtype=np.float32)
         
     def answer_question(self, context: str, question: str) -> Dict[str, Any]:
         """Answer questions based on context"""
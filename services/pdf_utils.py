@@ -0,0 +1,65 @@
+"""
+PDF text extraction
+
+- Uses pypdfium2 (PDFium, native code that releases the GIL) when installed
+- Falls back to the pure-Python PyPDF2 reader otherwise
+- Reads page by page and stops at MAX_PDF_TEXT_CHARS to bound memory
+"""
+
+import io
+import os
+from typing import Iterator, List, Union
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# Text beyond this is dropped; a resume never legitimately gets close
+MAX_PDF_TEXT_CHARS = int(os.getenv("MAX_PDF_TEXT_CHARS", "500000"))
+
+
+def iter_pdf_pages(source: Union[str, bytes]) -> Iterator[str]:
+    """Yield the text of each page of a PDF file path or raw bytes, one page at a time."""
+    if pdfium is not None:
+        doc = pdfium.PdfDocument(source)
+        try:
+            for page in doc:
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            doc.close()
+        return
+
+    import PyPDF2
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    reader = PyPDF2.PdfReader(source)
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
+def extract_pdf_pages(source: Union[str, bytes], max_chars: int = MAX_PDF_TEXT_CHARS) -> List[str]:
+    """Page texts, stopping (and truncating the last page) once max_chars is reached."""
+    pages = []
+    remaining = max_chars
+    page_iter = iter_pdf_pages(source)
+    try:
+        for text in page_iter:
+            pages.append(text[:remaining])
+            remaining -= len(pages[-1])
+            if remaining <= 0:
+                break
+    finally:
+        # Release the PDF handle now if we stopped early
+        page_iter.close()
+    return pages
+
+
+def extract_pdf_text(source: Union[str, bytes], max_chars: int = MAX_PDF_TEXT_CHARS) -> str:
+    """Extract the text of every page from a PDF file path or raw bytes."""
+    return "\n".join(extract_pdf_pages(source, max_chars))
@@ -5,15 +5,19 @@ Qdrant utilities for vector storage and search.
 - Search for nearest neighbors
 """
 
+import heapq
 import os
 import uuid
 from typing import List, Dict, Any
 
+from . import embedding_service
+
 try:
     from qdrant_client import QdrantClient
     from qdrant_client.models import (
         VectorParams,
         Distance,
+        HnswConfigDiff,
         PointStruct,
         Filter,
         FieldCondition,
@@ -25,18 +29,29 @@ except Exception:
     QdrantClient = None
     VectorParams = None
     Distance = None
+    HnswConfigDiff = None
     PointStruct = None
     Filter = None
     FieldCondition = None
     MatchValue = None
     _QDRANT_AVAILABLE = False
 
+try:
+    # qdrant-client >= 1.9: store vectors as float16
+    from qdrant_client.models import Datatype
+except Exception:
+    Datatype = None
+
 # -------------------------------
 # Config
 # -------------------------------
 QDRANT_HOST = os.getenv("QDRANT_HOST", "qdrant")
 QDRANT_PORT = int(os.getenv("QDRANT_PORT", 6333))
 VECTOR_SIZE = int(os.getenv("VECTOR_SIZE", 384))  # sentence-transformers default
+JOBS_COLLECTION = os.getenv("QDRANT_JOBS_COLLECTION", "jobs")
+# Keep vectors and the HNSW graph on disk (mmap) so large catalogs don't
+# have to fit in RAM
+QDRANT_ON_DISK = os.getenv("QDRANT_ON_DISK", "true").lower() in ("1", "true", "yes")
 
 if _QDRANT_AVAILABLE:
     client = QdrantClient(host=QDRANT_HOST, port=QDRANT_PORT)
@@ -49,7 +64,9 @@ else:
         def recreate_collection(self, collection_name, vectors_config=None):
             _IN_MEMORY_STORE[collection_name] = []
         def upsert(self, collection_name, points):
-            _IN_MEMORY_STORE.setdefault(collection_name, []).extend(points)
+            ids = {p.get('id') for p in points}
+            items = [i for i in _IN_MEMORY_STORE.get(collection_name, []) if i.get('id') not in ids]
+            _IN_MEMORY_STORE[collection_name] = items + list(points)
         def search(self, collection_name, query_vector, limit=5, query_filter=None):
             items = _IN_MEMORY_STORE.get(collection_name, [])
             # naive cosine similarity
@@ -70,8 +87,7 @@ else:
                     'payload': it.get('payload')
                 })
                 results.append(r)
-            results.sort(key=lambda x: x.score, reverse=True)
-            return results[:limit]
+            return heapq.nlargest(limit, results, key=lambda x: x.score)
         def delete(self, collection_name, points_selector):
             items = _IN_MEMORY_STORE.get(collection_name, [])
             _IN_MEMORY_STORE[collection_name] = [i for i in items if i.get('id') not in points_selector]
@@ -86,11 +102,22 @@ def ensure_collection(name: str):
     """
     Create Qdrant collection if it doesn't exist.
     """
+    if not _QDRANT_AVAILABLE:
+        _IN_MEMORY_STORE.setdefault(name, [])
+        return
     collections = client.get_collections().collections
     if not any(c.name == name for c in collections):
+        vector_options = {"on_disk": QDRANT_ON_DISK}
+        if Datatype is not None:
+            vector_options["datatype"] = Datatype.FLOAT16
         client.recreate_collection(
             collection_name=name,
-            vectors_config=VectorParams(size=VECTOR_SIZE, distance=Distance.COSINE)
+            vectors_config=VectorParams(
+                size=VECTOR_SIZE,
+                distance=Distance.COSINE,
+                **vector_options
+            ),
+            hnsw_config=HnswConfigDiff(on_disk=QDRANT_ON_DISK)
         )
 
 
@@ -115,6 +142,37 @@ def store_vector(collection_name: str, vector: List[float], payload: Dict[str, A
     return point_id
 
 
+def upsert_vector(
+    collection_name: str,
+    point_id: Any,
+    vector: List[float],
+    payload: Dict[str, Any]
+):
+    """
+    Insert or replace the vector stored under a caller-chosen ID
+    (e.g. a job's primary key), so re-indexing doesn't duplicate points.
+    """
+    ensure_collection(collection_name)
+
+    if _QDRANT_AVAILABLE:
+        point = PointStruct(id=point_id, vector=vector, payload=payload)
+    else:
+        point = {"id": point_id, "vector": vector, "payload": payload}
+
+    client.upsert(collection_name=collection_name, points=[point])
+
+
+def index_job(job_id: int, description: str, payload: Dict[str, Any]):
+    """
+    Embed a job description and upsert it into JOBS_COLLECTION
+    keyed by job_id, for ANN resume matching.
+    """
+    vector = embedding_service.embed_text(description or "")
+    if not vector:
+        return
+    upsert_vector(JOBS_COLLECTION, int(job_id), vector, {**payload, "job_id": int(job_id)})
+
+
 # -------------------------------
 # Search Vector
 # -------------------------------
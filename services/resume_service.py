@@ -2,8 +2,12 @@
 Resume service for handling resume-related operations
 """
 from typing import Dict, List, Optional
+import numpy as np
 from db.database import DatabaseOperations
-from services.embedding_service import embed_text, calculate_similarity
+from services.embedding_service import (
+    embed_text, embed_batch_np, pack_embedding, unpack_embedding,
+    quantize_int8_batch, quantized_scores
+)
 from services.skill_extractor import extract_skills
 
 class ResumeService(DatabaseOperations):
@@ -16,16 +20,15 @@ class ResumeService(DatabaseOperations):
         skills = extract_skills(resume_text)
         vector = embed_text(resume_text)
         
-        # Convert vector to string for storage
-        import json
-        vector_str = json.dumps(vector)
+        # Quantize to int8 for compact storage
+        vector_bytes = pack_embedding(vector)
         
         # Prepare data for insertion
         data = {
             'user_id': user_id,
             'resume_text': resume_text,
             'skills': skills,
-            'vector_embedding': vector_str
+            'vector_embedding': vector_bytes
         }
         
         # Insert into database
@@ -48,44 +51,47 @@ class ResumeService(DatabaseOperations):
         # Get all jobs
         jobs = DatabaseOperations('jobs').get_all()
         
+        # Parse the stored vector and skills once, not per job
+        _, resume_q = unpack_embedding(resume['vector_embedding'])
+        resume_skills = set(resume['skills'])
+
+        # Similarity of every job on the int8 vectors: one batched embed
+        # call, one vectorized quantization and one int8 matrix-vector pass
+        if not jobs:
+            return []
+        _, jobs_q = quantize_int8_batch(embed_batch_np([job['description'] or '' for job in jobs]))
+        scores = quantized_scores(resume_q, jobs_q)
+
+        # Partial selection of the top_k, then sort just those
+        if top_k < len(scores):
+            top = np.argpartition(-scores, top_k)[:top_k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top])]
+
+        # Skill overlap only for the returned jobs
         matches = []
-        for job in jobs:
-            # Parse the stored vector
-            import json
-            resume_vector = json.loads(resume['vector_embedding'])
-            job_vector = embed_text(job['description'])
-            
-            # Calculate similarity score
-            similarity = calculate_similarity(
-                resume_vector,
-                job_vector
-            )
-            
-            # Calculate skill overlap
-            resume_skills = set(resume['skills'])
+        for i in top:
+            job = jobs[i]
             job_skills = set(job['required_skills'])
-            skill_overlap = len(resume_skills.intersection(job_skills))
-            skill_overlap_score = skill_overlap / len(job_skills) if job_skills else 0
-            
-            # Store match in database
-            match_data = {
-                'job_id': job['id'],
-                'resume_id': resume_id,
-                'match_score': similarity,
-                'skills_matched': list(resume_skills.intersection(job_skills))
-            }
-            DatabaseOperations('job_matches').create(match_data)
+            matching = resume_skills & job_skills
+            skill_overlap_score = len(matching) / len(job_skills) if job_skills else 0
             
             matches.append({
                 'job': job,
-                'match_score': similarity,
+                'match_score': float(scores[i]),
                 'skill_overlap_score': skill_overlap_score,
-                'matching_skills': list(resume_skills.intersection(job_skills)),
+                'matching_skills': list(matching),
                 'missing_skills': list(job_skills - resume_skills)
             })
-        
-        # Sort matches by score
-        matches.sort(key=lambda x: x['match_score'], reverse=True)
-        return matches[:top_k]
+
+        # Store only the returned matches, in one executemany
+        DatabaseOperations('job_matches').bulk_create([{
+            'job_id': match['job']['id'],
+            'resume_id': resume_id,
+            'match_score': match['match_score'],
+            'skills_matched': match['matching_skills']
+        } for match in matches])
+        return matches
 
 resume_service = ResumeService()
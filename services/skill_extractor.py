@@ -2,11 +2,13 @@
 Skill extractor service.
 
 - Uses spaCy for Named Entity Recognition & tokenization
-- Matches text against ESCO skills JSON
+- Matches text against ESCO skills JSON in one multi-pattern scan
+  (Hyperscan DFA when installed, substring checks otherwise)
 """
 
 import os
 import json
+import threading
 from typing import List, Set
 
 # Try to import spaCy; if unavailable fallback to keyword matching
@@ -16,6 +18,11 @@ try:
 except Exception:
     _SPACY_AVAILABLE = False
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # -------------------------------
 # Load ESCO Skills
 # -------------------------------
@@ -32,6 +39,57 @@ else:
     ESCO_SKILLS = {"python", "java", "sql", "project management", "communication", "leadership"}
 
 
+# -------------------------------
+# Multi-pattern matcher
+# -------------------------------
+# Fixed order so Hyperscan match ids index back into it
+_SKILL_LIST = sorted(ESCO_SKILLS)
+
+
+def _literal_pattern(skill: str) -> bytes:
+    """Hyperscan expression matching skill literally (non-alphanumeric bytes as \\xHH)."""
+    return "".join(
+        chr(b) if b < 128 and chr(b).isalnum() else "\\x{:02x}".format(b)
+        for b in skill.lower().encode("utf-8")
+    ).encode("ascii")
+
+
+def _compile_skill_db():
+    """Compile every skill into one caseless Hyperscan database, or None."""
+    if hyperscan is None or not _SKILL_LIST:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[_literal_pattern(skill) for skill in _SKILL_LIST],
+            ids=list(range(len(_SKILL_LIST))),
+            elements=len(_SKILL_LIST),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_SKILL_LIST)
+        )
+        return db
+    except Exception as e:
+        print(f"Warning: Failed to compile Hyperscan skill database: {e}")
+        return None
+
+
+_SKILL_DB = _compile_skill_db()
+# A Hyperscan database has a single scratch space; scans are serialized
+_SKILL_DB_LOCK = threading.Lock()
+
+
+def _match_skills(text: str) -> Set[str]:
+    """Skills occurring as substrings of text (text is already lowercased)."""
+    if _SKILL_DB is None:
+        return {skill for skill in _SKILL_LIST if skill.lower() in text}
+
+    ids = set()
+    def on_match(id, start, end, flags, context):
+        ids.add(id)
+    with _SKILL_DB_LOCK:
+        _SKILL_DB.scan(text.encode("utf-8"), match_event_handler=on_match)
+    return {_SKILL_LIST[i] for i in ids}
+
+
 # Lazy spaCy model
 _nlp = None
 def _load_spacy():
@@ -56,24 +114,19 @@ def extract_skills(text: str) -> List[str]:
 
     # Try spaCy extraction when possible
     nlp = _load_spacy()
-    found = set()
     if nlp:
         doc = nlp(text_lower)
-        for token in doc:
-            if not token.is_stop and not token.is_punct:
-                lemma = token.lemma_.strip()
-                for skill in ESCO_SKILLS:
-                    if skill.lower() in lemma:
-                        found.add(skill)
-        for chunk in doc.noun_chunks:
-            chunk_text = chunk.text.strip().lower()
-            for skill in ESCO_SKILLS:
-                if skill.lower() in chunk_text:
-                    found.add(skill)
+        # Newline-joined so one scan finds skills inside any single lemma or
+        # noun chunk (skill names never contain a newline)
+        lemmas = "\n".join(
+            token.lemma_.strip()
+            for token in doc
+            if not token.is_stop and not token.is_punct
+        )
+        chunks = "\n".join(chunk.text.strip().lower() for chunk in doc.noun_chunks)
+        found = _match_skills(lemmas) | _match_skills(chunks)
     else:
         # Simple keyword matching fallback
-        for skill in ESCO_SKILLS:
-            if skill.lower() in text_lower:
-                found.add(skill)
+        found = _match_skills(text_lower)
 
     return sorted(found)
@@ -21,6 +21,15 @@ class UserService(DatabaseOperations):
             del user['password_hash']  # Don't return the password hash
         return user
 
+    def bulk_create_users(self, rows: List[Dict]) -> int:
+        """Hash passwords and insert many users in one batch"""
+        prepared = []
+        for row in rows:
+            row = dict(row)
+            row['password_hash'] = generate_password_hash(row.pop('password'))
+            prepared.append(row)
+        return self.bulk_create(prepared)
+
     def authenticate_user(self, username: str, password: str) -> Optional[Dict]:
         """Authenticate a user"""
         query = "SELECT * FROM users WHERE username = %s"
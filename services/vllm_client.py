@@ -2,21 +2,166 @@
 vLLM client wrapper.
 
 - Provides backwards-compatible functions for routes
-- Internally delegates to llm_utils
+- Coalesces concurrent completion requests into batched calls (micro-batching)
+- Sends batches to an OpenAI-compatible vLLM server when VLLM_ENDPOINT is set,
+  otherwise calls llm_utils directly, bypassing the batcher
 """
 
-from typing import List, Dict, Any
+import asyncio
+import os
+from typing import List, Dict, Any, Optional, Tuple
+
+import httpx
+
 from . import llm_utils
 
 
+# -------------------------------
+# Config
+# -------------------------------
+# e.g. http://localhost:8001/v1 (vLLM's /v1/completions accepts a list of prompts)
+VLLM_ENDPOINT = os.getenv("VLLM_ENDPOINT")
+VLLM_MODEL = os.getenv("VLLM_MODEL", llm_utils.MODEL_NAME)
+BATCH_MAX_SIZE = int(os.getenv("LLM_BATCH_SIZE", "64"))
+BATCH_WINDOW_SECONDS = float(os.getenv("LLM_BATCH_WINDOW_MS", "10")) / 1000.0
+
+
+# -------------------------------
+# Backend
+# -------------------------------
+# One keep-alive client per event loop, shared by every batch
+_client: Optional[httpx.AsyncClient] = None
+_client_loop = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(timeout=120.0)
+        _client_loop = loop
+    return _client
+
+
+async def aclose():
+    """Close the shared HTTP client (call at app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _complete_batch(prompts: List[str], max_tokens: int, temperature: float) -> List[str]:
+    """Send one batch of prompts that share sampling parameters to vLLM."""
+    payload = {
+        "model": VLLM_MODEL,
+        "prompt": prompts,
+        "max_tokens": max_tokens,
+        "temperature": temperature
+    }
+    resp = await _get_client().post(f"{VLLM_ENDPOINT}/completions", json=payload)
+    resp.raise_for_status()
+    choices = resp.json()["choices"]
+    # One choice per prompt, matched back by index
+    texts = [""] * len(prompts)
+    for choice in choices:
+        texts[choice["index"]] = choice.get("text", "").strip()
+    return texts
+
+
+# -------------------------------
+# Micro-batcher
+# -------------------------------
+_Item = Tuple[str, int, float, asyncio.Future]
+
+
+class PromptBatcher:
+    """
+    Collects prompts for up to `window` seconds (or `max_batch` prompts) and
+    submits them together, so the server batches them on the GPU instead of
+    serving concurrent requests one by one.
+    """
+
+    def __init__(self, max_batch: int = BATCH_MAX_SIZE, window: float = BATCH_WINDOW_SECONDS):
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop = None
+        # Strong refs to in-flight dispatch tasks (the loop only keeps weak ones)
+        self._inflight = set()
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+    async def submit(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        self._ensure_started()
+        fut = self._loop.create_future()
+        await self._queue.put((prompt, max_tokens, temperature, fut))
+        return await fut
+
+    async def _collect(self) -> List[_Item]:
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.window
+        while len(batch) < self.max_batch:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            groups: Dict[Tuple[int, float], List[_Item]] = {}
+            for item in batch:
+                groups.setdefault((item[1], item[2]), []).append(item)
+            # Dispatch without waiting so the next window keeps filling
+            for (max_tokens, temperature), items in groups.items():
+                task = self._loop.create_task(self._dispatch(items, max_tokens, temperature))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+    @staticmethod
+    async def _dispatch(items: List[_Item], max_tokens: int, temperature: float):
+        try:
+            texts = await _complete_batch([i[0] for i in items], max_tokens, temperature)
+        except Exception as e:
+            for *_, fut in items:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (*_, fut), text in zip(items, texts):
+            if not fut.done():
+                fut.set_result(text)
+
+
+_batcher = PromptBatcher()
+
+
 # -------------------------------
 # Text Completion
 # -------------------------------
 async def generate_text(prompt: str, max_tokens: int = 256, temperature: float = 0.7) -> str:
     """
-    Generate free-form text using vLLM.
+    Generate free-form text using vLLM (batched with concurrent requests).
+    Without VLLM_ENDPOINT there is nothing to batch for, so the prompt goes
+    straight to llm_utils.
     """
-    return await llm_utils.generate(prompt, max_tokens=max_tokens, temperature=temperature)
+    if not VLLM_ENDPOINT:
+        return await llm_utils.generate(prompt, max_tokens=max_tokens, temperature=temperature)
+    return await _batcher.submit(prompt, max_tokens, temperature)
+
+
+# Name used by the feedback routes
+generate = generate_text
 
 
 # -------------------------------
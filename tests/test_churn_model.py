@@ -0,0 +1,63 @@
+"""
+Tests for churn model micro-batched prediction
+"""
+import pytest
+import numpy as np
+
+pytest.importorskip("xgboost")
+from services.churn_model import ChurnModelService
+
+class _FakeModel:
+    """predict_proba returns the first feature as the churn probability"""
+    n_features_in_ = 4
+
+    def predict_proba(self, X):
+        p = np.asarray(X, dtype=np.float64)[:, 0]
+        return np.column_stack([1 - p, p])
+
+class _FailingModel(_FakeModel):
+    def predict_proba(self, X):
+        raise RuntimeError("model error")
+
+def _service(model):
+    service = ChurnModelService()
+    service._set_model(model)
+    service._loaded = True
+    return service
+
+def test_predict_async_results_match_rows():
+    """Test each future resolves to its own row's prediction"""
+    service = _service(_FakeModel())
+    futures = [service.predict_async([p, 0.0, 0.0, 0.0]) for p in (0.1, 0.5, 0.9)]
+    results = [f.result(timeout=5) for f in futures]
+
+    assert [r["risk_label"] for r in results] == ["low", "medium", "high"]
+    assert [r["churn_probability"] for r in results] == pytest.approx([0.1, 0.5, 0.9])
+
+def test_predict_async_bad_row_fails_only_its_future():
+    """Test a row of the wrong width is rejected without touching the batch"""
+    service = _service(_FakeModel())
+    bad = service.predict_async([0.1, 0.2])
+    good = service.predict_async([0.8, 0.0, 0.0, 0.0])
+
+    assert isinstance(bad.exception(timeout=5), ValueError)
+    assert good.result(timeout=5)["risk_label"] == "high"
+
+def test_predict_async_model_error_fails_batch():
+    """Test a model error is raised from every future it affected"""
+    service = _service(_FailingModel())
+    futures = [service.predict_async([0.1, 0.0, 0.0, 0.0]) for _ in range(3)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
+
+def test_batch_width_follows_model():
+    """Test the batch buffer follows the loaded model's feature count"""
+    class WideModel(_FakeModel):
+        n_features_in_ = 6
+
+    service = _service(WideModel())
+    result = service.predict_async([0.9] + [0.0] * 5).result(timeout=5)
+
+    assert result["risk_label"] == "high"
@@ -0,0 +1,128 @@
+"""
+Tests for DatabaseOperations write helpers on an in-memory SQLite database
+"""
+import sqlite3
+
+import pytest
+
+import db.database as database
+from db.database import DatabaseOperations
+
+class _SqliteCursor:
+    """mysql.connector-shaped cursor over a sqlite3 cursor (%s placeholders)"""
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, query, params=None):
+        self._cursor.execute(query.replace("%s", "?"), params or ())
+
+    def executemany(self, query, rows):
+        self._cursor.executemany(query.replace("%s", "?"), rows)
+
+    @property
+    def with_rows(self):
+        return self._cursor.description is not None
+
+    @property
+    def column_names(self):
+        return tuple(d[0] for d in self._cursor.description)
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def close(self):
+        self._cursor.close()
+
+class _SqliteConnection:
+    """mysql.connector-shaped connection over one sqlite3 connection"""
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self, **kwargs):
+        return _SqliteCursor(self._conn.cursor())
+
+    def start_transaction(self):
+        self._conn.execute("BEGIN")
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+@pytest.fixture
+def items(monkeypatch):
+    """DatabaseOperations('items') bound to a fresh in-memory table"""
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    monkeypatch.setattr(database, "get_db_connection", lambda: _SqliteConnection(conn))
+    monkeypatch.setattr(database, "close_db_connection", lambda connection: None)
+    monkeypatch.setitem(DatabaseOperations._columns_cache, "items", ("id", "name"))
+    yield DatabaseOperations("items")
+    DatabaseOperations._by_id_cache.clear()
+    conn.close()
+
+def _count(ops):
+    return ops.execute_query("SELECT COUNT(*) AS n FROM items")[0]["n"]
+
+def test_bulk_create_inserts_every_chunk(items):
+    """Test bulk_create inserts all rows across several executemany chunks"""
+    rows = [{"name": f"item{i}"} for i in range(5)]
+
+    assert items.bulk_create(rows, chunk_size=2) == 5
+    assert _count(items) == 5
+
+def test_bulk_create_empty(items):
+    """Test bulk_create with no rows is a no-op"""
+    assert items.bulk_create([]) == 0
+    assert _count(items) == 0
+
+def test_bulk_create_rolls_back_on_error(items):
+    """Test a failing chunk rolls back the chunks already sent"""
+    rows = [{"name": "a"}, {"name": "b"}, {"name": None}]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        items.bulk_create(rows, chunk_size=2)
+    assert _count(items) == 0
+
+def test_transaction_commits(items):
+    """Test statements in a transaction are committed together"""
+    with items.transaction() as cursor:
+        cursor.execute("INSERT INTO items (name) VALUES (%s)", ("a",))
+        cursor.execute("INSERT INTO items (name) VALUES (%s)", ("b",))
+
+    assert _count(items) == 2
+
+def test_transaction_rolls_back_on_error(items):
+    """Test an exception inside the block rolls back every statement"""
+    with pytest.raises(RuntimeError):
+        with items.transaction() as cursor:
+            cursor.execute("INSERT INTO items (name) VALUES (%s)", ("a",))
+            raise RuntimeError("boom")
+
+    assert _count(items) == 0
+
+def test_get_by_id_uncached_sees_raw_writes(items):
+    """Test tables without cache_by_id read through to the database"""
+    item_id = items.create({"name": "old"})
+    assert items.get_by_id(item_id)["name"] == "old"
+
+    items.execute_query("UPDATE items SET name = %s WHERE id = %s", ("new", item_id))
+    assert items.get_by_id(item_id)["name"] == "new"
+
+def test_get_by_id_cached_invalidated_by_update(items):
+    """Test opted-in tables drop the cached row on update()"""
+    cached = DatabaseOperations("items", cache_by_id=True)
+    item_id = cached.create({"name": "old"})
+    assert cached.get_by_id(item_id)["name"] == "old"
+
+    cached.update(item_id, {"name": "new"})
+    assert cached.get_by_id(item_id)["name"] == "new"
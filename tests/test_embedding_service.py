@@ -117,4 +117,97 @@ def test_embedding_different_lengths(text_length):
     
     assert isinstance(embedding, list)
     assert len(embedding) > 0
-    assert all(isinstance(x, (int, float)) for x in embedding)
\ No newline at end of file
+    assert all(isinstance(x, (int, float)) for x in embedding)
+
+def test_int8_quantization_round_trip():
+    """Test int8 packing preserves cosine similarity within 1%"""
+    from services.embedding_service import (
+        pack_embedding, unpack_embedding, quantized_similarity
+    )
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        v1 = rng.standard_normal(384).astype(np.float32)
+        v2 = rng.standard_normal(384).astype(np.float32)
+        _, q1 = unpack_embedding(pack_embedding(v1.tolist()))
+        _, q2 = unpack_embedding(pack_embedding(v2.tolist()))
+
+        expected = calculate_similarity(v1.tolist(), v2.tolist())
+        assert abs(quantized_similarity(q1, q2) - expected) < 0.01
+
+def test_unpack_legacy_json_embedding():
+    """Test stored JSON-list embeddings are still readable"""
+    import json
+    from services.embedding_service import unpack_embedding
+    vector = _fallback_vector("legacy")
+    scale, q = unpack_embedding(json.dumps(vector))
+    assert q.dtype == np.int8
+    assert len(q) == len(vector)
+    assert scale > 0
+
+def test_unpack_legacy_hex_embedding():
+    """Test hex-encoded float32 embeddings (old resume_fit format) are still readable"""
+    from services.embedding_service import unpack_embedding
+    vector = np.asarray(_fallback_vector("legacy"), dtype=np.float32)
+    for stored in (vector.tobytes().hex(), vector.tobytes().hex().encode("ascii")):
+        scale, q = unpack_embedding(stored)
+        assert len(q) == len(vector)
+        assert abs(scale - float(np.abs(vector).max())) < 1e-6
+
+def test_embedding_cache_returns_copies():
+    """Test repeated texts are served from the cache without sharing lists"""
+    from services.embedding_service import embedding_cache_stats
+    text = "Cached embedding test"
+    first = embed_text(text)
+    size = embedding_cache_stats()["size"]
+    batch = embed_batch([text, text])
+    assert embedding_cache_stats()["size"] == size
+    assert batch[0] == first and batch[1] == first
+    batch[0][0] += 1.0
+    assert embed_text(text) == first
+
+def test_calculate_similarity_batch_matches_scalar():
+    """Test the normalized-corpus GEMV agrees with pairwise cosine"""
+    from services.embedding_service import normalize_rows, calculate_similarity_batch
+    rng = np.random.default_rng(1)
+    corpus = rng.standard_normal((8, 384)).astype(np.float32)
+    corpus[3] = 0.0
+    query = rng.standard_normal(384).astype(np.float32)
+
+    scores = calculate_similarity_batch(query, normalize_rows(corpus))
+    assert scores.shape == (8,)
+    assert scores[3] == 0.0
+    for i in (0, 5):
+        assert abs(scores[i] - calculate_similarity(query, corpus[i])) < 1e-5
+
+def test_quantized_scores_match_pairwise():
+    """Test batched int8 scoring agrees with the per-pair int8 cosine"""
+    from services.embedding_service import quantize_int8_batch, quantized_scores, quantized_similarity
+    rng = np.random.default_rng(2)
+    corpus = rng.standard_normal((6, 384)).astype(np.float32)
+    corpus[2] = 0.0
+    scales, corpus_q = quantize_int8_batch(corpus)
+    assert corpus_q.dtype == np.int8 and scales[2] == 0.0
+
+    query_q = quantize_int8_batch(rng.standard_normal((1, 384)))[1][0]
+    scores = quantized_scores(query_q, corpus_q)
+    assert scores[2] == 0.0
+    for i in (0, 4):
+        assert abs(scores[i] - quantized_similarity(query_q, corpus_q[i])) < 1e-4
+
+def test_embed_batch_np_matches_lists():
+    """Test the array variant agrees with embed_batch"""
+    from services.embedding_service import embed_batch_np
+    texts = ["Data engineer", "Frontend developer"]
+    matrix = embed_batch_np(texts)
+    assert matrix.dtype == np.float32 and matrix.flags.c_contiguous
+    assert matrix.shape[0] == len(texts)
+    assert np.allclose(matrix, np.asarray(embed_batch(texts), dtype=np.float32))
+    assert embed_batch_np([]).shape[0] == 0
+
+def test_unit_similarity_matches_cosine():
+    """Test embeddings are unit-norm so a plain dot equals cosine"""
+    from services.embedding_service import unit_similarity
+    a, b = embed_batch(["Backend engineer", "Site reliability engineer"])
+    assert abs(np.linalg.norm(a) - 1.0) < 1e-2
+    assert abs(unit_similarity(a, b) - calculate_similarity(a, b)) < 1e-2
+    assert unit_similarity([], b) == 0.0
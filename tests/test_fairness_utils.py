@@ -0,0 +1,127 @@
+"""
+Tests for fairness utility numerics against scipy/fairlearn reference results
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import numpy as np
+from scipy import stats
+
+from services.fairness_utils import (
+    compute_statistical_significance,
+    compute_pay_gap,
+    compute_temporal_trend,
+    compute_bias_metrics,
+    _ols
+)
+
+def test_statistical_significance_matches_ttest_ind():
+    """Test t statistic and p value equal scipy's Student t-test"""
+    rng = np.random.default_rng(0)
+    a = rng.normal(100_000, 5_000, 40)
+    b = rng.normal(103_000, 6_000, 55)
+    result = compute_statistical_significance(a.tolist(), b.tolist())
+    expected = stats.ttest_ind(a, b)
+
+    assert result["t_statistic"] == pytest.approx(expected.statistic, rel=1e-9)
+    assert result["p_value"] == pytest.approx(expected.pvalue, rel=1e-9)
+
+def test_statistical_significance_large_values():
+    """Test variance stays accurate for values around 1e8"""
+    a = np.array([1e8 + 1, 1e8 + 2, 1e8 + 3, 1e8 + 4])
+    b = np.array([1e8 + 2, 1e8 + 4, 1e8 + 5, 1e8 + 6])
+    result = compute_statistical_significance(a.tolist(), b.tolist())
+
+    assert result["t_statistic"] == pytest.approx(stats.ttest_ind(a, b).statistic, rel=1e-9)
+
+def test_pay_gap_significance_matches_ttest_ind():
+    """Test the batched per-group t-tests equal one scipy call per group"""
+    rng = np.random.default_rng(1)
+    groups = ["a"] * 50 + ["b"] * 30 + ["c"] * 20
+    salaries = np.concatenate([
+        rng.normal(90_000, 8_000, 50),
+        rng.normal(85_000, 7_000, 30),
+        rng.normal(95_000, 9_000, 20)
+    ])
+    result = compute_pay_gap(salaries.tolist(), groups)
+
+    assert result["reference_group"] == "a"
+    ref = salaries[:50]
+    for group, sal in (("b", salaries[50:80]), ("c", salaries[80:])):
+        expected = stats.ttest_ind(ref, sal)
+        sig = result["gaps"][group]["statistical_significance"]
+        assert sig["t_statistic"] == pytest.approx(expected.statistic, rel=1e-9)
+        assert sig["p_value"] == pytest.approx(expected.pvalue, rel=1e-9)
+
+def test_ols_matches_linregress():
+    """Test closed-form OLS equals scipy's linregress"""
+    rng = np.random.default_rng(2)
+    x = np.arange(30, dtype=np.float64)
+    y = 3.0 * x + rng.normal(0, 4, 30)
+    slope, intercept, r2 = _ols(x, y)
+    expected = stats.linregress(x, y)
+
+    assert slope == pytest.approx(expected.slope, rel=1e-9)
+    assert intercept == pytest.approx(expected.intercept, rel=1e-9)
+    assert r2 == pytest.approx(expected.rvalue ** 2, rel=1e-9)
+
+def test_temporal_trend_single_point():
+    """Test r2 is undefined (nan) for a single observation"""
+    result = compute_temporal_trend([50_000.0], [datetime(2024, 1, 1)])
+
+    assert np.isnan(result["r2"])
+    assert result["significant"] is False
+
+def test_temporal_trend_constant_values():
+    """Test constant values fit perfectly with zero slope"""
+    start = datetime(2024, 1, 1)
+    result = compute_temporal_trend([1.0] * 5, [start + timedelta(days=i) for i in range(5)])
+
+    assert result["slope"] == 0.0
+    assert result["r2"] == 1.0
+
+def test_bias_metrics_match_fairlearn():
+    """Test rates and parity metrics equal fairlearn's definitions"""
+    fairlearn_metrics = pytest.importorskip("fairlearn.metrics")
+    rng = np.random.default_rng(3)
+    y_true = rng.integers(0, 2, 200)
+    y_pred = rng.integers(0, 2, 200)
+    gender = rng.choice(["f", "m"], 200)
+    region = rng.choice(["north", "south", "east"], 200)
+
+    results = compute_bias_metrics(y_true, y_pred, {"gender": gender, "region": region})
+
+    for name, feature in (("gender", gender), ("region", region)):
+        overall = results[name]["overall"]
+        assert overall["demographic_parity"] == pytest.approx(
+            fairlearn_metrics.demographic_parity_difference(y_true, y_pred, sensitive_features=feature)
+        )
+        assert overall["equalized_odds"] == pytest.approx(
+            fairlearn_metrics.equalized_odds_difference(y_true, y_pred, sensitive_features=feature)
+        )
+        mf = fairlearn_metrics.MetricFrame(
+            metrics={
+                "selection_rate": fairlearn_metrics.selection_rate,
+                "true_positive_rate": fairlearn_metrics.true_positive_rate,
+                "false_positive_rate": fairlearn_metrics.false_positive_rate
+            },
+            y_true=y_true,
+            y_pred=y_pred,
+            sensitive_features=feature
+        )
+        for metric in ("selection_rate", "true_positive_rate", "false_positive_rate"):
+            by_group = results[name]["by_group"][metric]
+            for group, value in mf.by_group[metric].items():
+                assert by_group[group] == pytest.approx(value)
+
+def test_bias_metrics_intersection_observed_groups_only():
+    """Test pairwise views report only combinations present in the data"""
+    pytest.importorskip("fairlearn")
+    y_true = [1, 0, 1, 0, 1, 1]
+    y_pred = [1, 0, 0, 0, 1, 1]
+    results = compute_bias_metrics(y_true, y_pred, {
+        "gender": ["f", "f", "m", "m", "f", "m"],
+        "dept": ["hr", "hr", "it", "it", "hr", "it"]
+    })
+
+    assert set(results["gender_x_dept"]["by_group"]["selection_rate"]) == {"f_hr", "m_it"}
@@ -0,0 +1,47 @@
+"""
+Tests for the in-memory job skill index
+"""
+import pytest
+from services.job_index import JobSkillIndex
+
+@pytest.fixture
+def index():
+    return JobSkillIndex([
+        {"id": 1, "title": "Backend", "required_skills": '["Python", "SQL", "Docker"]'},
+        {"id": 2, "title": "Frontend", "required_skills": "React, CSS"},
+        {"id": 3, "title": "Data", "required_skills": ["Python", "SQL"]},
+    ])
+
+def test_top_k_ranks_by_skill_overlap(index):
+    """Test the closest skill set ranks first and scores are descending"""
+    matches = index.top_k(["python", "sql"], limit=3)
+
+    assert [m["job_id"] for m in matches][:2] == [3, 1]
+    assert matches[0]["match_score"] == pytest.approx(1.0)
+    scores = [m["match_score"] for m in matches]
+    assert scores == sorted(scores, reverse=True)
+
+def test_top_k_matching_and_missing_skills(index):
+    """Test matched and missing skills are decoded per job"""
+    backend = next(m for m in index.top_k(["Python", "SQL"], limit=3) if m["job_id"] == 1)
+
+    assert {s.lower() for s in backend["matching_skills"]} == {"python", "sql"}
+    assert {s.lower() for s in backend["missing_skills"]} == {"docker"}
+
+def test_top_k_limit(index):
+    """Test limit truncates after ranking"""
+    matches = index.top_k(["python", "sql"], limit=1)
+
+    assert len(matches) == 1
+    assert matches[0]["job_id"] == 3
+    assert index.top_k(["python"], limit=0) == []
+
+def test_top_k_min_score(index):
+    """Test jobs below min_score are dropped"""
+    matches = index.top_k(["react", "css"], limit=3, min_score=0.5)
+
+    assert [m["job_id"] for m in matches] == [2]
+
+def test_top_k_empty_index():
+    """Test an index with no jobs returns no matches"""
+    assert JobSkillIndex([]).top_k(["python"], limit=5) == []
@@ -0,0 +1,57 @@
+"""
+Tests for the vLLM client's prompt micro-batcher
+"""
+import asyncio
+
+import pytest
+from services import vllm_client
+
+def _gather(batcher, requests):
+    async def run():
+        return await asyncio.gather(
+            *(batcher.submit(prompt, max_tokens, 0.0) for prompt, max_tokens in requests),
+            return_exceptions=True
+        )
+    return asyncio.run(run())
+
+def test_batcher_returns_each_prompts_result(monkeypatch):
+    """Test concurrent prompts are batched and matched back by position"""
+    calls = []
+
+    async def fake_complete(prompts, max_tokens, temperature):
+        calls.append((list(prompts), max_tokens))
+        return [p.upper() for p in prompts]
+
+    monkeypatch.setattr(vllm_client, "_complete_batch", fake_complete)
+    results = _gather(vllm_client.PromptBatcher(window=0.05), [("a", 16), ("b", 16), ("c", 32)])
+
+    assert results == ["A", "B", "C"]
+    # Prompts with different sampling parameters go in separate batches
+    assert sorted(calls) == [(["a", "b"], 16), (["c"], 32)]
+
+def test_batcher_propagates_backend_error(monkeypatch):
+    """Test a failed batch fails every waiting prompt, and only that batch"""
+    async def fake_complete(prompts, max_tokens, temperature):
+        if max_tokens == 16:
+            raise RuntimeError("backend down")
+        return list(prompts)
+
+    monkeypatch.setattr(vllm_client, "_complete_batch", fake_complete)
+    results = _gather(vllm_client.PromptBatcher(window=0.05), [("a", 16), ("b", 16), ("c", 32)])
+
+    assert all(isinstance(r, RuntimeError) for r in results[:2])
+    assert results[2] == "c"
+
+def test_generate_text_bypasses_batcher_without_endpoint(monkeypatch):
+    """Test prompts go straight to llm_utils when VLLM_ENDPOINT is unset"""
+    async def fake_generate(prompt, max_tokens, temperature):
+        return f"local:{prompt}"
+
+    async def no_batching(*args):
+        raise AssertionError("batcher used without VLLM_ENDPOINT")
+
+    monkeypatch.setattr(vllm_client, "VLLM_ENDPOINT", None)
+    monkeypatch.setattr(vllm_client.llm_utils, "generate", fake_generate)
+    monkeypatch.setattr(vllm_client._batcher, "submit", no_batching)
+
+    assert asyncio.run(vllm_client.generate_text("hi")) == "local:hi"